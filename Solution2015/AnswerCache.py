@@ -0,0 +1,226 @@
+from ReadFile import ReadFile
+from atexit import register
+from hashlib import sha256
+from inspect import getsource
+from json import dumps, loads
+from os import getpid, path, replace
+from sys import modules
+from threading import Lock
+from time import time
+from types import ModuleType
+
+class AnswerCache():
+    """
+    Class used to store the solutions already computed on the disk, so that they are not computed again.
+    A solution is found in the cache only if the input file, the source code of the day and the source code of the modules
+    imported by the solutions (parsers, records...) are the same as when it was computed.
+    The solutions stored are written on the disk by flush, which is called when the process exits.
+    """
+
+    CACHE_FILE: str = "answerCache.json"        # Name of the file containing the cache, in the current directory.
+    MAX_SIZE_IN_BYTES: int = 1024 * 1024        # Size above which the least recently used solutions are removed from the cache.
+
+    _entries: dict[str, dict[str, int | str | float]] | None = None        # Content of the cache, loaded on the first request.
+    _lockOfEntries: Lock = Lock()                                           # Lock protecting the entries when solutions are computed by several threads.
+    _digestsOfDependencies: dict[type, str] = {}                            # Digest of the modules imported by each class of solutions, computed once.
+    _digestsOfDays: dict[tuple[type, int], str] = {}                        # Digest of the source code used by each day of each class, computed once.
+    _isModified: bool = False                                               # States if solutions were stored since the cache was last written.
+    _processOfFlush: int | None = None                                      # Process in which flush is called at exit.
+
+    @staticmethod
+    def _getPathOfCache() -> str:
+        """
+        Function used to get the path of the cache file.
+
+        Returns:
+            String representing the path of the cache file.
+        """
+        return path.join(ReadFile.CURRENT_PATH, AnswerCache.CACHE_FILE)
+
+    @staticmethod
+    def _readEntries() -> dict[str, dict[str, int | str | float]]:
+        """
+        Function used to read the entries stored in the cache file.
+
+        Returns:
+            The entries of the cache file, or an empty dict if the file does not exist or can't be read.
+        """
+        try:
+            with open(AnswerCache._getPathOfCache(), 'r') as file:
+                return loads(file.read())
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def _getDigestOfDependencies(solutionClass: type) -> str:
+        """
+        Function used to compute a digest of the source code of the modules of the project imported by the module of the solutions,
+        directly or through another module of the project. The module of the solutions itself is not included, its methods are hashed by day.
+
+        Args:
+            solutionClass (type): Class containing the methods of the solutions.
+
+        Returns:
+            String representing the digest of the modules.
+        """
+        moduleOfSolutions: ModuleType = modules[solutionClass.__module__]       # Module containing the class of the solutions.
+        directory: str = path.dirname(path.abspath(moduleOfSolutions.__file__))  # Directory of the modules of the project.
+        dependencies: dict[str, ModuleType] = {}                                # Modules of the project found so far, indexed by their name.
+        modulesToVisit: list[ModuleType] = [moduleOfSolutions]                  # Modules whose imports are not looked at yet.
+        sourceDigest = sha256()                                                 # Digest of the source code of the modules.
+
+        with AnswerCache._lockOfEntries:
+            if solutionClass in AnswerCache._digestsOfDependencies:
+                return AnswerCache._digestsOfDependencies[solutionClass]
+
+        # Follow the modules, classes and functions imported by each module, and keep those defined in the directory of the project.
+        while modulesToVisit:
+            for value in vars(modulesToVisit.pop()).values():
+                module: ModuleType | None = value if isinstance(value, ModuleType) else modules.get(getattr(value, "__module__", None) or "")
+                if (module is not None and module is not moduleOfSolutions and module.__name__ not in dependencies
+                        and getattr(module, "__file__", None) is not None and directory == path.dirname(path.abspath(module.__file__))):
+                    dependencies[module.__name__] = module
+                    modulesToVisit.append(module)
+
+        # Hash the source of the modules, in a stable order.
+        for nameOfModule in sorted(dependencies):
+            with open(dependencies[nameOfModule].__file__, 'rb') as file:
+                sourceDigest.update(nameOfModule.encode() + b"\0" + file.read())
+
+        with AnswerCache._lockOfEntries:
+            AnswerCache._digestsOfDependencies[solutionClass] = sourceDigest.hexdigest()
+
+        return sourceDigest.hexdigest()
+
+    @staticmethod
+    def _getDigestOfDay(solutionClass: type, day: int) -> str:
+        """
+        Function used to compute a digest of the source code of every method of a day (parts and helpers), and of the modules
+        imported by the solutions. The source code is read once per class and day.
+
+        Args:
+            solutionClass (type): Class containing the methods of the solutions.
+            day (int): Day of the solution.
+
+        Returns:
+            String representing the digest of the source code.
+        """
+        prefixOfMethods: str = f"_day_{day:02d}_"               # Prefix shared by every method of the day.
+        sourceDigest = sha256()                                 # Digest of the source code of the methods of the day.
+
+        with AnswerCache._lockOfEntries:
+            if (solutionClass, day) in AnswerCache._digestsOfDays:
+                return AnswerCache._digestsOfDays[(solutionClass, day)]
+
+        # Hash the source of every method of the day (parts and helpers), in a stable order.
+        for nameOfMethod in sorted(vars(solutionClass)):
+            if nameOfMethod.startswith(prefixOfMethods) and callable(getattr(solutionClass, nameOfMethod)):
+                sourceDigest.update(getsource(getattr(solutionClass, nameOfMethod)).encode())
+
+        # The parsers and records used by the day are in other modules.
+        sourceDigest.update(AnswerCache._getDigestOfDependencies(solutionClass).encode())
+
+        with AnswerCache._lockOfEntries:
+            AnswerCache._digestsOfDays[(solutionClass, day)] = sourceDigest.hexdigest()
+
+        return sourceDigest.hexdigest()
+
+    @staticmethod
+    def getKey(solutionClass: type, day: int, isFirstPart: bool) -> str:
+        """
+        Function used to compute the key of a solution in the cache. The key changes as soon as the input file,
+        the source code of any method of the day, or the source code of a module imported by the solutions changes.
+        Only the input is hashed on each call, the source code is hashed once per process.
+
+        Args:
+            solutionClass (type): Class containing the methods of the solutions.
+            day (int): Day of the solution.
+            isFirstPart (bool): Boolean indicating whether it is part 1 or part 2.
+
+        Returns:
+            String representing the key of the solution.
+        """
+        return (f"{day:02d}-{'1' if isFirstPart else '2'}-{sha256(ReadFile.getMemoryView(day)).hexdigest()}"
+                f"-{AnswerCache._getDigestOfDay(solutionClass, day)}")
+
+    @staticmethod
+    def get(key: str) -> int | str | None:
+        """
+        Function used to retrieve a solution from the cache.
+
+        Args:
+            key (str): Key of the solution, computed by getKey.
+
+        Returns:
+            The solution if it is in the cache, None otherwise.
+        """
+        with AnswerCache._lockOfEntries:
+            # Load the cache on the first request only.
+            if AnswerCache._entries is None:
+                AnswerCache._entries = AnswerCache._readEntries()
+
+            if key not in AnswerCache._entries:
+                return None
+
+            # Remember the solution was used, so that it is not the first one to be removed.
+            AnswerCache._entries[key]["lastUsed"] = time()
+            return AnswerCache._entries[key]["solution"]
+
+    @staticmethod
+    def store(key: str, solution: int | str) -> None:
+        """
+        Function used to add a solution to the cache. The cache is written on the disk by flush, so that a run computing
+        several solutions writes it once.
+
+        Args:
+            key (str): Key of the solution, computed by getKey.
+            solution (int | str): Solution to store.
+        """
+        with AnswerCache._lockOfEntries:
+            if AnswerCache._entries is None:
+                AnswerCache._entries = AnswerCache._readEntries()
+            AnswerCache._entries[key] = {"solution": solution, "lastUsed": time()}
+            AnswerCache._isModified = True
+
+            # Write the cache when this process exits. The processes started by multiprocessing do not call the atexit functions,
+            # but its finalizers, and do not inherit those of their parent.
+            if getpid() != AnswerCache._processOfFlush:
+                AnswerCache._processOfFlush = getpid()
+                if "multiprocessing" in modules:
+                    from multiprocessing.util import Finalize
+                    Finalize(None, AnswerCache.flush, exitpriority=0)
+                else:
+                    register(AnswerCache.flush)
+
+    @staticmethod
+    def flush() -> None:
+        """
+        Function used to write the solutions stored since the last write on the disk. If the cache is bigger
+        than MAX_SIZE_IN_BYTES, the least recently used solutions are removed.
+        """
+        pathOfCache: str = AnswerCache._getPathOfCache()                     # Path of the cache file.
+        entries: dict[str, dict[str, int | str | float]]                     # Entries written on the disk.
+        sizeOfCache: int                                                     # Size of the serialized cache, in bytes.
+
+        with AnswerCache._lockOfEntries:
+            if not AnswerCache._isModified:
+                return
+
+            # Start from the file to keep the solutions written by other processes since it was loaded.
+            entries = AnswerCache._readEntries()
+            entries.update(AnswerCache._entries)
+
+            # Remove the least recently used solutions while the cache is too big.
+            sizeOfCache = len(dumps(entries))
+            for oldKey in sorted(entries, key=lambda entryKey: entries[entryKey]["lastUsed"]):
+                if sizeOfCache <= AnswerCache.MAX_SIZE_IN_BYTES:
+                    break
+                sizeOfCache -= len(dumps({oldKey: entries.pop(oldKey)}))
+
+            # Write in a temporary file first, so that a reader never sees a partially written cache.
+            with open(f"{pathOfCache}.{getpid()}.tmp", 'w') as file:
+                file.write(dumps(entries))
+            replace(f"{pathOfCache}.{getpid()}.tmp", pathOfCache)
+
+            AnswerCache._entries = entries
+            AnswerCache._isModified = False
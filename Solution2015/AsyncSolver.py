@@ -0,0 +1,120 @@
+from Year2015_Solution import Year2015_Solution
+from LimitExceeded import LimitExceeded
+from asyncio import AbstractEventLoop, CancelledError, Future, get_running_loop, shield
+from atexit import register, unregister
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import partial
+
+class AsyncSolver():
+    """
+    Class used to compute the solutions of 2015 from asyncio code, without blocking the event loop.
+    The solutions are computed in an executor (a pool of processes by default), and identical requests made while
+    a solution is being computed wait for the same computation instead of starting a new one.
+    """
+
+    _executor: Executor | None = None                                                       # Executor computing the solutions, created on the first request.
+    _isExecutorCreated: bool = False                                                        # States if the executor was created by this class, which shuts it down.
+    _computations: dict[tuple[AbstractEventLoop, int, bool, bool, float | None], Future] = {}   # Computations in progress, indexed by loop and request.
+    _numberOfWaiters: dict[tuple[AbstractEventLoop, int, bool, bool, float | None], int] = {}   # Number of requests waiting for each computation.
+
+    @staticmethod
+    def setExecutor(executor: Executor | None) -> None:
+        """
+        Function used to choose the executor computing the solutions. The executor given is not shut down by this class,
+        but the executor it created before is.
+
+        Args:
+            executor (Executor | None): Executor to use, a ProcessPoolExecutor or a ThreadPoolExecutor for example.
+                If None, a ProcessPoolExecutor with one process per CPU is created on the next request.
+        """
+        AsyncSolver.shutdown()
+        AsyncSolver._executor = executor
+
+    @staticmethod
+    def getExecutor() -> Executor:
+        """
+        Function used to get the executor computing the solutions, which is created on the first call if none was chosen.
+        A pool of processes is used by default, as the solutions are CPU-bound and would keep the GIL in threads.
+        This pool is shut down by shutdown, or when the interpreter exits.
+
+        Returns:
+            The executor computing the solutions.
+        """
+        if AsyncSolver._executor is None:
+            AsyncSolver._executor = ProcessPoolExecutor()
+            AsyncSolver._isExecutorCreated = True
+            register(AsyncSolver.shutdown)
+
+        return AsyncSolver._executor
+
+    @staticmethod
+    def shutdown(wait: bool = True) -> None:
+        """
+        Function used to shut down the pool of processes created by getExecutor, if any. The next request creates a new one.
+        An executor chosen with setExecutor is not shut down.
+
+        Args:
+            wait (bool): Boolean indicating whether the computations in progress are waited for.
+        """
+        if AsyncSolver._isExecutorCreated:
+            unregister(AsyncSolver.shutdown)
+            AsyncSolver._executor.shutdown(wait=wait, cancel_futures=not wait)
+            AsyncSolver._executor = None
+            AsyncSolver._isExecutorCreated = False
+
+    @staticmethod
+    async def solve(day: int, isFirstPart: bool, isCacheUsed: bool = True, timeout: float | None = None) -> int | str | LimitExceeded:
+        """
+        Function used to compute a solution in the executor, and to wait for it without blocking the event loop.
+        If the same solution is already being computed for another request, its computation is shared.
+
+        Cancelling the request stops the waiting. The computation is cancelled when no request waits for it anymore:
+        it is dropped if it has not started yet, and otherwise it ends in the executor but its solution is not used.
+        Give a timeout to stop a computation that has started (see Year2015_Solution.getSolution).
+
+        Args:
+            day (int): Day for which we want to retrieve the solution.
+            isFirstPart (bool): Boolean indicating whether we want to retrieve the solution for part 1 or part 2.
+            isCacheUsed (bool): Boolean indicating whether the solutions already computed and stored on the disk can be used.
+            timeout (float | None): If given, the solution is stopped after timeout seconds, and a LimitExceeded is returned instead.
+
+        Returns:
+            The solution of the day and part.
+        """
+        loop: AbstractEventLoop = get_running_loop()                                # Loop running the request.
+        key: tuple[AbstractEventLoop, int, bool, bool, float | None] = (loop, day, isFirstPart, isCacheUsed, timeout)   # Key of the request.
+        computation: Future                                                         # Computation of the solution in the executor.
+
+        # Start the computation only if no identical request is waiting for it already.
+        if key not in AsyncSolver._computations:
+            computation = loop.run_in_executor(AsyncSolver.getExecutor(), partial(Year2015_Solution.getSolution, day, isFirstPart, isCacheUsed=isCacheUsed, timeout=timeout))
+            AsyncSolver._computations[key] = computation
+            AsyncSolver._numberOfWaiters[key] = 0
+            computation.add_done_callback(lambda _: AsyncSolver._forget(key, computation))
+
+        computation = AsyncSolver._computations[key]
+        AsyncSolver._numberOfWaiters[key] += 1
+
+        # The computation is shielded, so that cancelling one request does not cancel the others.
+        try:
+            return await shield(computation)
+        except CancelledError:
+            if not computation.done() and 0 == AsyncSolver._numberOfWaiters[key] - 1:
+                computation.cancel()
+            raise
+        finally:
+            if AsyncSolver._computations.get(key) is computation:
+                AsyncSolver._numberOfWaiters[key] -= 1
+
+    @staticmethod
+    def _forget(key: tuple[AbstractEventLoop, int, bool, bool, float | None], computation: Future) -> None:
+        """
+        Function called when a computation ends (or is cancelled), so that the next identical request starts a new one.
+
+        Args:
+            key (tuple[AbstractEventLoop, int, bool, bool, float | None]): Key of the request.
+            computation (Future): Computation that ended.
+        """
+        if AsyncSolver._computations.get(key) is computation:
+            del AsyncSolver._computations[key]
+            del AsyncSolver._numberOfWaiters[key]
@@ -0,0 +1,42 @@
+from typing import Iterator
+
+class AuntSue():
+    """
+    Class representing an Aunt Sue of day 16, with the number of each thing the MFCSAM can detect (None when it is not known).
+    """
+
+    THINGS: tuple[str, ...] = ("children", "cats", "samoyeds", "pomeranians", "akitas",
+                               "vizslas", "goldfish", "trees", "cars", "perfumes")      # Things the MFCSAM can detect.
+
+    __slots__ = THINGS
+
+    def __init__(self, **things: int) -> None:
+        """
+        Create an Aunt Sue.
+
+        Args:
+            things (int): Number of each thing known about the Sue, for example cats=7. The other things are unknown.
+
+        Raises:
+            TypeError: If a thing cannot be detected by the MFCSAM.
+        """
+        for thing in AuntSue.THINGS:
+            setattr(self, thing, things.pop(thing, None))
+
+        if things:
+            raise TypeError(f"Unknown things for an Aunt Sue: {', '.join(things)}.")
+
+    def items(self) -> Iterator[tuple[str, int]]:
+        """
+        Function used to iterate over the things known about the Sue.
+
+        Returns:
+            An iterator over the pairs (thing, number of this thing), for the things whose number is known.
+        """
+        for thing in AuntSue.THINGS:
+            value: int | None = getattr(self, thing)
+            if value is not None:
+                yield (thing, value)
+
+    def __repr__(self) -> str:
+        return f"AuntSue({', '.join(f'{thing}={value}' for thing, value in self.items())})"
@@ -0,0 +1,130 @@
+from ReadFile import ReadFile
+from Year2015_Solution import Year2015_Solution
+from argparse import ArgumentParser, Namespace
+from csv import DictWriter
+from json import dumps
+from os import cpu_count, listdir, path
+from pathlib import Path
+from sys import stdout
+from time import perf_counter
+from typing import TextIO
+
+class BatchSolver():
+    """
+    Class used to solve many inputs of the 2015 problems in one run. The inputs of a day are the ".txt" files of
+    a subdirectory named after the day (for example "inputs/07/first.txt", "inputs/07/second.txt"...).
+    The inputs are spread over a pool of processes that are started once, instead of starting one process per input.
+    """
+
+    FIELDS: list[str] = ["day", "input", "part1", "part2", "time"]       # Fields of each result, in the order of the CSV columns.
+
+    @staticmethod
+    def findInputs(directory: str, days: range | list[int] = range(1, 26)) -> list[tuple[int, str]]:
+        """
+        Function used to find the inputs of the given days in a directory.
+
+        Args:
+            directory (str): Directory containing one subdirectory per day, named with two digits ("01", "02"...).
+            days (range | list[int]): Days for which the inputs are searched.
+
+        Returns:
+            A list of tuples (day, path of the input), sorted by day then by name of file.
+        """
+        inputs: list[tuple[int, str]] = []      # Inputs found.
+        directoryOfDay: str                     # Directory containing the inputs of the current day.
+
+        for day in days:
+            directoryOfDay = path.join(directory, f"{day:02d}")
+            if path.isdir(directoryOfDay):
+                inputs.extend((day, path.join(directoryOfDay, name)) for name in sorted(listdir(directoryOfDay)) if name.endswith(".txt"))
+
+        return inputs
+
+    @staticmethod
+    def solveInput(day: int, pathOfInput: str, isCacheUsed: bool = False) -> dict[str, int | str | float]:
+        """
+        Function used to solve both parts of one input.
+
+        Args:
+            day (int): Day of the input.
+            pathOfInput (str): Path of the input file.
+            isCacheUsed (bool): Boolean indicating whether the solutions already computed and stored on the disk can be used.
+
+        Returns:
+            A dict containing the day, the path of the input, the solution of each part and the time taken in seconds.
+        """
+        startTime: float = perf_counter()               # Time at which the input started to be solved.
+        solutions: tuple[int | str, int | str]          # Solutions of both parts.
+
+        with ReadFile.useInputSource(day, Path(pathOfInput)):
+            solutions = Year2015_Solution.getSolutions(day, isCacheUsed)
+
+            # Each input is solved once, so it is not kept in memory.
+            ReadFile.invalidateCache(day)
+
+        return {"day": day, "input": pathOfInput, "part1": solutions[0], "part2": solutions[1], "time": perf_counter() - startTime}
+
+    @staticmethod
+    def solveAll(inputs: list[tuple[int, str]], numberOfWorkers: int = 1, isCacheUsed: bool = False) -> list[dict[str, int | str | float]]:
+        """
+        Function used to solve a list of inputs, one after another or spread over a pool of processes.
+
+        Args:
+            inputs (list[tuple[int, str]]): Day and path of each input.
+            numberOfWorkers (int): Number of processes used. With 1 or less, the inputs are solved in the current process.
+            isCacheUsed (bool): Boolean indicating whether the solutions already computed and stored on the disk can be used.
+                Inputs of a batch are usually solved once, so the cache is not used by default.
+
+        Returns:
+            The results of each input (see solveInput), in the order of the inputs.
+        """
+        # Without multiple workers, there is no need to start a pool of processes.
+        if 1 >= numberOfWorkers:
+            return [BatchSolver.solveInput(day, pathOfInput, isCacheUsed) for day, pathOfInput in inputs]
+
+        # The pool is imported only when it is used, as multiprocessing is long to import.
+        from concurrent.futures import ProcessPoolExecutor
+
+        # Send the inputs by chunks, so that each worker gets several inputs per message.
+        with ProcessPoolExecutor(max_workers=numberOfWorkers) as executor:
+            return list(executor.map(BatchSolver.solveInput, [day for day, _ in inputs], [pathOfInput for _, pathOfInput in inputs],
+                                     [isCacheUsed] * len(inputs), chunksize=max(1, len(inputs) // (4 * numberOfWorkers))))
+
+    @staticmethod
+    def writeResults(results: list[dict[str, int | str | float]], file: TextIO, format: str) -> None:
+        """
+        Function used to write the results of a batch.
+
+        Args:
+            results (list[dict[str, int | str | float]]): Results of each input.
+            file (TextIO): File where the results are written.
+            format (str): "csv" for one line per input, or "json" for a list of objects.
+        """
+        writer: DictWriter        # Writer of the CSV lines.
+
+        if "json" == format:
+            file.write(dumps(results, indent=4) + "\n")
+            return
+
+        writer = DictWriter(file, fieldnames=BatchSolver.FIELDS)
+        writer.writeheader()
+        writer.writerows(results)
+
+if __name__ == "__main__":
+    parser: ArgumentParser = ArgumentParser(description="Solve a directory of inputs of the Advent Of Code 2015.")
+    parser.add_argument("directory", help="Directory containing one subdirectory of inputs per day (01, 02...).")
+    parser.add_argument("-d", "--day", type=int, nargs="+", default=list(range(1, 26)), help="Days to solve (all by default).")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="Number of processes used to solve the inputs (0: one per CPU).")
+    parser.add_argument("-f", "--format", choices=["csv", "json"], default="csv", help="Format of the results.")
+    parser.add_argument("-o", "--output", help="File where the results are written (standard output by default).")
+    parser.add_argument("--cache", action="store_true", help="Use and fill the cache of the solutions stored on the disk.")
+    arguments: Namespace = parser.parse_args()
+
+    results: list[dict[str, int | str | float]] = BatchSolver.solveAll(BatchSolver.findInputs(arguments.directory, arguments.day),
+                                                                       arguments.jobs if 0 != arguments.jobs else cpu_count(), arguments.cache)
+
+    if arguments.output is None:
+        BatchSolver.writeResults(results, stdout, arguments.format)
+    else:
+        with open(arguments.output, 'w', newline="") as file:
+            BatchSolver.writeResults(results, file, arguments.format)
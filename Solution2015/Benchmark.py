@@ -0,0 +1,286 @@
+from SearchContext import SearchContext
+from Year2015_Solution import Year2015_Solution
+from argparse import ArgumentParser, Namespace
+from datetime import datetime
+from json import dump, load
+from math import ceil
+from os import path
+from statistics import median
+from subprocess import run
+from sys import executable, exit
+from time import perf_counter
+
+class Benchmark():
+    """
+    Class used to measure the time taken by the solutions of 2015, to keep an history of the measures and to detect regressions.
+    """
+
+    HISTORY_FILE: str = "benchmarkHistory.json"         # Default file where every benchmark run is appended.
+    BASELINE_FILE: str = "benchmarkBaseline.json"       # Default file containing the timings used as reference.
+    NUMBER_OF_SLOW_IMPORTS: int = 15                    # Number of modules displayed in the report of the import time.
+
+    @staticmethod
+    def isSolutionDeveloped(day: int, isFirstPart: bool) -> bool:
+        """
+        Function used to know if the solution of a given day / part exists.
+
+        Args:
+            day (int): Day of the solution.
+            isFirstPart (bool): Boolean indicating whether we look at part 1 or part 2.
+
+        Returns:
+            True if the solution is developed, False otherwise.
+        """
+        return hasattr(Year2015_Solution, f"_day_{day:02d}_Part_{'1' if isFirstPart else '2'}")
+
+    @staticmethod
+    def measureSolution(day: int, isFirstPart: bool, numberOfWarmups: int, numberOfRepetitions: int, isMemoryMeasured: bool = False,
+                        isSearchEffortCounted: bool = False) -> dict[str, int | str | float]:
+        """
+        Function used to measure the time taken by one solution. The solution is computed numberOfWarmups times without
+        being measured (inputs are read and cached during those runs), then numberOfRepetitions times while being measured.
+        The solutions stored on the disk are never used, every run computes the solution.
+
+        Args:
+            day (int): Day of the solution to measure.
+            isFirstPart (bool): Boolean indicating whether we measure part 1 or part 2.
+            numberOfWarmups (int): Number of runs done before measuring.
+            numberOfRepetitions (int): Number of measured runs. Should be at least 1.
+            isMemoryMeasured (bool): Boolean indicating whether the peak memory is measured too, during one more run.
+            isSearchEffortCounted (bool): Boolean indicating whether the effort of the searches of the solution is counted too, during one more run.
+
+        Returns:
+            A dict containing the solution and the min, median and 95th percentile of the timings, in seconds.
+            If the memory is measured, it also contains the peak memory in bytes ("peakMemory").
+            If the effort is counted and the solution uses a search, it also contains each counter of SearchContext.COUNTERS.
+        """
+        timings: list[float] = []       # Wall time of each measured run.
+        solution: int | str = ""        # Solution returned by the last run.
+        startTime: float                # Time at which the current run started.
+
+        # Warm up the solution.
+        for _ in range(numberOfWarmups):
+            Year2015_Solution.getSolution(day, isFirstPart, isCacheUsed=False)
+
+        # Measure each repetition.
+        for _ in range(max(1, numberOfRepetitions)):
+            startTime = perf_counter()
+            solution = Year2015_Solution.getSolution(day, isFirstPart, isCacheUsed=False)
+            timings.append(perf_counter() - startTime)
+
+        # Sort the timings to compute the percentile with the nearest-rank method.
+        timings.sort()
+        measures: dict[str, int | str | float] = {"solution": solution,
+                                                  "min": timings[0],
+                                                  "median": median(timings),
+                                                  "p95": timings[ceil(0.95 * len(timings)) - 1]}
+
+        # The memory is measured in a separate run, as tracing the allocations slows the solution down.
+        if isMemoryMeasured:
+            from MemoryTracer import MemoryTracer
+            measures["peakMemory"] = MemoryTracer.measureCall(lambda: Year2015_Solution.getSolution(day, isFirstPart, isCacheUsed=False))[1]["peak"]
+
+        # The effort is counted in a separate run too, so that the counters do not slow the measured runs down.
+        if isSearchEffortCounted:
+            with SearchContext.countEffort() as searchEffort:
+                Year2015_Solution.getSolution(day, isFirstPart, isCacheUsed=False)
+            if any(searchEffort.values()):
+                measures.update(searchEffort)
+
+        return measures
+
+    @staticmethod
+    def runAll(days: range | list[int], numberOfWarmups: int, numberOfRepetitions: int, isMemoryMeasured: bool = False,
+               isSearchEffortCounted: bool = False) -> dict[str, dict[str, int | str | float]]:
+        """
+        Function used to measure every developed solution of the given days.
+
+        Args:
+            days (range | list[int]): Days to measure.
+            numberOfWarmups (int): Number of runs done before measuring each solution.
+            numberOfRepetitions (int): Number of measured runs for each solution.
+            isMemoryMeasured (bool): Boolean indicating whether the peak memory of each solution is measured too.
+            isSearchEffortCounted (bool): Boolean indicating whether the effort of the searches of each solution is counted too.
+
+        Returns:
+            A dict indexed by "day_XX_part_Y" containing the measures of each solution.
+        """
+        results: dict[str, dict[str, int | str | float]] = {}      # Measures of each solution.
+
+        for day in days:
+            for isFirstPart in (True, False):
+                if Benchmark.isSolutionDeveloped(day, isFirstPart):
+                    results[f"day_{day:02d}_part_{'1' if isFirstPart else '2'}"] = Benchmark.measureSolution(day, isFirstPart, numberOfWarmups, numberOfRepetitions,
+                                                                                                             isMemoryMeasured, isSearchEffortCounted)
+
+        return results
+
+    @staticmethod
+    def appendToHistory(results: dict[str, dict[str, int | str | float]], historyFile: str, numberOfRepetitions: int) -> None:
+        """
+        Function used to add the results of a benchmark run at the end of the history file.
+
+        Args:
+            results (dict[str, dict[str, int | str | float]]): Measures of each solution.
+            historyFile (str): Path of the JSON file containing all previous runs.
+            numberOfRepetitions (int): Number of measured runs used for each solution.
+        """
+        history: list[dict] = []        # All runs recorded in the history file.
+
+        # Retrieve the previous runs if the history already exists.
+        if path.isfile(historyFile):
+            with open(historyFile, 'r') as file:
+                history = load(file)
+
+        history.append({"date": datetime.now().isoformat(timespec="seconds"), "repetitions": numberOfRepetitions, "results": results})
+
+        with open(historyFile, 'w') as file:
+            dump(history, file, indent=4)
+
+    @staticmethod
+    def updateBaseline(results: dict[str, dict[str, int | str | float]], baselineFile: str) -> None:
+        """
+        Function used to store results as the new reference of their solutions. The solutions that were not measured keep their reference.
+
+        Args:
+            results (dict[str, dict[str, int | str | float]]): Measures of each solution, indexed by "day_XX_part_Y".
+            baselineFile (str): JSON file containing the reference timings.
+        """
+        baseline: dict[str, dict[str, int | str | float]]        # Reference timings of every solution.
+
+        # Start from the existing baseline, if it can be read.
+        try:
+            with open(baselineFile, 'r') as file:
+                baseline = load(file)
+        except (OSError, ValueError):
+            baseline = {}
+
+        baseline.update(results)
+        with open(baselineFile, 'w') as file:
+            dump(dict(sorted(baseline.items())), file, indent=4)
+
+    @staticmethod
+    def compareToBaseline(results: dict[str, dict[str, int | str | float]], baseline: dict[str, dict[str, int | str | float]], threshold: float) -> list[str]:
+        """
+        Function used to find the solutions that are slower than in the baseline. The median timings are compared,
+        and the peak memory and the number of nodes expanded by the searches too when they were measured in both runs.
+
+        Args:
+            results (dict[str, dict[str, int | str | float]]): Measures of each solution.
+            baseline (dict[str, dict[str, int | str | float]]): Measures used as reference.
+            threshold (float): Relative slowdown above which a solution is flagged (0.1 for 10% slower).
+
+        Returns:
+            A list of messages, one for each solution that regressed.
+        """
+        regressions: list[str] = []     # Messages describing each regression.
+        ratio: float                    # Ratio between the current median and the baseline median.
+
+        for name, measures in results.items():
+            # Solutions that were not in the baseline can't be compared.
+            if name not in baseline or 0 >= baseline[name]["median"]:
+                continue
+
+            ratio = measures["median"] / baseline[name]["median"]
+            if ratio > 1 + threshold:
+                regressions.append(f"{name}: median {measures['median']:.4f}s against {baseline[name]['median']:.4f}s in the baseline (+{(ratio - 1) * 100:.1f}%).")
+
+            # Compare the peak memory, if it was measured.
+            if "peakMemory" in measures and 0 < baseline[name].get("peakMemory", 0):
+                ratio = measures["peakMemory"] / baseline[name]["peakMemory"]
+                if ratio > 1 + threshold:
+                    regressions.append(f"{name}: peak memory {measures['peakMemory'] / 1024:.1f} KiB against {baseline[name]['peakMemory'] / 1024:.1f} KiB in the baseline (+{(ratio - 1) * 100:.1f}%).")
+
+            # Compare the nodes expanded by the searches, if they were counted. Unlike the timings, they do not depend on the load of the machine.
+            if "nodesExpanded" in measures and 0 < baseline[name].get("nodesExpanded", 0):
+                ratio = measures["nodesExpanded"] / baseline[name]["nodesExpanded"]
+                if ratio > 1 + threshold:
+                    regressions.append(f"{name}: {measures['nodesExpanded']} nodes expanded against {baseline[name]['nodesExpanded']} in the baseline (+{(ratio - 1) * 100:.1f}%).")
+
+            # A different answer is always worth reporting.
+            if measures["solution"] != baseline[name]["solution"]:
+                regressions.append(f"{name}: solution {measures['solution']} differs from {baseline[name]['solution']} in the baseline.")
+
+        return regressions
+
+    @staticmethod
+    def measureImportTime(nameOfModule: str) -> list[tuple[str, int, int]]:
+        """
+        Function used to measure the time taken to import a module, with the -X importtime option of Python.
+        The module is imported in a new interpreter, so that the modules already imported here are not hidden.
+
+        Args:
+            nameOfModule (str): Name of the module to import.
+
+        Returns:
+            A list of tuples (name of the imported module, self time, cumulative time), with the times in microseconds,
+            sorted from the slowest cumulative time.
+        """
+        importTimes: list[tuple[str, int, int]] = []        # Times of each module imported.
+        fields: list[str]                                   # Fields of one line of the report: self time, cumulative time and name.
+
+        # Python writes one line per imported module on stderr: "import time: self | cumulative | name".
+        report: str = run([executable, "-X", "importtime", "-c", f"import {nameOfModule}"],
+                          capture_output=True, text=True, cwd=path.dirname(path.abspath(__file__))).stderr
+        for line in report.splitlines():
+            fields = line.removeprefix("import time:").split("|")
+            if 3 == len(fields) and fields[0].strip().isdigit():
+                importTimes.append((fields[2].strip(), int(fields[0]), int(fields[1])))
+
+        importTimes.sort(key=lambda importTime: importTime[2], reverse=True)
+        return importTimes
+
+if __name__ == "__main__":
+    parser: ArgumentParser = ArgumentParser(description="Benchmark the solutions of the Advent Of Code 2015.")
+    parser.add_argument("-d", "--day", type=int, nargs="+", default=list(range(1, 26)), help="Days to benchmark (all by default).")
+    parser.add_argument("-r", "--repeat", type=int, default=5, help="Number of measured runs for each solution.")
+    parser.add_argument("-w", "--warmup", type=int, default=1, help="Number of runs done before measuring each solution.")
+    parser.add_argument("--history", default=Benchmark.HISTORY_FILE, help="JSON file where the results are appended.")
+    parser.add_argument("--baseline", default=Benchmark.BASELINE_FILE, help="JSON file containing the reference timings.")
+    parser.add_argument("--threshold", type=float, default=0.1, help="Relative slowdown above which a solution is flagged.")
+    parser.add_argument("--update-baseline", action="store_true", help="Store the results as the new baseline.")
+    parser.add_argument("--memory", action="store_true", help="Measure the peak memory of each solution too.")
+    parser.add_argument("--search-effort", action="store_true", help="Count the nodes expanded, pruned, the leaves and the best updates of the searches too.")
+    parser.add_argument("--import-time", action="store_true", help="Report the time taken to import the solutions instead of running them.")
+    parser.add_argument("--import-budget", type=float, metavar="MS", help="With --import-time, fail if the import takes more than MS milliseconds.")
+    arguments: Namespace = parser.parse_args()
+
+    # Report the slowest imports of the entry point of the solutions, then stop.
+    if arguments.import_time:
+        importTimes: list[tuple[str, int, int]] = Benchmark.measureImportTime("SolutionRunner")
+        totalTime: float = next(cumulativeTime for nameOfModule, _, cumulativeTime in importTimes if "SolutionRunner" == nameOfModule) / 1000
+        for nameOfModule, selfTime, cumulativeTime in importTimes[:Benchmark.NUMBER_OF_SLOW_IMPORTS]:
+            print(f"{nameOfModule}: {cumulativeTime / 1000:.2f}ms (self {selfTime / 1000:.2f}ms)")
+
+        if arguments.import_budget is not None and totalTime > arguments.import_budget:
+            print(f"Import takes {totalTime:.2f}ms, more than the budget of {arguments.import_budget:.2f}ms.")
+            exit(1)
+        exit(0)
+
+    results: dict[str, dict[str, int | str | float]] = Benchmark.runAll(arguments.day, arguments.warmup, arguments.repeat, arguments.memory,
+                                                                        arguments.search_effort)
+
+    # Display the measures of each solution.
+    for name, measures in results.items():
+        print(f"{name}: min {measures['min']:.4f}s, median {measures['median']:.4f}s, p95 {measures['p95']:.4f}s"
+              + (f", peak {measures['peakMemory'] / 1024:.1f} KiB" if "peakMemory" in measures else "")
+              + (f", {measures['nodesExpanded']} expanded, {measures['nodesPruned']} pruned, {measures['leavesReached']} leaves, "
+                 f"{measures['bestUpdates']} best updates" if "nodesExpanded" in measures else "") + f" -> {measures['solution']}")
+
+    Benchmark.appendToHistory(results, arguments.history, arguments.repeat)
+
+    # Compare with the baseline, or update it with the results.
+    if arguments.update_baseline:
+        Benchmark.updateBaseline(results, arguments.baseline)
+        print(f"Baseline saved in {arguments.baseline}.")
+
+    elif path.isfile(arguments.baseline):
+        with open(arguments.baseline, 'r') as file:
+            regressions: list[str] = Benchmark.compareToBaseline(results, load(file), arguments.threshold)
+
+        for regression in regressions:
+            print(f"Regression found for {regression}")
+
+        if regressions:
+            exit(1)
+        print("No regression found against the baseline.")
@@ -0,0 +1,24 @@
+class CircuitOperation():
+    """
+    Class representing an operation of the circuit of day 7.
+    """
+
+    __slots__ = ("left", "operator", "right", "output")
+
+    def __init__(self, left: str, operator: str, right: str, output: str) -> None:
+        """
+        Create an operation.
+
+        Args:
+            left (str): First input of the operation, name of a wire or integer as a string.
+            operator (str): "AND", "OR", "LSHIFT", "RSHIFT", "NOT", or "EQUAL" for a direct affectation.
+            right (str): Second input of the operation, "" for "NOT" and "EQUAL".
+            output (str): Name of the wire receiving the signal.
+        """
+        self.left: str = left               # First input of the operation.
+        self.operator: str = operator       # Operator applied to the inputs.
+        self.right: str = right             # Second input of the operation, "" if the operator has one input.
+        self.output: str = output           # Wire receiving the signal.
+
+    def __repr__(self) -> str:
+        return f"CircuitOperation(left={self.left!r}, operator={self.operator!r}, right={self.right!r}, output={self.output!r})"
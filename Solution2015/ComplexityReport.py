@@ -0,0 +1,257 @@
+from InputGenerator import InputGenerator
+from LimitError import LimitError
+from ReadFile import ReadFile
+from SolutionWatchdog import SolutionWatchdog
+from Year2015_Solution import Year2015_Solution
+from argparse import ArgumentParser, Namespace
+from json import dumps
+from math import log
+from time import perf_counter
+from typing import Callable
+
+class ComplexityReport():
+    """
+    Class used to estimate how the time and the memory of the solutions of 2015 grow with the size of their input.
+    Each solution is run over a series of growing inputs, and the exponent k of size^k is fitted (least squares on a
+    log-log scale) to the time and to the peak memory. An exponent above SUPER_LINEAR_THRESHOLD is flagged.
+
+    The sizes are relative to the input of the original problem: a scale of InputGenerator for generated inputs,
+    or the fraction of the lines (of the characters for inputs of one line) kept from the real input for truncated inputs.
+    Truncations only make sense for inputs that are lists or strings, not for inputs that are one number (days 4, 20, 25...).
+    """
+
+    SUPER_LINEAR_THRESHOLD: float = 1.2                             # Exponent above which the growth of a solution is flagged.
+    MINIMAL_TIME_FOR_FIT: float = 0.001                             # Timings below this value (in seconds) are mostly overhead, they are not fitted.
+    GENERATED_SIZES: list[float] = [0.25, 0.5, 1, 2, 4]             # Default scales of the generated inputs.
+    TRUNCATED_SIZES: list[float] = [0.125, 0.25, 0.5, 1]            # Default fractions of the real inputs.
+
+    @staticmethod
+    def truncateInput(content: str, fraction: float) -> str:
+        """
+        Function used to keep the beginning of an input: a fraction of its lines, or of its characters if it has a single line.
+
+        Args:
+            content (str): Content of the input.
+            fraction (float): Fraction of the input kept, between 0 and 1.
+
+        Returns:
+            The truncated input, with at least one line (or one character).
+        """
+        lines: list[str] = content.splitlines(keepends=True)       # Lines of the input.
+
+        if 1 < len(lines):
+            return "".join(lines[:max(1, round(fraction * len(lines)))])
+        return content[:max(1, round(fraction * len(content.rstrip("\n"))))]
+
+    @staticmethod
+    def getInputSeries(day: int, isGenerated: bool, sizes: list[float], seed: int = 0) -> list[tuple[float, str]]:
+        """
+        Function used to build the series of inputs of a day, from the smallest to the biggest.
+
+        Args:
+            day (int): Day of the inputs.
+            isGenerated (bool): Boolean indicating whether the inputs are generated (True) or truncations of the real input (False).
+            sizes (list[float]): Scales of the generated inputs, or fractions of the real input kept.
+            seed (int): Seed of the generated inputs.
+
+        Returns:
+            A list of tuples (relative size, content of the input), sorted by size.
+        """
+        if isGenerated:
+            return [(size, InputGenerator.generateInput(day, size, seed)) for size in sorted(sizes)]
+
+        content: str = ReadFile.getText(day)        # Real input of the day.
+        return [(size, ComplexityReport.truncateInput(content, size)) for size in sorted(sizes)]
+
+    @staticmethod
+    def _measureTime(day: int, isFirstPart: bool, content: str, numberOfRepetitions: int) -> tuple[int | str, float]:
+        """
+        Function called in a child process to time a solution on one input. The exceptions of the solution are not
+        intercepted, so that an input the solution cannot handle is not measured.
+
+        Args:
+            day (int): Day of the solution.
+            isFirstPart (bool): Boolean indicating whether the solution is the one of part 1 or part 2.
+            content (str): Input to solve.
+            numberOfRepetitions (int): Number of timed runs, the fastest one is kept.
+
+        Returns:
+            A tuple (solution, wall time of the fastest run in seconds).
+        """
+        methodToCall: Callable[[], int | str] = getattr(Year2015_Solution, f"_day_{day:02d}_Part_{'1' if isFirstPart else '2'}")   # Solution measured.
+        wallTime: float = float("inf")              # Wall time of the fastest run.
+        startTime: float                            # Time at which the current run started.
+        solution: int | str = ""                    # Solution returned by the last run.
+
+        with ReadFile.useInputSource(day, content):
+            for _ in range(max(1, numberOfRepetitions)):
+                startTime = perf_counter()
+                solution = methodToCall()
+                wallTime = min(wallTime, perf_counter() - startTime)
+
+        return (solution, wallTime)
+
+    @staticmethod
+    def _measureMemory(day: int, isFirstPart: bool, content: str) -> int:
+        """
+        Function called in a child process to measure the peak memory of a solution on one input, with tracemalloc.
+
+        Args:
+            day (int): Day of the solution.
+            isFirstPart (bool): Boolean indicating whether the solution is the one of part 1 or part 2.
+            content (str): Input to solve.
+
+        Returns:
+            The peak memory allocated by the solution, in bytes.
+        """
+        from MemoryTracer import MemoryTracer
+
+        with ReadFile.useInputSource(day, content):
+            return MemoryTracer.measureCall(getattr(Year2015_Solution, f"_day_{day:02d}_Part_{'1' if isFirstPart else '2'}"))[1]["peak"]
+
+    @staticmethod
+    def fitExponent(sizes: list[float], values: list[float]) -> float | None:
+        """
+        Function used to fit values = c * sizes^k by least squares on a log-log scale.
+
+        Args:
+            sizes (list[float]): Relative sizes of the inputs.
+            values (list[float]): Measure (time, memory...) for each size. Values that are not positive are ignored.
+
+        Returns:
+            The exponent k, or None if less than two different sizes have a positive value.
+        """
+        points: list[tuple[float, float]] = [(log(size), log(value)) for size, value in zip(sizes, values) if 0 < size and 0 < value]  # Log of each point.
+        meanOfSizes: float                  # Mean of the log of the sizes.
+        meanOfValues: float                 # Mean of the log of the values.
+        varianceOfSizes: float              # Sum of the squared deviations of the log of the sizes.
+
+        if 2 > len({x for x, _ in points}):
+            return None
+
+        meanOfSizes = sum(x for x, _ in points) / len(points)
+        meanOfValues = sum(y for _, y in points) / len(points)
+        varianceOfSizes = sum((x - meanOfSizes) ** 2 for x, _ in points)
+
+        return sum((x - meanOfSizes) * (y - meanOfValues) for x, y in points) / varianceOfSizes
+
+    @staticmethod
+    def analyseSolution(day: int, isFirstPart: bool, series: list[tuple[float, str]], timeout: float,
+                        numberOfRepetitions: int = 1) -> dict[str, float | bool | str | list[dict[str, float | int | str]] | None]:
+        """
+        Function used to measure a solution over a series of inputs and to fit the growth of its time and memory.
+        Each input is timed, then traced, in child processes stopped after timeout seconds (once a traced run is stopped,
+        the bigger inputs are only timed). The series stops at the first input that is stopped or that the solution
+        cannot solve, as the bigger inputs would not do better.
+
+        Args:
+            day (int): Day of the solution.
+            isFirstPart (bool): Boolean indicating whether the solution is the one of part 1 or part 2.
+            series (list[tuple[float, str]]): Inputs to measure (see getInputSeries), sorted by size.
+            timeout (float): Time budget of the timed runs on one input, and of the traced run, in seconds.
+            numberOfRepetitions (int): Number of timed runs on each input, the fastest one is kept.
+
+        Returns:
+            A dict containing:
+                - points: The size, solution, time (in seconds) and peak memory (in bytes, 0 if it was not traced) measured for each input.
+                - timeExponent / memoryExponent: The fitted exponents, None if less than two inputs were measured.
+                - timeExponentLowerBound: If the series was stopped by the timeout, the exponent needed to go over the timeout
+                  from the last input measured, None otherwise.
+                - stoppedAt: Reason why the series was stopped before its end ("time limit at size X", "error at size X"), None otherwise.
+                - isSuperLinear: True if an exponent (or the lower bound) is above SUPER_LINEAR_THRESHOLD.
+        """
+        points: list[dict[str, float | int | str]] = []     # Measures of each input.
+        stoppedAt: str | None = None                        # Reason why the series was stopped.
+        timeExponentLowerBound: float | None = None         # Minimal exponent of the time, if the series was stopped by the timeout.
+        isMemoryTraced: bool = True                         # States if the memory is still traced, until a traced run is stopped.
+
+        for size, content in series:
+            try:
+                solution, wallTime = SolutionWatchdog.callWithLimits(ComplexityReport._measureTime, (day, isFirstPart, content, numberOfRepetitions), timeout)
+            except LimitError:
+                stoppedAt = f"time limit at size {size:g}"
+                if points and 0 < points[-1]["time"] and size > points[-1]["size"]:
+                    timeExponentLowerBound = log(timeout / max(1, numberOfRepetitions) / points[-1]["time"]) / log(size / points[-1]["size"])
+                break
+            except ChildProcessError:
+                stoppedAt = f"error at size {size:g}"
+                break
+
+            # Tracing the allocations is slower than the timed runs: once a traced run is stopped, the bigger inputs are only timed.
+            peakMemory = 0
+            if isMemoryTraced:
+                try:
+                    peakMemory = SolutionWatchdog.callWithLimits(ComplexityReport._measureMemory, (day, isFirstPart, content), timeout)
+                except (LimitError, ChildProcessError):
+                    isMemoryTraced = False
+            points.append({"size": size, "solution": solution, "time": wallTime, "peakMemory": peakMemory})
+
+        # Timings too short to be above the overhead of a call are not fitted.
+        timedPoints: list[dict[str, float | int | str]] = [point for point in points if ComplexityReport.MINIMAL_TIME_FOR_FIT <= point["time"]]
+        timeExponent: float | None = ComplexityReport.fitExponent([point["size"] for point in timedPoints], [point["time"] for point in timedPoints])
+        memoryExponent: float | None = ComplexityReport.fitExponent([point["size"] for point in points], [point["peakMemory"] for point in points])
+
+        return {"points": points,
+                "timeExponent": timeExponent,
+                "memoryExponent": memoryExponent,
+                "timeExponentLowerBound": timeExponentLowerBound,
+                "stoppedAt": stoppedAt,
+                "isSuperLinear": any(exponent is not None and ComplexityReport.SUPER_LINEAR_THRESHOLD < exponent
+                                     for exponent in (timeExponent, memoryExponent, timeExponentLowerBound))}
+
+    @staticmethod
+    def runAll(days: range | list[int], parts: list[int], isGenerated: bool, sizes: list[float], timeout: float, numberOfRepetitions: int = 1,
+               seed: int = 0) -> dict[str, dict[str, float | bool | str | list[dict[str, float | int | str]] | None]]:
+        """
+        Function used to analyse every developed solution of the given days and parts.
+
+        Args:
+            days (range | list[int]): Days to analyse.
+            parts (list[int]): Parts to analyse (1, 2 or both).
+            isGenerated (bool): Boolean indicating whether the inputs are generated (True) or truncations of the real inputs (False).
+            sizes (list[float]): Scales of the generated inputs, or fractions of the real inputs kept.
+            timeout (float): Time budget of the timed runs on one input, and of its traced run, in seconds.
+            numberOfRepetitions (int): Number of timed runs on each input.
+            seed (int): Seed of the generated inputs.
+
+        Returns:
+            A dict indexed by "day_XX_part_Y" containing the analysis of each solution (see analyseSolution).
+        """
+        results: dict[str, dict[str, float | bool | str | list[dict[str, float | int | str]] | None]] = {}     # Analysis of each solution.
+        series: list[tuple[float, str]]                                                                     # Inputs of the current day.
+
+        for day in days:
+            series = ComplexityReport.getInputSeries(day, isGenerated, sizes, seed)
+            for part in sorted(parts):
+                if hasattr(Year2015_Solution, f"_day_{day:02d}_Part_{part}"):
+                    results[f"day_{day:02d}_part_{part}"] = ComplexityReport.analyseSolution(day, 1 == part, series, timeout, numberOfRepetitions)
+
+        return results
+
+if __name__ == "__main__":
+    parser: ArgumentParser = ArgumentParser(description="Estimate how the time and memory of the solutions of 2015 grow with the size of their input.")
+    parser.add_argument("-d", "--day", type=int, nargs="+", default=list(range(1, 26)), help="Days to analyse (all by default).")
+    parser.add_argument("-p", "--part", type=int, choices=[1, 2], nargs="+", default=[1, 2], help="Parts to analyse (both by default).")
+    parser.add_argument("--truncated", action="store_true", help="Use truncations of the real inputs instead of generated inputs.")
+    parser.add_argument("-s", "--sizes", type=float, nargs="+", help="Scales of the generated inputs, or fractions of the real inputs kept "
+                                                                     f"(default: {ComplexityReport.GENERATED_SIZES} or {ComplexityReport.TRUNCATED_SIZES}).")
+    parser.add_argument("--timeout", type=float, default=30, metavar="SECONDS", help="Time budget of the timed runs on one input, and of its traced run.")
+    parser.add_argument("-r", "--repeat", type=int, default=1, help="Number of timed runs on each input, the fastest one is kept.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the generated inputs.")
+    parser.add_argument("--json", action="store_true", help="Print the whole analysis as JSON.")
+    arguments: Namespace = parser.parse_args()
+
+    sizes: list[float] = arguments.sizes or (ComplexityReport.TRUNCATED_SIZES if arguments.truncated else ComplexityReport.GENERATED_SIZES)
+    results = ComplexityReport.runAll(arguments.day, arguments.part, not arguments.truncated, sizes, arguments.timeout, arguments.repeat, arguments.seed)
+
+    if arguments.json:
+        print(dumps(results, indent=4))
+    else:
+        for key, analysis in results.items():
+            timeExponent: str = "?" if analysis["timeExponent"] is None else f"{analysis['timeExponent']:.2f}"
+            memoryExponent: str = "?" if analysis["memoryExponent"] is None else f"{analysis['memoryExponent']:.2f}"
+            if analysis["timeExponentLowerBound"] is not None:
+                timeExponent += f" (> {analysis['timeExponentLowerBound']:.2f})"
+            print(f"{key}: time ~ n^{timeExponent}, memory ~ n^{memoryExponent} over {len(analysis['points'])} sizes"
+                  + (f", stopped: {analysis['stoppedAt']}" if analysis["stoppedAt"] is not None else "")
+                  + (" <- super-linear" if analysis["isSuperLinear"] else ""))
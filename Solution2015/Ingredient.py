@@ -0,0 +1,27 @@
+class Ingredient():
+    """
+    Class representing an ingredient of day 15.
+    """
+
+    __slots__ = ("capacity", "durability", "flavor", "texture", "calories")
+
+    def __init__(self, capacity: int, durability: int, flavor: int, texture: int, calories: int) -> None:
+        """
+        Create an ingredient, with the value of its properties for one teaspoon.
+
+        Args:
+            capacity (int): Capacity of the ingredient.
+            durability (int): Durability of the ingredient.
+            flavor (int): Flavor of the ingredient.
+            texture (int): Texture of the ingredient.
+            calories (int): Calories of the ingredient, which do not count in the score.
+        """
+        self.capacity: int = capacity           # Capacity for one teaspoon.
+        self.durability: int = durability       # Durability for one teaspoon.
+        self.flavor: int = flavor               # Flavor for one teaspoon.
+        self.texture: int = texture             # Texture for one teaspoon.
+        self.calories: int = calories           # Calories for one teaspoon.
+
+    def __repr__(self) -> str:
+        return (f"Ingredient(capacity={self.capacity}, durability={self.durability}, flavor={self.flavor}, "
+                f"texture={self.texture}, calories={self.calories})")
@@ -0,0 +1,190 @@
+import os
+from mmap import mmap, ACCESS_READ
+from struct import Struct
+
+try:
+    from mmap import MADV_WILLNEED
+except ImportError:
+    MADV_WILLNEED = None
+
+class InputBundle():
+    """
+    Class used to read the inputs of several days from one packed file (a bundle) instead of one file per day.
+    A bundle starts with a header (magic, number of inputs), followed by an index with one entry per input
+    (day, offset, length, SHA-256 digest of the input), then by the inputs themselves.
+    The bundle is memory-mapped once, and the input of a day is a view on the mapping, without copy.
+    """
+
+    MAGIC: bytes = b"AOC2015B"          # First bytes of every bundle.
+    HEADER: Struct = Struct("<8sI")     # Magic and number of inputs.
+    ENTRY: Struct = Struct("<IQQ32s")   # Day, offset from the start of the bundle, length in bytes, SHA-256 digest of the input.
+
+    def __init__(self, pathOfBundle: str) -> None:
+        """
+        Open a bundle and read its index.
+
+        Args:
+            pathOfBundle (str): Path of the bundle.
+
+        Raises:
+            OSError: If the bundle cannot be opened.
+            ValueError: If the file is not a bundle, or if its index points outside of the file.
+        """
+        magic: bytes                # First bytes of the file.
+        numberOfInputs: int         # Number of inputs in the bundle.
+
+        self.path: str = os.fspath(pathOfBundle)                # Path of the bundle.
+        self.index: dict[int, tuple[int, int, bytes]] = {}      # Offset, length and digest of the input of each day.
+
+        with open(self.path, 'rb') as file:
+            fileStatus = os.fstat(file.fileno())
+            self.signature: tuple[int, int] = (fileStatus.st_mtime_ns, fileStatus.st_size)      # Modification time and size when the bundle was opened.
+            if InputBundle.HEADER.size > fileStatus.st_size:
+                raise ValueError(f"{self.path} is not an input bundle.")
+            self._content: mmap = mmap(file.fileno(), 0, access=ACCESS_READ)                    # Mapping of the whole bundle.
+
+        # Ask the system to read the whole bundle at once (where it is supported), instead of one page at a time.
+        if MADV_WILLNEED is not None:
+            self._content.madvise(MADV_WILLNEED)
+
+        # Read the index of the inputs.
+        magic, numberOfInputs = InputBundle.HEADER.unpack_from(self._content, 0)
+        if InputBundle.MAGIC != magic or InputBundle.HEADER.size + numberOfInputs * InputBundle.ENTRY.size > len(self._content):
+            self.close()
+            raise ValueError(f"{self.path} is not an input bundle.")
+
+        for indexOfEntry in range(numberOfInputs):
+            day, offset, length, digest = InputBundle.ENTRY.unpack_from(self._content, InputBundle.HEADER.size + indexOfEntry * InputBundle.ENTRY.size)
+            if offset + length > len(self._content):
+                self.close()
+                raise ValueError(f"The input of day {day} is outside of {self.path}.")
+            self.index[day] = (offset, length, digest)
+
+    def __contains__(self, day: int) -> bool:
+        return day in self.index
+
+    def getContent(self, day: int) -> memoryview:
+        """
+        Function used to get the input of a day, as a view on the mapping of the bundle.
+
+        Args:
+            day (int): Day when the problem was published.
+
+        Returns:
+            A read-only memoryview on the bytes of the input.
+
+        Raises:
+            KeyError: If the input of the day is not in the bundle.
+        """
+        offset, length, _ = self.index[day]
+        return memoryview(self._content)[offset:offset + length]
+
+    def verify(self) -> list[int]:
+        """
+        Function used to check the inputs of the bundle against the digests of the index.
+
+        Returns:
+            The days whose input does not match its digest.
+        """
+        from hashlib import sha256
+
+        return [day for day, (_, _, digest) in sorted(self.index.items()) if sha256(self.getContent(day)).digest() != digest]
+
+    def isModified(self) -> bool:
+        """
+        Function used to know if the bundle file changed since it was opened (modification time or size).
+
+        Returns:
+            True if the file changed or cannot be read anymore, False otherwise.
+        """
+        try:
+            fileStatus = os.stat(self.path)
+        except OSError:
+            return True
+
+        return (fileStatus.st_mtime_ns, fileStatus.st_size) != self.signature
+
+    def close(self) -> None:
+        """
+        Function used to release the mapping of the bundle. If a view on an input is still alive, the mapping is closed once the view is released.
+        """
+        try:
+            self._content.close()
+        except BufferError:
+            pass
+
+    @staticmethod
+    def write(pathOfBundle: str, inputs: dict[int, bytes]) -> None:
+        """
+        Function used to write a bundle. The bundle is written in a temporary file first, so that a reader never sees a partial bundle.
+
+        Args:
+            pathOfBundle (str): Path of the bundle to write.
+            inputs (dict[int, bytes]): Content of the input of each day.
+        """
+        from hashlib import sha256
+
+        days: list[int] = sorted(inputs)                                                        # Days of the bundle, in the order of the index.
+        offset: int = InputBundle.HEADER.size + len(days) * InputBundle.ENTRY.size             # Offset of the next input.
+        pathOfTemporaryFile: str = f"{pathOfBundle}.{os.getpid()}.tmp"                          # File written before replacing the bundle.
+
+        with open(pathOfTemporaryFile, 'wb') as file:
+            file.write(InputBundle.HEADER.pack(InputBundle.MAGIC, len(days)))
+            for day in days:
+                file.write(InputBundle.ENTRY.pack(day, offset, len(inputs[day]), sha256(inputs[day]).digest()))
+                offset += len(inputs[day])
+            for day in days:
+                file.write(inputs[day])
+
+        os.replace(pathOfTemporaryFile, pathOfBundle)
+
+    @staticmethod
+    def writeDirectory(directory: str, pathOfBundle: str, days: range | list[int] = range(1, 26)) -> list[int]:
+        """
+        Function used to pack the input files of a directory (01.txt, 02.txt...) in a bundle.
+
+        Args:
+            directory (str): Directory containing the input files.
+            pathOfBundle (str): Path of the bundle to write.
+            days (range | list[int]): Days to pack. Days without input file are skipped.
+
+        Returns:
+            The days packed in the bundle.
+        """
+        inputs: dict[int, bytes] = {}       # Content of the input of each day.
+        pathOfInput: str                    # Path of the input file of the current day.
+
+        for day in days:
+            pathOfInput = os.path.join(directory, f"{day:02d}.txt")
+            if os.path.isfile(pathOfInput):
+                with open(pathOfInput, 'rb') as file:
+                    inputs[day] = file.read()
+
+        InputBundle.write(pathOfBundle, inputs)
+        return sorted(inputs)
+
+if __name__ == "__main__":
+    # The command line modules are imported only when the bundle is used as a script.
+    from argparse import ArgumentParser, Namespace
+    from sys import exit
+
+    parser: ArgumentParser = ArgumentParser(description="Pack the inputs of the Advent Of Code 2015 in one bundle, or check a bundle.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    packParser: ArgumentParser = commands.add_parser("pack", help="Pack the input files of a directory (01.txt, 02.txt...) in a bundle.")
+    packParser.add_argument("directory", help="Directory containing the input files.")
+    packParser.add_argument("bundle", help="Path of the bundle to write.")
+    packParser.add_argument("-d", "--day", type=int, nargs="+", default=list(range(1, 26)), help="Days to pack (all by default).")
+    verifyParser: ArgumentParser = commands.add_parser("verify", help="List the inputs of a bundle and check their digests.")
+    verifyParser.add_argument("bundle", help="Path of the bundle to check.")
+    arguments: Namespace = parser.parse_args()
+
+    if "pack" == arguments.command:
+        print(f"Days packed in {arguments.bundle}: {InputBundle.writeDirectory(arguments.directory, arguments.bundle, arguments.day)}")
+        exit()
+
+    bundle: InputBundle = InputBundle(arguments.bundle)
+    corruptedDays: list[int] = bundle.verify()
+    for day, (offset, length, digest) in sorted(bundle.index.items()):
+        print(f"Day {day:02d}: {length} bytes at offset {offset}, sha256 {digest.hex()}{' (corrupted)' if day in corruptedDays else ''}")
+    if corruptedDays:
+        exit(1)
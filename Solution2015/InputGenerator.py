@@ -0,0 +1,539 @@
+from argparse import ArgumentParser, Namespace
+from json import dumps
+from math import sqrt
+from os import makedirs, path
+from random import Random
+from string import ascii_lowercase
+
+class InputGenerator():
+    """
+    Class used to generate valid inputs of any size for the solutions of 2015, so that the solutions can be measured
+    on inputs bigger than the ones in "textfiles". Every input is generated from a seeded random generator: the same day,
+    scale and seed always give the same input.
+
+    The scale multiplies the size of the input of the original problem (number of lines, length of the string, number of
+    cities...). Scales below 1 give smaller inputs. Be careful with the days solved by exploring every combination (9, 13,
+    15, 17 and 24): their time grows exponentially with the scale, small scales like 1.5 or 2 are already long.
+    """
+
+    SYLLABLES: list[str] = ["ka", "lo", "mi", "nu", "re", "sa", "to", "vi", "ze", "ba", "do", "fu"]     # Syllables used to build names.
+    MFCSAM: dict[str, int] = {"children": 3, "cats": 7, "samoyeds": 2, "pomeranians": 3, "akitas": 0,     # Information of the letter of day 16,
+                              "vizslas": 0, "goldfish": 5, "trees": 3, "cars": 2, "perfumes": 1}         # the same as in the solution.
+
+    @staticmethod
+    def _getSize(baseSize: int, scale: float, minimalSize: int = 1) -> int:
+        """
+        Function used to compute the size of a scaled input.
+
+        Args:
+            baseSize (int): Size of the input of the original problem.
+            scale (float): Scale applied to the size.
+            minimalSize (int): Smallest size that keeps the input valid.
+
+        Returns:
+            The scaled size, never smaller than minimalSize.
+        """
+        return max(minimalSize, round(baseSize * scale))
+
+    @staticmethod
+    def _getNames(numberOfNames: int) -> list[str]:
+        """
+        Function used to build distinct names, only made of letters (cities, persons, reindeers...).
+
+        Args:
+            numberOfNames (int): Number of names to build.
+
+        Returns:
+            A list of numberOfNames distinct capitalized names.
+        """
+        names: list[str] = []       # Names built so far.
+        name: str                   # Name being built.
+        value: int                  # Part of the index that is not written in the name yet.
+
+        # Write each index in base len(SYLLABLES), one syllable per digit. Syllables have the same length, so names are distinct.
+        for index in range(numberOfNames):
+            name = ""
+            value = index
+            while True:
+                name += InputGenerator.SYLLABLES[value % len(InputGenerator.SYLLABLES)]
+                value //= len(InputGenerator.SYLLABLES)
+                if 0 == value:
+                    break
+            names.append(name.capitalize())
+
+        return names
+
+    @staticmethod
+    def _day_01_generate(randomGenerator: Random, scale: float) -> str:
+        """
+        Generate the input of day 1: parentheses moving Santa up and down. Santa always reaches the basement.
+        """
+        instructions: str = "".join(randomGenerator.choice("()") for _ in range(InputGenerator._getSize(7000, scale)))   # Instructions of Santa.
+        floorNumber: int = 0                                                                                            # Floor reached by Santa.
+
+        # Santa must go to the basement at least once for the second part.
+        for instruction in instructions:
+            floorNumber += 1 if '(' == instruction else -1
+            if 0 > floorNumber:
+                return instructions
+
+        return instructions + ")" * (floorNumber + 1)
+
+    @staticmethod
+    def _day_02_generate(randomGenerator: Random, scale: float) -> str:
+        """
+        Generate the input of day 2: dimensions of presents, one "LxWxH" per line.
+        """
+        return "\n".join(f"{randomGenerator.randint(1, 30)}x{randomGenerator.randint(1, 30)}x{randomGenerator.randint(1, 30)}"
+                         for _ in range(InputGenerator._getSize(1000, scale)))
+
+    @staticmethod
+    def _day_03_generate(randomGenerator: Random, scale: float) -> str:
+        """
+        Generate the input of day 3: moves of Santa on the grid of houses.
+        """
+        return "".join(randomGenerator.choice("^v<>") for _ in range(InputGenerator._getSize(8192, scale)))
+
+    @staticmethod
+    def _day_04_generate(randomGenerator: Random, scale: float) -> str:
+        """
+        Generate the input of day 4: a secret key. The time of the solution does not depend on its length, so it is not scaled.
+        """
+        return "".join(randomGenerator.choice(ascii_lowercase) for _ in range(8))
+
+    @staticmethod
+    def _day_05_generate(randomGenerator: Random, scale: float) -> str:
+        """
+        Generate the input of day 5: strings of 16 lowercase letters, one per line.
+        """
+        return "\n".join("".join(randomGenerator.choice(ascii_lowercase) for _ in range(16)) for _ in range(InputGenerator._getSize(1000, scale)))
+
+    @staticmethod
+    def _day_06_generate(randomGenerator: Random, scale: float) -> str:
+        """
+        Generate the input of day 6: instructions on rectangles of the 1000x1000 grid of lights.
+        """
+        lines: list[str] = []       # Instructions generated.
+        xCoordinates: list[int]     # Sorted x coordinates of the corners of the rectangle.
+        yCoordinates: list[int]     # Sorted y coordinates of the corners of the rectangle.
+
+        for _ in range(InputGenerator._getSize(300, scale)):
+            xCoordinates = sorted(randomGenerator.randint(0, 999) for _ in range(2))
+            yCoordinates = sorted(randomGenerator.randint(0, 999) for _ in range(2))
+            lines.append(f"{randomGenerator.choice(('turn on', 'turn off', 'toggle'))} {xCoordinates[0]},{yCoordinates[0]} through {xCoordinates[1]},{yCoordinates[1]}")
+
+        return "\n".join(lines)
+
+    @staticmethod
+    def _day_07_helper_getNameOfWire(index: int) -> str:
+        """
+        Helper for the input of day 7. Build the name of a wire, with at least two letters so that it is never "a" or "b".
+        """
+        name: str = ""              # Name of the wire.
+        value: int = index + 27     # Value written in bijective base 26. 27 is the first value written with two letters.
+
+        while 0 < value:
+            value, letter = divmod(value - 1, 26)
+            name = ascii_lowercase[letter] + name
+
+        return name
+
+    @staticmethod
+    def _day_07_generate(randomGenerator: Random, scale: float) -> str:
+        """
+        Generate the input of day 7: a circuit of logic gates, in a random order. The wire "b" is a signal, and every wire
+        (including "b") is an input of at least one gate, so that "a" depends on all of them. The circuit never produces
+        a value out of 16 bits, whatever the value given to "b".
+        """
+        lines: list[str] = []                                       # Connections of the circuit.
+        maxValues: dict[str, int] = {}                              # Highest value each wire can have.
+        wires: list[str] = []                                       # Wires that can be used as input of a gate.
+        unusedWires: list[str] = []                                 # Wires that are not the first input of a gate yet.
+        numberOfGates: int = InputGenerator._getSize(339, scale, 2) # Number of lines of the circuit.
+        output: str                                                 # Wire at the output of the current gate.
+        firstInput: str                                             # First input of the current gate.
+        secondInput: str                                            # Second input of the current gate.
+        shift: int                                                  # Number of bits shifted by the current gate.
+
+        # Start with a few signals, and "b", which is overridden in the second part.
+        for _ in range(max(1, numberOfGates // 20)):
+            output = InputGenerator._day_07_helper_getNameOfWire(len(wires))
+            maxValues[output] = randomGenerator.randint(0, 65535)
+            lines.append(f"{maxValues[output]} -> {output}")
+            wires.append(output)
+        lines.append(f"{randomGenerator.randint(0, 65535)} -> b")
+        maxValues["b"] = 65535
+        wires.append("b")
+        unusedWires = wires[:]
+
+        # Each gate uses wires that already have a value, so that the circuit has no loop. The first input is a wire that is not
+        # the first input of another gate, and the output of the gate is such a wire too: every wire ends in the wires left at the end.
+        # The gates needed to join these wires are kept for the end.
+        while len(lines) + len(unusedWires) < numberOfGates:
+            output = InputGenerator._day_07_helper_getNameOfWire(len(wires))
+            firstInput = unusedWires.pop(randomGenerator.randrange(len(unusedWires)))
+            secondInput = randomGenerator.choice(wires)
+            shift = randomGenerator.randint(1, 4)
+
+            # Gates that lose bits (AND, shifts) are less frequent, so that "a" is rarely 0.
+            match randomGenerator.choices(("AND", "MASK", "OR", "LSHIFT", "RSHIFT", "NOT", "EQUAL"), weights=(1, 1, 5, 2, 1, 2, 1))[0]:
+                case "AND":
+                    lines.append(f"{firstInput} AND {secondInput} -> {output}")
+                    maxValues[output] = min(maxValues[firstInput], maxValues[secondInput])
+                case "MASK":
+                    maxValues[output] = randomGenerator.randint(1, 255)
+                    lines.append(f"{maxValues[output]} AND {firstInput} -> {output}")
+                case "OR":
+                    lines.append(f"{firstInput} OR {secondInput} -> {output}")
+                    maxValues[output] = (1 << max(maxValues[firstInput], maxValues[secondInput]).bit_length()) - 1
+                case "LSHIFT" if 65535 >= maxValues[firstInput] << shift:
+                    lines.append(f"{firstInput} LSHIFT {shift} -> {output}")
+                    maxValues[output] = maxValues[firstInput] << shift
+                case "NOT":
+                    lines.append(f"NOT {firstInput} -> {output}")
+                    maxValues[output] = 65535
+                case "EQUAL":
+                    lines.append(f"{firstInput} -> {output}")
+                    maxValues[output] = maxValues[firstInput]
+                # A left shift that could overflow is replaced by a right shift.
+                case _:
+                    lines.append(f"{firstInput} RSHIFT {shift} -> {output}")
+                    maxValues[output] = maxValues[firstInput] >> shift
+
+            wires.append(output)
+            unusedWires.append(output)
+
+        # Join the wires left two by two, so that "a" depends on every wire of the circuit.
+        while 1 < len(unusedWires):
+            output = InputGenerator._day_07_helper_getNameOfWire(len(wires))
+            firstInput = unusedWires.pop(randomGenerator.randrange(len(unusedWires)))
+            secondInput = unusedWires.pop(randomGenerator.randrange(len(unusedWires)))
+            lines.append(f"{firstInput} OR {secondInput} -> {output}")
+            maxValues[output] = (1 << max(maxValues[firstInput], maxValues[secondInput]).bit_length()) - 1
+            wires.append(output)
+            unusedWires.append(output)
+
+        lines.append(f"{unusedWires[0]} -> a")
+        randomGenerator.shuffle(lines)
+
+        return "\n".join(lines)
+
+    @staticmethod
+    def _day_08_generate(randomGenerator: Random, scale: float) -> str:
+        """
+        Generate the input of day 8: string literals with escaped backslashes, quotes and hexadecimal characters.
+        """
+        lines: list[str] = []       # String literals generated.
+        characters: list[str]       # Characters of the current literal, escaped.
+
+        for _ in range(InputGenerator._getSize(300, scale)):
+            characters = []
+            for _ in range(randomGenerator.randint(0, 30)):
+                match randomGenerator.randint(0, 9):
+                    case 0:
+                        characters.append("\\\\")
+                    case 1:
+                        characters.append("\\\"")
+                    case 2:
+                        characters.append(f"\\x{randomGenerator.randint(0, 255):02x}")
+                    case _:
+                        characters.append(randomGenerator.choice(ascii_lowercase))
+            lines.append(f"\"{''.join(characters)}\"")
+
+        return "\n".join(lines)
+
+    @staticmethod
+    def _day_09_generate(randomGenerator: Random, scale: float) -> str:
+        """
+        Generate the input of day 9: the distance between every pair of cities.
+        """
+        cities: list[str] = InputGenerator._getNames(InputGenerator._getSize(8, scale, 2))     # Names of the cities.
+
+        return "\n".join(f"{cities[first]} to {cities[second]} = {randomGenerator.randint(10, 150)}"
+                         for first in range(len(cities)) for second in range(first + 1, len(cities)))
+
+    @staticmethod
+    def _day_10_generate(randomGenerator: Random, scale: float) -> str:
+        """
+        Generate the input of day 10: the first sequence of the look-and-say game.
+        """
+        return "".join(randomGenerator.choice("123") for _ in range(InputGenerator._getSize(10, scale)))
+
+    @staticmethod
+    def _day_11_generate(randomGenerator: Random, scale: float) -> str:
+        """
+        Generate the input of day 11: the current password of Santa. Passwords always have 8 letters, so it is not scaled.
+        """
+        return "".join(randomGenerator.choice("abcdefghjkmnpqrstuvwxy") for _ in range(8))
+
+    @staticmethod
+    def _day_12_helper_generateElement(randomGenerator: Random, depth: int, numberOfElementsLeft: list[int]) -> int | str | list | dict:
+        """
+        Helper for the input of day 12. Generate one JSON element, which may contain other elements.
+
+        Args:
+            randomGenerator (Random): Generator of random numbers.
+            depth (int): Number of containers around the element.
+            numberOfElementsLeft (list[int]): Number of elements that can still be generated, decreased in place.
+
+        Returns:
+            The element generated: a number, a string, a list or a dict.
+        """
+        choice: float = randomGenerator.random()    # Kind of the element.
+        numberOfElementsLeft[0] -= 1
+
+        # Containers are not too deep, so that the solution can go through them recursively.
+        if 0.3 > choice and 6 > depth and 0 < numberOfElementsLeft[0]:
+            if 0.15 > choice:
+                return [InputGenerator._day_12_helper_generateElement(randomGenerator, depth + 1, numberOfElementsLeft) for _ in range(randomGenerator.randint(1, 6))]
+            return {key: InputGenerator._day_12_helper_generateElement(randomGenerator, depth + 1, numberOfElementsLeft) for key in "abcdefgh"[:randomGenerator.randint(1, 8)]}
+
+        if 0.65 > choice:
+            return randomGenerator.randint(-50, 200)
+        return randomGenerator.choice(("red", "green", "blue", "yellow", "orange", "violet"))
+
+    @staticmethod
+    def _day_12_generate(randomGenerator: Random, scale: float) -> str:
+        """
+        Generate the input of day 12: a JSON document made of numbers, strings, lists and dicts. The root is a dict.
+        """
+        numberOfElementsLeft: list[int] = [InputGenerator._getSize(3000, scale)]      # Number of elements still to generate.
+        elements: list[int | str | list | dict] = []                                    # Elements of the list at the root.
+
+        while 0 < numberOfElementsLeft[0]:
+            elements.append(InputGenerator._day_12_helper_generateElement(randomGenerator, 1, numberOfElementsLeft))
+
+        return dumps({"e": elements}, separators=(",", ":"))
+
+    @staticmethod
+    def _day_13_generate(randomGenerator: Random, scale: float) -> str:
+        """
+        Generate the input of day 13: the happiness of each person next to each other person.
+        """
+        persons: list[str] = InputGenerator._getNames(InputGenerator._getSize(8, scale, 2))    # Names of the persons at the table.
+        lines: list[str] = []                                                                  # Happiness of each pair of persons.
+        happiness: int                                                                         # Happiness of the current pair.
+
+        for person in persons:
+            for neighbour in persons:
+                if person != neighbour:
+                    happiness = randomGenerator.randint(-100, 100)
+                    lines.append(f"{person} would {'gain' if 0 <= happiness else 'lose'} {abs(happiness)} happiness units by sitting next to {neighbour}.")
+
+        return "\n".join(lines)
+
+    @staticmethod
+    def _day_14_generate(randomGenerator: Random, scale: float) -> str:
+        """
+        Generate the input of day 14: the speed, flying time and resting time of each reindeer.
+        """
+        return "\n".join(f"{name} can fly {randomGenerator.randint(5, 30)} km/s for {randomGenerator.randint(2, 20)} seconds, "
+                         f"but then must rest for {randomGenerator.randint(20, 180)} seconds."
+                         for name in InputGenerator._getNames(InputGenerator._getSize(9, scale)))
+
+    @staticmethod
+    def _day_15_generate(randomGenerator: Random, scale: float) -> str:
+        """
+        Generate the input of day 15: the properties of each ingredient.
+        """
+        return "\n".join(f"{name}: capacity {randomGenerator.randint(-3, 5)}, durability {randomGenerator.randint(-3, 5)}, "
+                         f"flavor {randomGenerator.randint(-3, 5)}, texture {randomGenerator.randint(-3, 5)}, calories {randomGenerator.randint(1, 9)}"
+                         for name in InputGenerator._getNames(InputGenerator._getSize(4, scale, 2)))
+
+    @staticmethod
+    def _day_16_generate(randomGenerator: Random, scale: float) -> str:
+        """
+        Generate the input of day 16: three things known about each aunt Sue. Exactly one Sue matches the letter with the
+        rules of the first part, and exactly one other Sue matches it with the rules of the second part.
+        """
+        numberOfSues: int = InputGenerator._getSize(500, scale, 2)                     # Number of aunts.
+        sueOfPart1, sueOfPart2 = randomGenerator.sample(range(numberOfSues), 2)         # Index of the aunts matching each part.
+        exactThings: list[str] = ["children", "samoyeds", "akitas", "vizslas", "cars", "perfumes"]     # Things compared exactly in both parts.
+        lines: list[str] = []                                                           # Things known about each aunt.
+        things: dict[str, int]                                                          # Things known about the current aunt.
+        wrongThing: str                                                                 # Thing that is different from the letter.
+
+        for index in range(numberOfSues):
+            # "cats" is exact in the first part only, and must be higher in the second part.
+            if sueOfPart1 == index:
+                things = {"cats": 7, **{thing: InputGenerator.MFCSAM[thing] for thing in randomGenerator.sample(exactThings, 2)}}
+            elif sueOfPart2 == index:
+                things = {"cats": randomGenerator.randint(8, 10), "pomeranians": randomGenerator.randint(0, 2), "children": 3}
+
+            # Every other aunt has one thing that is different from the letter, whatever the rules.
+            else:
+                wrongThing = randomGenerator.choice(exactThings)
+                things = {wrongThing: randomGenerator.choice([value for value in range(11) if InputGenerator.MFCSAM[wrongThing] != value])}
+                for thing in randomGenerator.sample([thing for thing in InputGenerator.MFCSAM if thing != wrongThing], 2):
+                    things[thing] = randomGenerator.randint(0, 10)
+
+            lines.append(f"Sue {index + 1}: " + ", ".join(f"{thing}: {value}" for thing, value in things.items()))
+
+        return "\n".join(lines)
+
+    @staticmethod
+    def _day_17_generate(randomGenerator: Random, scale: float) -> str:
+        """
+        Generate the input of day 17: the capacity of each container, one per line.
+        """
+        return "\n".join(str(randomGenerator.randint(5, 50)) for _ in range(InputGenerator._getSize(20, scale)))
+
+    @staticmethod
+    def _day_18_generate(randomGenerator: Random, scale: float) -> str:
+        """
+        Generate the input of day 18: the initial state of a square grid of lights. The scale is applied to the number of lights.
+        """
+        numberOfLightsPerRow: int = InputGenerator._getSize(100, sqrt(scale), 3)       # Side of the grid.
+
+        return "\n".join("".join(randomGenerator.choice("#.") for _ in range(numberOfLightsPerRow)) for _ in range(numberOfLightsPerRow))
+
+    @staticmethod
+    def _day_19_generate(randomGenerator: Random, scale: float) -> str:
+        """
+        Generate the input of day 19: the replacements of the machine, an empty line, and the medicine molecule.
+        """
+        elements: list[str] = ["Al", "B", "Ca", "F", "H", "Mg", "N", "O", "P", "Si", "Th", "Ti", "Rn", "Ar", "Y", "C"]  # Elements of the molecules.
+        lines: list[str] = []                                                                                           # Lines of the input.
+
+        # Replacements of the electron, then of the elements.
+        for _ in range(3):
+            lines.append(f"e => {''.join(randomGenerator.choices(elements[:12], k=2))}")
+        for element in elements[:12]:
+            for _ in range(randomGenerator.randint(1, 5)):
+                lines.append(f"{element} => {''.join(randomGenerator.choices(elements, k=randomGenerator.randint(2, 4)))}")
+
+        lines.append("")
+        lines.append("".join(randomGenerator.choices(elements, k=InputGenerator._getSize(290, scale))))
+
+        return "\n".join(lines)
+
+    @staticmethod
+    def _day_20_generate(randomGenerator: Random, scale: float) -> str:
+        """
+        Generate the input of day 20: the number of presents that a house should receive.
+        """
+        return str(InputGenerator._getSize(randomGenerator.randint(30000000, 40000000), scale, 10))
+
+    @staticmethod
+    def _day_21_generate(randomGenerator: Random, scale: float) -> str:
+        """
+        Generate the input of day 21: the stats of the boss. They are not scaled, as a stronger boss can't be defeated.
+        """
+        return f"Hit Points: {randomGenerator.randint(90, 110)}\nDamage: {randomGenerator.randint(7, 9)}\nArmor: {randomGenerator.randint(1, 3)}"
+
+    @staticmethod
+    def _day_22_generate(randomGenerator: Random, scale: float) -> str:
+        """
+        Generate the input of day 22: the stats of the boss. They are not scaled, as a stronger boss can't be defeated.
+        """
+        return f"Hit Points: {randomGenerator.randint(50, 70)}\nDamage: {randomGenerator.randint(8, 10)}"
+
+    @staticmethod
+    def _day_23_generate(randomGenerator: Random, scale: float) -> str:
+        """
+        Generate the input of day 23: a program that computes a different value of "a" for each part, then counts the steps
+        of the Collatz sequence starting from "a" in "b". Bigger scales give bigger values of "a", so longer sequences.
+        """
+        numberOfInstructions: int = InputGenerator._getSize(20, scale)                 # Number of instructions computing "a" in each part.
+        instructionsOfPart: list[list[str]] = []                                        # Instructions computing "a", for each part.
+
+        # "a" is incremented first, so that it is never 0 when the Collatz sequence starts.
+        for _ in range(2):
+            instructionsOfPart.append(["inc a"] + [randomGenerator.choice(("inc a", "tpl a")) for _ in range(numberOfInstructions - 1)])
+
+        return "\n".join([f"jio a, +{numberOfInstructions + 2}",
+                          *instructionsOfPart[0],
+                          f"jmp +{numberOfInstructions + 1}",
+                          *instructionsOfPart[1],
+                          "jio a, +8", "inc b", "jie a, +4", "tpl a", "inc a", "jmp +2", "hlf a", "jmp -7"])
+
+    @staticmethod
+    def _day_24_generate(randomGenerator: Random, scale: float) -> str:
+        """
+        Generate the input of day 24: the distinct weights of the packages. The packages are made of 12 sets of the same weight,
+        seen as a grid of 3 rows and 4 columns: the rows are 3 groups of the same weight, and the columns are 4 groups of the same weight.
+        """
+        numberOfPackages: int = InputGenerator._getSize(29, scale, 24)     # Number of packages, at least 2 per set so that weights are distinct.
+        sizesOfSets: list[int] = [2] * 12                                   # Number of packages of each set.
+        weightOfSet: int                                                    # Weight of each set.
+        weights: set[int] = set()                                           # Weights of the packages of the sets already built.
+        candidates: list[int]                                               # Weights not used yet that can be drawn for the current set.
+        weightsOfSet: list[int]                                             # Weights of the current set, except the last one.
+        lastWeight: int                                                     # Weight completing the current set.
+
+        # Share the packages between the sets, and choose the weight of a set so that packages weigh up to about 4 times their number.
+        for _ in range(numberOfPackages - 24):
+            sizesOfSets[randomGenerator.randrange(12)] += 1
+        weightOfSet = numberOfPackages * numberOfPackages // 6
+
+        # Draw the packages of each set, the last one completes the weight of the set. Draw again until it is a new weight.
+        for sizeOfSet in sizesOfSets:
+            candidates = [weight for weight in range(1, 2 * weightOfSet // sizeOfSet) if weight not in weights]
+            while True:
+                weightsOfSet = randomGenerator.sample(candidates, sizeOfSet - 1)
+                lastWeight = weightOfSet - sum(weightsOfSet)
+                if 0 < lastWeight and lastWeight not in weights and lastWeight not in weightsOfSet:
+                    break
+            weights.update(weightsOfSet)
+            weights.add(lastWeight)
+
+        return "\n".join(str(weight) for weight in sorted(weights))
+
+    @staticmethod
+    def _day_25_generate(randomGenerator: Random, scale: float) -> str:
+        """
+        Generate the input of day 25: the row and the column of the code. The scale is applied to the number of codes to compute.
+        """
+        return (f"To continue, please consult the code grid in the manual.  Enter the code at row {InputGenerator._getSize(randomGenerator.randint(2000, 3500), sqrt(scale))}, "
+                f"column {InputGenerator._getSize(randomGenerator.randint(2000, 3500), sqrt(scale))}.")
+
+    @staticmethod
+    def generateInput(day: int, scale: float = 1, seed: int = 0) -> str:
+        """
+        Function used to generate the input of one day.
+
+        Args:
+            day (int): Day of the input.
+            scale (float): Scale applied to the size of the input of the original problem.
+            seed (int): Seed of the random generator.
+
+        Returns:
+            The content of the input file.
+        """
+        # Each day has its own generator, so that the input of a day does not depend on the other days generated.
+        return getattr(InputGenerator, f"_day_{day:02d}_generate")(Random(seed * 100 + day), scale)
+
+    @staticmethod
+    def writeInputs(directory: str, scale: float = 1, seed: int = 0, days: range | list[int] = range(1, 26)) -> list[str]:
+        """
+        Function used to write the inputs of several days in a directory, with the same names as in "textfiles".
+
+        Args:
+            directory (str): Directory where the inputs are written. Created if it does not exist.
+            scale (float): Scale applied to the size of the inputs of the original problems.
+            seed (int): Seed of the random generators.
+            days (range | list[int]): Days for which an input is written.
+
+        Returns:
+            The paths of the files written.
+        """
+        pathsOfInputs: list[str] = []       # Paths of the files written.
+
+        makedirs(directory, exist_ok=True)
+        for day in days:
+            pathsOfInputs.append(path.join(directory, f"{day:02d}.txt"))
+            with open(pathsOfInputs[-1], 'w') as file:
+                file.write(InputGenerator.generateInput(day, scale, seed))
+
+        return pathsOfInputs
+
+if __name__ == "__main__":
+    parser: ArgumentParser = ArgumentParser(description="Generate scaled inputs for the Advent Of Code 2015.")
+    parser.add_argument("directory", help="Directory where the inputs are written.")
+    parser.add_argument("-s", "--scale", type=float, default=1, help="Scale applied to the size of the original inputs (10, 100, 1000...).")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the random generators.")
+    parser.add_argument("-d", "--day", type=int, nargs="+", default=list(range(1, 26)), help="Days to generate (all by default).")
+    arguments: Namespace = parser.parse_args()
+
+    for pathOfInput in InputGenerator.writeInputs(arguments.directory, arguments.scale, arguments.seed, arguments.day):
+        print(f"Input written in {pathOfInput}.")
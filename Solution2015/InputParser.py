@@ -0,0 +1,123 @@
+from AuntSue import AuntSue
+from CircuitOperation import CircuitOperation
+from Ingredient import Ingredient
+from ReadFile import ReadFile
+from Reindeer import Reindeer
+from re import Pattern, compile
+from typing import Iterator
+
+class InputParser():
+    """
+    Class used to turn the input files of 2015 into records (tuples of typed values, or record classes with slots) with patterns compiled once,
+    so that the solutions do not run regular expressions in their loops.
+    Days whose lines are used once are parsed by generators, while the line is read. Other days are parsed into lists.
+    Lines that do not match the pattern of their day (empty lines...) are ignored.
+    """
+
+    PATTERN_OF_DAY_06: Pattern[str] = compile(r"(turn on|turn off|toggle) (\d+),(\d+) through (\d+),(\d+)")           # Action and corners of the rectangle.
+    PATTERN_OF_DAY_07: Pattern[str] = compile(r"(?:([a-z0-9]+) )?(?:(AND|OR|LSHIFT|RSHIFT|NOT) )?([a-z0-9]+) -> ([a-z]+)")  # Inputs, operator and output.
+    PATTERN_OF_DAY_09: Pattern[str] = compile(r"(\w+) to (\w+) = (\d+)")                                             # Both cities and their distance.
+    PATTERN_OF_DAY_13: Pattern[str] = compile(r"(\w+) would (gain|lose) (\d+) happiness units by sitting next to (\w+)") # Person, sign, happiness, neighbour.
+    PATTERN_OF_DAY_14: Pattern[str] = compile(r"(\d+) km/s for (\d+) seconds.*?(\d+) seconds")                       # Speed, time of flight, time of rest.
+    PATTERN_OF_DAY_15: Pattern[str] = compile(r"\b([A-Za-z]+)\s(-?\d+)\b")                                           # One property of an ingredient.
+    PATTERN_OF_DAY_16: Pattern[str] = compile(r"\b([A-Za-z]+):\s(\d+)\b")                                            # One thing known about an Aunt Sue.
+    PATTERN_OF_DAY_23: Pattern[str] = compile(r"([a-z]{3}) ?([ab])?,? ?([+-]?\d+)?")                                 # Instruction, register, offset.
+
+    @staticmethod
+    def parseDay06() -> Iterator[tuple[str, int, int, int, int]]:
+        """
+        Function used to parse the instructions of day 6, while the input is streamed.
+
+        Returns:
+            A generator of tuples (action, x of the first corner, y of the first corner, x of the second corner, y of the second corner),
+            where action is "turn on", "turn off" or "toggle".
+        """
+        for line in ReadFile.iterLines(6):
+            if match := InputParser.PATTERN_OF_DAY_06.search(line):
+                yield (match[1], int(match[2]), int(match[3]), int(match[4]), int(match[5]))
+
+    @staticmethod
+    def parseDay07() -> list[CircuitOperation]:
+        """
+        Function used to parse the operations of day 7.
+
+        Returns:
+            A list of operations (see CircuitOperation). The operator is "EQUAL" or "NOT" for operations with one input,
+            whose second input is then "". Inputs are names of wires or integers, as strings.
+        """
+        operations: list[CircuitOperation] = []                 # Operations of the circuit.
+
+        for line in ReadFile.getLines(7):
+            if match := InputParser.PATTERN_OF_DAY_07.search(line):
+                # Binary operators have two inputs, "NOT" and the direct affectation have one.
+                if match[1] is not None:
+                    operations.append(CircuitOperation(match[1], match[2], match[3], match[4]))
+                else:
+                    operations.append(CircuitOperation(match[3], match[2] or "EQUAL", "", match[4]))
+
+        return operations
+
+    @staticmethod
+    def parseDay09() -> list[tuple[str, str, int]]:
+        """
+        Function used to parse the distances of day 9.
+
+        Returns:
+            A list of tuples (first city, second city, distance between them).
+        """
+        return [(match[1], match[2], int(match[3])) for line in ReadFile.getLines(9) if (match := InputParser.PATTERN_OF_DAY_09.search(line))]
+
+    @staticmethod
+    def parseDay13() -> list[tuple[str, str, int]]:
+        """
+        Function used to parse the happiness of day 13.
+
+        Returns:
+            A list of tuples (person, neighbour, happiness gained by the person), where a lost happiness is negative.
+        """
+        return [(match[1], match[4], int(match[3]) if "gain" == match[2] else - int(match[3]))
+                for line in ReadFile.getLines(13) if (match := InputParser.PATTERN_OF_DAY_13.search(line))]
+
+    @staticmethod
+    def parseDay14() -> Iterator[Reindeer]:
+        """
+        Function used to parse the reindeers of day 14, while the input is streamed.
+
+        Returns:
+            A generator of reindeers (speed when moving, time the reindeer can move, time the reindeer will rest).
+        """
+        for line in ReadFile.iterLines(14):
+            if match := InputParser.PATTERN_OF_DAY_14.search(line):
+                yield Reindeer(int(match[1]), int(match[2]), int(match[3]))
+
+    @staticmethod
+    def parseDay15() -> list[Ingredient]:
+        """
+        Function used to parse the ingredients of day 15.
+
+        Returns:
+            A list of ingredients, with the value of each property (capacity, calories...).
+        """
+        return [Ingredient(**{name: int(value) for name, value in InputParser.PATTERN_OF_DAY_15.findall(line)}) for line in ReadFile.getLines(15) if line.strip()]
+
+    @staticmethod
+    def parseDay16() -> Iterator[AuntSue]:
+        """
+        Function used to parse the Aunts Sue of day 16, while the input is streamed.
+
+        Returns:
+            A generator of Aunts Sue, in the order of the input, with the number of each thing known about her.
+        """
+        for line in ReadFile.iterLines(16):
+            if line.strip():
+                yield AuntSue(**{name: int(value) for name, value in InputParser.PATTERN_OF_DAY_16.findall(line)})
+
+    @staticmethod
+    def parseDay23() -> list[tuple[str, str, int]]:
+        """
+        Function used to parse the program of day 23.
+
+        Returns:
+            A list of tuples (instruction, register, offset). The register is "" for "jmp", and the offset is 0 for instructions that do not jump.
+        """
+        return [(match[1], match[2] or "", int(match[3] or 0)) for line in ReadFile.getLines(23) if (match := InputParser.PATTERN_OF_DAY_23.search(line))]
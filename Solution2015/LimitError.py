@@ -0,0 +1,19 @@
+class LimitError(Exception):
+    """
+    Exception raised by SolutionWatchdog.callWithLimits when the child process exceeded one of its limits.
+    Unlike LimitExceeded, which is returned instead of a solution, it is not tied to a day and part.
+    """
+
+    def __init__(self, reason: str, limit: float, elapsed: float) -> None:
+        """
+        Create the exception of a stopped child process.
+
+        Args:
+            reason (str): Limit that was exceeded: "time" (wall time), "cpu" (CPU time) or "memory" (address space).
+            limit (float): Value of the limit, in seconds for "time" and "cpu", in bytes for "memory".
+            elapsed (float): Wall time elapsed before the child process was stopped, in seconds.
+        """
+        super().__init__(f"{reason} limit of {f'{limit / 1024 / 1024:g} MiB' if 'memory' == reason else f'{limit:g}s'} exceeded after {elapsed:.3f}s.")
+        self.reason: str = reason               # Limit that was exceeded.
+        self.limit: float = limit               # Value of the limit.
+        self.elapsed: float = elapsed           # Wall time elapsed before the child process was stopped, in seconds.
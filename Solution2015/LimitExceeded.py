@@ -0,0 +1,31 @@
+class LimitExceeded():
+    """
+    Class returned instead of a solution when its computation was stopped because it exceeded a limit (time budget, memory, CPU time).
+    Printing it gives a message in the same form as the other messages of the solutions.
+    """
+
+    def __init__(self, day: int, isFirstPart: bool, reason: str, limit: float, elapsed: float) -> None:
+        """
+        Create the result of a stopped computation.
+
+        Args:
+            day (int): Day of the solution.
+            isFirstPart (bool): Boolean indicating whether it is part 1 or part 2.
+            reason (str): Limit that was exceeded: "time" for the time budget, "memory" for the address space, "cpu" for the CPU time.
+            limit (float): Value of the limit, in seconds for "time" and "cpu", in bytes for "memory".
+            elapsed (float): Time elapsed before the computation was stopped, in seconds.
+        """
+        self.day: int = day                     # Day of the solution.
+        self.isFirstPart: bool = isFirstPart    # Part of the solution.
+        self.reason: str = reason               # Limit that was exceeded.
+        self.limit: float = limit               # Value of the limit.
+        self.elapsed: float = elapsed           # Time elapsed before the computation was stopped, in seconds.
+
+    def __str__(self) -> str:
+        limit: str = f"{self.limit / 1024 / 1024:g} MiB" if "memory" == self.reason else f"{self.limit:g}s"     # Limit with its unit.
+
+        return (f"Solution for year 2015, day {self.day}, part {'one' if self.isFirstPart else 'two'} was stopped: "
+                f"{self.reason} limit of {limit} exceeded after {self.elapsed:.3f}s.")
+
+    def __repr__(self) -> str:
+        return f"LimitExceeded(day={self.day}, isFirstPart={self.isFirstPart}, reason={self.reason!r}, limit={self.limit!r}, elapsed={self.elapsed:.3f})"
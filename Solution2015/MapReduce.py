@@ -0,0 +1,163 @@
+import os
+from ReadFile import ReadFile
+from Year2015_Solution import Year2015_Solution
+from argparse import ArgumentParser, Namespace
+from io import StringIO
+from mmap import mmap, ACCESS_READ
+from pathlib import Path
+from typing import Callable
+
+class MapReduce():
+    """
+    Class used to compute the solutions whose lines are independent (days 2, 5 and 8) over a pool of processes.
+    The input is split into chunks of whole lines, each process computes the result of its chunks line by line (map),
+    and the results of the chunks are added together (reduce). Each process reads its own chunks from the disk,
+    so the input is never sent from one process to another.
+    """
+
+    LINE_FUNCTIONS: dict[tuple[int, bool], str] = {
+        (2, True): "_day_02_helper_getWrappingOfGift",
+        (2, False): "_day_02_helper_getRibbonOfGift",
+        (5, True): "_day_05_helper_isNice",
+        (5, False): "_day_05_helper_isNiceWithNewRules",
+        (8, True): "_day_08_helper_getCodeMinusLitteral",
+        (8, False): "_day_08_helper_getEncodedMinusCode",
+    }                                               # Function of Year2015_Solution computing the result of one line, for each day and part.
+    DEFAULT_CHUNK_SIZE: int = 1024 * 1024           # Default size of a chunk, in bytes. A chunk is extended to the end of its last line.
+
+    @staticmethod
+    def isSupported(day: int, isFirstPart: bool) -> bool:
+        """
+        Function used to know if a solution can be computed in map-reduce.
+
+        Args:
+            day (int): Day of the solution.
+            isFirstPart (bool): Boolean indicating whether the solution is the one of part 1 or part 2.
+
+        Returns:
+            True if the lines of the input of this solution can be solved independently, False otherwise.
+        """
+        return (day, isFirstPart) in MapReduce.LINE_FUNCTIONS
+
+    @staticmethod
+    def splitIntoChunks(content: mmap | bytes, start: int, end: int, chunkSize: int = DEFAULT_CHUNK_SIZE) -> list[tuple[int, int]]:
+        """
+        Function used to split content[start:end] into chunks of about chunkSize bytes, ending at the end of a line.
+
+        Args:
+            content (mmap | bytes): Content to split.
+            start (int): Offset of the first byte to split.
+            end (int): Offset following the last byte to split.
+            chunkSize (int): Minimal size of a chunk in bytes (except for the last one).
+
+        Returns:
+            A list of pairs (offset of the first byte of the chunk, offset following its last byte).
+        """
+        chunks: list[tuple[int, int]] = []      # Limits of the chunks found so far.
+        endOfChunk: int                         # Offset following the end of the current chunk.
+
+        while start < end:
+            # Extend the chunk to the end of its last line (the last chunk ends with the content).
+            endOfChunk = content.find(b"\n", min(start + max(1, chunkSize), end) - 1, end) + 1
+            if 0 == endOfChunk:
+                endOfChunk = end
+            chunks.append((start, endOfChunk))
+            start = endOfChunk
+
+        return chunks
+
+    @staticmethod
+    def _solveChunk(day: int, isFirstPart: bool, chunk: tuple[str, int, int] | bytes) -> int:
+        """
+        Function used to compute the result of the lines of one chunk (map step). Called in the processes of the pool.
+
+        Args:
+            day (int): Day of the solution.
+            isFirstPart (bool): Boolean indicating whether the solution is the one of part 1 or part 2.
+            chunk (tuple[str, int, int] | bytes): Chunk to solve: a tuple (path of the file, offset, length) to read it from the disk,
+                or the content of the chunk.
+
+        Returns:
+            The sum of the results of the lines of the chunk.
+        """
+        lineFunction: Callable[[str], int] = getattr(Year2015_Solution, MapReduce.LINE_FUNCTIONS[(day, isFirstPart)])   # Result of one line.
+
+        # Read the chunk from the disk if it was not given.
+        if not isinstance(chunk, bytes):
+            with open(chunk[0], 'rb') as file:
+                file.seek(chunk[1])
+                chunk = file.read(chunk[2])
+
+        # Line endings are normalized the same way as ReadFile does.
+        return sum(lineFunction(line) for line in StringIO(str(chunk, "utf-8").replace("\r\n", "\n").replace("\r", "\n")))
+
+    @staticmethod
+    def solve(day: int, isFirstPart: bool, numberOfWorkers: int | None = None, chunkSize: int = DEFAULT_CHUNK_SIZE) -> int:
+        """
+        Function used to compute a solution in map-reduce, from the input given to ReadFile (file, bundle or input source).
+        When the input fits in one chunk, or with only one worker, it is solved in the current process, as starting a pool would take longer.
+
+        Args:
+            day (int): Day of the solution. The day and part should be supported (see isSupported).
+            isFirstPart (bool): Boolean indicating whether the solution is the one of part 1 or part 2.
+            numberOfWorkers (int | None): Number of processes of the pool. If None, one process per CPU is used.
+            chunkSize (int): Size of the chunks in bytes. Smaller chunks spread the work better, larger ones cost less to schedule.
+
+        Returns:
+            The solution of the day and part.
+
+        Raises:
+            KeyError: If the day and part cannot be computed in map-reduce.
+        """
+        location: tuple[str, int, int] | None = ReadFile.getLocation(day)      # File, offset and length of the input, None if it is given directly.
+        content: mmap | bytes                                                   # Content of the input (or of the file containing it) used to find the lines.
+        chunks: list[tuple[int, int]]                                           # Limits of the chunks in the content.
+        tasks: list[tuple[str, int, int] | bytes]                               # Chunks sent to the processes.
+
+        if (day, isFirstPart) not in MapReduce.LINE_FUNCTIONS:
+            raise KeyError(f"The solution of day {day} part {'1' if isFirstPart else '2'} cannot be computed in map-reduce.")
+
+        # An input given directly is sent to the processes, a file is read by the processes themselves.
+        if location is None:
+            content = bytes(ReadFile.getMemoryView(day))
+            chunks = MapReduce.splitIntoChunks(content, 0, len(content), chunkSize)
+            tasks = [content[start:end] for start, end in chunks]
+
+        elif 0 == location[2]:
+            return 0
+
+        else:
+            with open(location[0], 'rb') as file, mmap(file.fileno(), 0, access=ACCESS_READ) as content:
+                chunks = MapReduce.splitIntoChunks(content, location[1], location[1] + location[2], chunkSize)
+            tasks = [(location[0], start, end - start) for start, end in chunks]
+
+        # Without several chunks and workers, the pool would only slow the solution down.
+        if 1 >= len(tasks) or (numberOfWorkers is not None and 1 >= numberOfWorkers):
+            return sum(MapReduce._solveChunk(day, isFirstPart, task) for task in tasks)
+
+        # The pool is imported only when it is used, as multiprocessing is long to import.
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=min(numberOfWorkers or os.cpu_count() or 1, len(tasks))) as executor:
+            return sum(executor.map(MapReduce._solveChunk, [day] * len(tasks), [isFirstPart] * len(tasks), tasks))
+
+if __name__ == "__main__":
+    parser: ArgumentParser = ArgumentParser(description="Compute the solutions of days 2, 5 and 8 of 2015 in map-reduce over a pool of processes.")
+    parser.add_argument("-d", "--day", type=int, choices=[2, 5, 8], nargs="+", default=[2, 5, 8], help="Days of the solutions (all by default).")
+    parser.add_argument("-p", "--part", type=int, choices=[1, 2], nargs="+", default=[1, 2], help="Parts of the solutions (both by default).")
+    parser.add_argument("-j", "--jobs", type=int, default=0, help="Number of processes (0: one per CPU).")
+    parser.add_argument("--chunk-size", type=int, default=MapReduce.DEFAULT_CHUNK_SIZE, metavar="BYTES", help="Size of the chunks, in bytes.")
+    parser.add_argument("--input", metavar="FILE", help="Input file to solve instead of the file of the day in textfiles (with a single day).")
+    arguments: Namespace = parser.parse_args()
+
+    if arguments.input is not None and 1 != len(arguments.day):
+        parser.error("--input can only be used with a single day.")
+
+    for day in arguments.day:
+        for part in sorted(arguments.part):
+            if arguments.input is not None:
+                with ReadFile.useInputSource(day, Path(arguments.input)):
+                    solution: int = MapReduce.solve(day, 1 == part, arguments.jobs or None, arguments.chunk_size)
+            else:
+                solution = MapReduce.solve(day, 1 == part, arguments.jobs or None, arguments.chunk_size)
+            print(f"Solution for year 2015, day {day:02d} part {part} is: {solution}")
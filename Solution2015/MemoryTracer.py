@@ -0,0 +1,120 @@
+import threading
+import tracemalloc
+from os import makedirs, path
+from threading import Event, Thread
+from tracemalloc import Filter, Snapshot, Statistic, get_traced_memory, is_tracing, reset_peak, start, stop, take_snapshot
+from typing import Callable
+
+class MemoryTracer():
+    """
+    Class used to measure the memory allocated by the solutions of 2015 with tracemalloc.
+    """
+
+    NUMBER_OF_TOP_SITES: int = 10           # Number of allocation sites written in each report.
+    SAMPLING_INTERVAL: float = 0.005        # Time between two checks of the memory used, in seconds.
+    GROWTH_BEFORE_SNAPSHOT: float = 1.1     # Growth of the memory used since the last snapshot above which a new snapshot is taken.
+    FILTERS: list[Filter] = [Filter(False, tracemalloc.__file__),   # Allocations of the tracer itself, not shown in the reports.
+                             Filter(False, threading.__file__),
+                             Filter(False, __file__)]
+
+    @staticmethod
+    def _sampleSnapshots(isStopped: Event, snapshots: list[Snapshot]) -> None:
+        """
+        Function run in a thread while a solution is computed. It takes a snapshot of the allocations each time the memory
+        used grows, so that the last snapshot shows the allocation sites close to the peak.
+
+        Args:
+            isStopped (Event): Event set when the solution is computed.
+            snapshots (list[Snapshot]): List where the last snapshot is stored, at index 0.
+        """
+        sizeOfSnapshot: int = 0         # Memory used when the last snapshot was taken, in bytes.
+        currentSize: int                # Memory used now, in bytes.
+
+        while not isStopped.wait(MemoryTracer.SAMPLING_INTERVAL):
+            currentSize = get_traced_memory()[0]
+            if currentSize > sizeOfSnapshot * MemoryTracer.GROWTH_BEFORE_SNAPSHOT:
+                snapshots[:] = [take_snapshot()]
+                sizeOfSnapshot = currentSize
+
+    @staticmethod
+    def measureCall(methodToCall: Callable[[], int | str]) -> tuple[int | str, dict[str, int], list[Statistic]]:
+        """
+        Function used to compute a solution while tracing its allocations.
+
+        Args:
+            methodToCall (Callable[[], int | str]): Method computing the solution.
+
+        Returns:
+            A tuple containing:
+                - 0. The solution returned by methodToCall.
+                - 1. A dict with the peak memory ("peak") and the memory still allocated after the call ("retained"), in bytes.
+                - 2. The allocation sites using the most memory close to the peak, from the biggest.
+        """
+        isAlreadyTracing: bool = is_tracing()       # States if tracemalloc was started before, in which case it is not stopped.
+        isStopped: Event = Event()                  # Event telling the sampling thread to stop.
+        snapshots: list[Snapshot] = []              # Last snapshot taken by the sampling thread.
+        sampler: Thread                             # Thread taking the snapshots.
+        sizeBefore: int                             # Memory allocated before the call, in bytes.
+        solution: int | str                         # Solution returned by the method.
+        memory: dict[str, int]                      # Peak and retained memory of the call.
+        snapshotBefore: Snapshot                    # Allocations before the call.
+        topSites: list[Statistic]                   # Allocation sites that grew the most during the call.
+
+        if not isAlreadyTracing:
+            start()
+
+        # Stop tracing even if the solution or a snapshot fails, so that the next calls are not slowed down.
+        try:
+            sizeBefore = get_traced_memory()[0]
+            reset_peak()
+            snapshotBefore = take_snapshot().filter_traces(MemoryTracer.FILTERS)
+
+            # Compute the solution while the snapshots are taken.
+            sampler = Thread(target=MemoryTracer._sampleSnapshots, args=(isStopped, snapshots), daemon=True)
+            sampler.start()
+            try:
+                solution = methodToCall()
+            finally:
+                isStopped.set()
+                sampler.join()
+
+            memory = {"peak": get_traced_memory()[1] - sizeBefore, "retained": get_traced_memory()[0] - sizeBefore}
+
+            # Without a snapshot during the call (a very short solution), the allocations still there after the call are shown.
+            if not snapshots:
+                snapshots.append(take_snapshot())
+            topSites = [statistic for statistic in snapshots[0].filter_traces(MemoryTracer.FILTERS).compare_to(snapshotBefore, "lineno") if 0 < statistic.size_diff]
+        finally:
+            if not isAlreadyTracing:
+                stop()
+
+        return (solution, memory, topSites[:MemoryTracer.NUMBER_OF_TOP_SITES])
+
+    @staticmethod
+    def traceCall(methodToCall: Callable[[], int | str], day: int, isFirstPart: bool, memoryReportDirectory: str) -> int | str:
+        """
+        Function used to compute a solution while tracing its allocations. A report with the peak memory, the memory
+        still allocated after the call and the biggest allocation sites is written in memoryReportDirectory/day_XX_part_Y.txt.
+
+        Args:
+            methodToCall (Callable[[], int | str]): Method computing the solution.
+            day (int): Day of the solution, used to name the report.
+            isFirstPart (bool): Boolean indicating whether it is part 1 or part 2, used to name the report.
+            memoryReportDirectory (str): Directory where the report is written. Created if it does not exist.
+
+        Returns:
+            The solution returned by methodToCall.
+        """
+        nameOfFile: str = f"day_{day:02d}_part_{'1' if isFirstPart else '2'}.txt"     # Name of the report.
+        solution, memory, topSites = MemoryTracer.measureCall(methodToCall)
+
+        makedirs(memoryReportDirectory, exist_ok=True)
+        with open(path.join(memoryReportDirectory, nameOfFile), 'w') as file:
+            file.write(f"Day {day:02d} part {'1' if isFirstPart else '2'}\n")
+            file.write(f"Peak memory: {memory['peak'] / 1024:.1f} KiB\n")
+            file.write(f"Net retained memory: {memory['retained'] / 1024:.1f} KiB\n")
+            file.write("Top allocation sites close to the peak:\n")
+            for statistic in topSites:
+                file.write(f"    {statistic.traceback}: {statistic.size_diff / 1024:.1f} KiB in {statistic.count_diff} blocks\n")
+
+        return solution
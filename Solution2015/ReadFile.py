@@ -1,13 +1,29 @@
 import os
+from codecs import getincrementaldecoder
+from contextlib import contextmanager
+from contextvars import ContextVar
+from io import IncrementalNewlineDecoder, StringIO
+from mmap import mmap, ACCESS_READ
+from threading import RLock
+from typing import Iterable, Iterator
 
 class ReadFile():
     
     CURRENT_PATH = os.getcwd()
+    DEFAULT_BUFFER_SIZE: int = 64 * 1024                # Default size of the buffer used when lines are streamed from the disk, in bytes.
+
+    _cacheOfContents: dict[str, mmap | bytes] = {}      # Content of the input files already read, indexed by their path.
+    _cacheOfTexts: dict[str, str] = {}                  # Decoded content of the input files already read, indexed by their path.
+    _lockOfCaches: RLock = RLock()                      # Lock protecting the caches when solutions are computed by several threads.
+    _inputBundle: "InputBundle | None" = None           # Bundle read instead of the files of "textfiles", if one is used (see useInputBundle).
+    _inputSource: ContextVar[tuple[int, os.PathLike | str | bytes] | None] = ContextVar("inputSource", default=None)  # Input replacing the file of a day.
     
     def getNameOfFile(day: int) -> str:
         """
         Function used to get the path of the input file. Input files should be in a subfolder "textfiles", and named
         x.txt where is x is the number of the day. if 10 > x, write 0x (for example 03.txt for day 3).
+        If a path is used as input source for the day (see useInputSource), this path is returned instead.
+        If the input of the day is read from a bundle (see useInputBundle), the path of the bundle is returned.
 
         Args:
             day (int): Day when the problem was published.
@@ -15,7 +31,245 @@ class ReadFile():
         Returns:
             String representing the path of the textfile.
         """
-        return os.path.join(ReadFile.CURRENT_PATH, "textFiles", f"{day:02d}.txt")
+        inputSource: os.PathLike | str | bytes | None = ReadFile._getInputSource(day)    # Input replacing the file of the day.
+
+        if isinstance(inputSource, os.PathLike):
+            return os.fspath(inputSource)
+        if inputSource is None and ReadFile._inputBundle is not None and day in ReadFile._inputBundle:
+            return ReadFile._inputBundle.path
+        return os.path.join(ReadFile.CURRENT_PATH, "textfiles", f"{day:02d}.txt")
+
+    @staticmethod
+    @contextmanager
+    def useInputSource(day: int, inputSource: os.PathLike | str | bytes) -> Iterator[None]:
+        """
+        Function used to read the input of a day from another source than its file in "textfiles", inside a with statement.
+        The source only applies to the current thread (or task), so several inputs can be solved at the same time.
+
+        Args:
+            day (int): Day when the problem was published.
+            inputSource (os.PathLike | str | bytes): Input to use for the day:
+                - os.PathLike (pathlib.Path for example): Path of an input file.
+                - str: Content of the input.
+                - bytes: Raw content of the input, encoded in UTF-8.
+        """
+        token = ReadFile._inputSource.set((day, inputSource))       # Token used to restore the previous source.
+
+        try:
+            yield
+        finally:
+            ReadFile._inputSource.reset(token)
+
+    @staticmethod
+    def useInputBundle(pathOfBundle: os.PathLike | str | None) -> None:
+        """
+        Function used to read the inputs from a bundle (see InputBundle) instead of the files of "textfiles", for every thread.
+        The days that are not in the bundle are still read from "textfiles", and an input source given to useInputSource
+        is still used first.
+
+        Args:
+            pathOfBundle (os.PathLike | str | None): Path of the bundle. If None, the files of "textfiles" are read again.
+
+        Raises:
+            OSError: If the bundle cannot be opened.
+            ValueError: If the file is not a bundle.
+        """
+        # The bundles are imported only when one is used.
+        from InputBundle import InputBundle
+
+        with ReadFile._lockOfCaches:
+            # Forget the inputs read from the previous bundle.
+            if ReadFile._inputBundle is not None:
+                ReadFile._forgetBundle()
+
+            ReadFile._inputBundle = InputBundle(pathOfBundle) if pathOfBundle is not None else None
+
+    @staticmethod
+    def _forgetBundle() -> None:
+        """
+        Function used to close the bundle in use and to forget the texts decoded from it. Must be called with the lock of the caches.
+        """
+        for key in [key for key in ReadFile._cacheOfTexts if key.startswith(f"{ReadFile._inputBundle.path}#")]:
+            del ReadFile._cacheOfTexts[key]
+        ReadFile._inputBundle.close()
+        ReadFile._inputBundle = None
+
+    @staticmethod
+    def _getKeyOfCache(day: int) -> str:
+        """
+        Function used to get the key of the input of a day in the caches: the path of its file, followed by the day
+        when the file is a bundle containing several inputs.
+
+        Args:
+            day (int): Day when the problem was published.
+
+        Returns:
+            String representing the key of the input in the caches.
+        """
+        path: str = ReadFile.getNameOfFile(day)     # Path of the file containing the input.
+
+        if ReadFile._inputBundle is not None and path == ReadFile._inputBundle.path:
+            return f"{path}#{day:02d}"
+        return path
+
+    @staticmethod
+    def _getInputSource(day: int) -> os.PathLike | str | bytes | None:
+        """
+        Function used to get the input source used for a day in the current thread (or task).
+
+        Args:
+            day (int): Day when the problem was published.
+
+        Returns:
+            The input source given to useInputSource for this day, or None if the file in "textfiles" is used.
+        """
+        inputSource: tuple[int, os.PathLike | str | bytes] | None = ReadFile._inputSource.get()     # Day and source currently used.
+
+        return inputSource[1] if inputSource is not None and day == inputSource[0] else None
+
+    @staticmethod
+    def _getContent(day: int) -> mmap | bytes | memoryview:
+        """
+        Function used to get the raw content of the input file. The file is read only once: it is memory-mapped
+        the first time it is requested, and the same mapping is returned until the cache is invalidated.
+        An input read from a bundle is a view on the mapping of the bundle.
+
+        Args:
+            day (int): Day when the problem was published.
+
+        Returns:
+            The memory-mapped content of the input file (or empty bytes if the file is empty).
+        """
+        inputSource: os.PathLike | str | bytes | None = ReadFile._getInputSource(day)    # Input replacing the file of the day.
+        path: str = ReadFile.getNameOfFile(day)                                         # Path of the input file, used as key of the cache.
+
+        # A content given directly is neither read nor cached.
+        if isinstance(inputSource, (str, bytes)):
+            return inputSource.encode() if isinstance(inputSource, str) else inputSource
+
+        # Map the file on the first request only.
+        with ReadFile._lockOfCaches:
+            # The bundle is already mapped, its inputs are not copied.
+            if ReadFile._inputBundle is not None and path == ReadFile._inputBundle.path:
+                return ReadFile._inputBundle.getContent(day)
+
+            if path not in ReadFile._cacheOfContents:
+                with open(path, 'rb') as file:
+                    # An empty file cannot be memory-mapped.
+                    if 0 == os.fstat(file.fileno()).st_size:
+                        ReadFile._cacheOfContents[path] = b""
+                    else:
+                        ReadFile._cacheOfContents[path] = mmap(file.fileno(), 0, access=ACCESS_READ)
+
+            return ReadFile._cacheOfContents[path]
+
+    @staticmethod
+    def getLocation(day: int) -> tuple[str, int, int] | None:
+        """
+        Function used to know where the input of a day is stored on the disk, so that another process can read a part of it by itself.
+
+        Args:
+            day (int): Day when the problem was published.
+
+        Returns:
+            A tuple (path of the file, offset of the input in the file, length of the input in bytes),
+            or None if the content of the input is given directly (see useInputSource).
+        """
+        path: str = ReadFile.getNameOfFile(day)     # Path of the file containing the input.
+
+        if isinstance(ReadFile._getInputSource(day), (str, bytes)):
+            return None
+
+        # An input of a bundle is a part of the bundle.
+        with ReadFile._lockOfCaches:
+            if ReadFile._inputBundle is not None and path == ReadFile._inputBundle.path:
+                offset, length, _ = ReadFile._inputBundle.index[day]
+                return (path, offset, length)
+
+        return (path, 0, os.path.getsize(path))
+
+    @staticmethod
+    def getMemoryView(day: int) -> memoryview:
+        """
+        Function used to get a read-only view on the bytes of the input file, without copying them.
+
+        Args:
+            day (int): Day when the problem was published.
+
+        Returns:
+            A memoryview on the content of the input file.
+        """
+        try:
+            return memoryview(ReadFile._getContent(day))
+        except Exception:
+            print(f"An error occurred, the file cannot be opened.")
+            return memoryview(b"")
+
+    @staticmethod
+    def getText(day: int) -> str:
+        """
+        Function used to get the whole content of the input file as a string. Line endings are normalized to '\\n'.
+
+        Args:
+            day (int): Day when the problem was published.
+
+        Returns:
+            A string that contains the whole input of the problem.
+        """
+        # A content given directly is neither read nor cached.
+        if isinstance(ReadFile._getInputSource(day), (str, bytes)):
+            return str(ReadFile._getContent(day), "utf-8").replace("\r\n", "\n").replace("\r", "\n")
+
+        # Decode the content on the first request only.
+        with ReadFile._lockOfCaches:
+            key: str = ReadFile._getKeyOfCache(day)     # Key of the input in the cache.
+
+            if key not in ReadFile._cacheOfTexts:
+                ReadFile._cacheOfTexts[key] = str(ReadFile._getContent(day), "utf-8").replace("\r\n", "\n").replace("\r", "\n")
+
+            return ReadFile._cacheOfTexts[key]
+
+    @staticmethod
+    def invalidateCache(day: int | None = None) -> None:
+        """
+        Function used to forget the content of input files that were already read, so that they are read again
+        on the next request. Useful when an input file is modified while the program is running.
+        If the bundle in use (see useInputBundle) was modified, it is opened again (or no more used if it can't be opened).
+
+        Args:
+            day (int | None): Day of the input file to forget. If None, all input files are forgotten.
+        """
+        paths: list[str]            # Paths of the input files to remove from the cache.
+        pathOfBundle: str           # Path of the bundle in use, opened again if it was modified.
+
+        with ReadFile._lockOfCaches:
+            # The index of a modified bundle can't be trusted anymore, so all its inputs are forgotten.
+            if ReadFile._inputBundle is not None and ReadFile._inputBundle.isModified():
+                from InputBundle import InputBundle
+
+                pathOfBundle = ReadFile._inputBundle.path
+                ReadFile._forgetBundle()
+                try:
+                    ReadFile._inputBundle = InputBundle(pathOfBundle)
+                except (OSError, ValueError):
+                    print(f"The bundle {pathOfBundle} cannot be opened anymore, the files of \"textfiles\" are read instead.")
+
+            # Retrieve the paths that should be forgotten.
+            if day is None:
+                paths = list(ReadFile._cacheOfContents.keys() | ReadFile._cacheOfTexts.keys())
+            else:
+                paths = [ReadFile._getKeyOfCache(day)]
+
+            for path in paths:
+                ReadFile._cacheOfTexts.pop(path, None)
+                content: mmap | bytes | None = ReadFile._cacheOfContents.pop(path, None)
+
+                # Release the mapping. If a memoryview on it is still alive, the mapping is closed once the view is released.
+                if isinstance(content, mmap):
+                    try:
+                        content.close()
+                    except BufferError:
+                        pass
 
     @staticmethod
     def getLine(day: int) -> str:
@@ -31,9 +285,8 @@ class ReadFile():
         line: str        # String that contains the input of the problem.
         
         try:
-            # Open the input file to retrieve the line.
-            with open(ReadFile.getNameOfFile(day), 'r') as file:
-                line = file.readline()
+            # Retrieve the first line of the input file.
+            line = StringIO(ReadFile.getText(day)).readline()
             return line
         except Exception:
             print(f"An error occurred, the file cannot be opened.")
@@ -53,11 +306,103 @@ class ReadFile():
         lines: list[str]        # List of strings that contains the input of the problem.
 
         try:
-            # Open the input file to retrieve the lines.
-            with open(ReadFile.getNameOfFile(day), 'r') as file:
-                lines = file.readlines()
-                return lines
+            # Retrieve all the lines of the input file.
+            lines = StringIO(ReadFile.getText(day)).readlines()
+            return lines
         
         except Exception:
             print(f"An error occurred, the file cannot be opened.")
             return []
+
+    @staticmethod
+    def iterLines(day: int, bufferSize: int = DEFAULT_BUFFER_SIZE) -> Iterator[str]:
+        """
+        Function used to get the strings in the input file one after another, without keeping all of them in memory.
+        If the decoded input is already in the cache, the lines are taken from it. If the input file is already mapped (or is in
+        the mapped bundle), the mapping is decoded bufferSize bytes at a time. Otherwise, the file is streamed from the disk through
+        a buffer of bufferSize bytes. In both cases, the decoded input is not added to the cache. Line endings are normalized to '\\n'.
+
+        Args:
+            day (int): Day when the problem was published.
+            bufferSize (int): Size of the buffer used to read the file from the disk, or to decode its mapping, in bytes.
+
+        Returns:
+            An iterator over the strings of the input of the problem. It stops after the lines already read if an error occurs.
+        """
+        path: str = ReadFile.getNameOfFile(day)     # Path of the input file.
+        key: str = ReadFile._getKeyOfCache(day)     # Key of the input in the cache.
+
+        try:
+            # Do not read the file if its content is given directly, or if it is already decoded.
+            if isinstance(ReadFile._getInputSource(day), (str, bytes)) or key in ReadFile._cacheOfTexts:
+                yield from StringIO(ReadFile.getText(day))
+                return
+
+            # Do not read the file again if it is already mapped, or if it is in the mapped bundle.
+            if key in ReadFile._cacheOfContents or key != path:
+                yield from ReadFile._iterLinesOfContent(ReadFile._getContent(day), bufferSize)
+                return
+
+            with open(path, 'r', encoding="utf-8", buffering=bufferSize) as file:
+                yield from file
+
+        except Exception:
+            print(f"An error occurred, the file cannot be opened.")
+
+    @staticmethod
+    def iterTextOfChunks(chunks: Iterable[bytes | memoryview]) -> Iterator[str]:
+        """
+        Function used to decode a raw content given in chunks (read from a stream, or sliced from a mapping). A character
+        (or a "\\r\\n") cut between two chunks is decoded with the next chunk.
+
+        Args:
+            chunks (Iterable[bytes | memoryview]): Parts of the content, encoded in UTF-8, in order.
+
+        Returns:
+            An iterator over the decoded chunks, whose line endings are normalized to '\\n'.
+        """
+        decoder: IncrementalNewlineDecoder = IncrementalNewlineDecoder(getincrementaldecoder("utf-8")(), translate=True)   # Decoder keeping the incomplete end of a chunk.
+
+        for chunk in chunks:
+            yield decoder.decode(chunk)
+
+        yield decoder.decode(b"", final=True)
+
+    @staticmethod
+    def iterLinesOfChunks(chunks: Iterable[bytes | memoryview]) -> Iterator[str]:
+        """
+        Function used to get the lines of a raw content given in chunks, keeping only the current chunk and line in memory.
+
+        Args:
+            chunks (Iterable[bytes | memoryview]): Parts of the content, encoded in UTF-8, in order.
+
+        Returns:
+            An iterator over the lines of the content, ending with '\\n' (except for the last one if the content does not end with a line ending).
+        """
+        endOfLastLine: str = ""     # Beginning of a line cut at the end of the previous chunk.
+        lines: list[str]            # Lines ended in the current chunk.
+
+        for text in ReadFile.iterTextOfChunks(chunks):
+            lines = (endOfLastLine + text).split("\n")
+            endOfLastLine = lines.pop()
+            for line in lines:
+                yield line + "\n"
+
+        if endOfLastLine:
+            yield endOfLastLine
+
+    @staticmethod
+    def _iterLinesOfContent(content: mmap | bytes | memoryview, bufferSize: int) -> Iterator[str]:
+        """
+        Function used to decode the lines of a raw content bufferSize bytes at a time.
+
+        Args:
+            content (mmap | bytes | memoryview): Raw content of the input, encoded in UTF-8.
+            bufferSize (int): Number of bytes decoded at once.
+
+        Returns:
+            An iterator over the lines of the content (see iterLinesOfChunks).
+        """
+        view: memoryview = memoryview(content)      # View on the content, sliced without copy.
+
+        return ReadFile.iterLinesOfChunks(view[offset:offset + bufferSize] for offset in range(0, len(view), bufferSize))
@@ -0,0 +1,22 @@
+class Reindeer():
+    """
+    Class representing a reindeer of day 14.
+    """
+
+    __slots__ = ("speed", "flightTime", "restTime")
+
+    def __init__(self, speed: int, flightTime: int, restTime: int) -> None:
+        """
+        Create a reindeer.
+
+        Args:
+            speed (int): Speed of the reindeer when it is flying, in km/s.
+            flightTime (int): Number of seconds the reindeer can fly before resting.
+            restTime (int): Number of seconds the reindeer rests before flying again.
+        """
+        self.speed: int = speed                 # Speed when flying, in km/s.
+        self.flightTime: int = flightTime       # Number of seconds of flight before a rest.
+        self.restTime: int = restTime           # Number of seconds of rest.
+
+    def __repr__(self) -> str:
+        return f"Reindeer(speed={self.speed}, flightTime={self.flightTime}, restTime={self.restTime})"
@@ -0,0 +1,56 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+class SearchContext():
+    """
+    Class containing the state of one search (DFS, enumeration...). Each call of a solution creates its own context
+    instead of sharing class attributes, so that several solutions can be computed at the same time.
+    """
+
+    COUNTERS: tuple[str, ...] = ("nodesExpanded", "nodesPruned", "leavesReached", "bestUpdates")      # Counters of the effort of a search.
+
+    _effortsOfSearches: ContextVar[list[dict[str, int]] | None] = ContextVar("effortsOfSearches", default=None)   # Counters of the searches created while the effort is counted.
+
+    def __init__(self, initialBestValue: int = 0) -> None:
+        """
+        Create the state of a new search.
+
+        Args:
+            initialBestValue (int): Value of the best solution before the search starts (maxsize when minimizing, 0 or - maxsize when maximizing).
+        """
+        effortsOfSearches: list[dict[str, int]] | None = SearchContext._effortsOfSearches.get()      # Counters of the searches, if they are counted.
+
+        self.bestValue: int = initialBestValue          # Best value found so far by the search.
+        self.valuesByKey: dict[int, int] = {}           # Values found for each key, for searches that keep more than one value.
+        self.effort: dict[str, int] | None = None       # Counters of the effort of the search (see COUNTERS), None when it is not counted.
+
+        # Count the effort of the search only when asked, the searches do not pay for the counters otherwise.
+        if effortsOfSearches is not None:
+            self.effort = dict.fromkeys(SearchContext.COUNTERS, 0)
+            effortsOfSearches.append(self.effort)
+
+    @staticmethod
+    @contextmanager
+    def countEffort() -> Iterator[dict[str, int]]:
+        """
+        Function used to count the effort of the searches created inside a with statement, in the current thread (or task):
+            - nodesExpanded: Nodes of the search whose children were looked at.
+            - nodesPruned: Children not explored because they could not lead to a (better) solution.
+            - leavesReached: Complete solutions reached by the search.
+            - bestUpdates: Number of times the best value found was improved.
+
+        Returns:
+            A dict with the sum of each counter over all the searches, filled when the with statement ends.
+        """
+        effortsOfSearches: list[dict[str, int]] = []                                # Counters of each search created in the with statement.
+        totalEffort: dict[str, int] = dict.fromkeys(SearchContext.COUNTERS, 0)      # Sum of the counters of all searches.
+        token = SearchContext._effortsOfSearches.set(effortsOfSearches)             # Token used to restore the previous state.
+
+        try:
+            yield totalEffort
+        finally:
+            SearchContext._effortsOfSearches.reset(token)
+            for effort in effortsOfSearches:
+                for counter in SearchContext.COUNTERS:
+                    totalEffort[counter] += effort[counter]
@@ -0,0 +1,50 @@
+from cProfile import Profile
+from io import StringIO
+from os import makedirs, path
+from pstats import Stats, SortKey
+from typing import Callable
+
+class SolutionProfiler():
+    """
+    Class used to profile the solutions of 2015 with cProfile.
+    """
+
+    NUMBER_OF_HOT_FUNCTIONS: int = 20       # Number of functions written in the summary of each profile.
+
+    @staticmethod
+    def profileCall(methodToCall: Callable[[], int | str], day: int, isFirstPart: bool, profileDirectory: str) -> int | str:
+        """
+        Function used to compute a solution under cProfile. The raw profile is dumped in profileDirectory/day_XX_part_Y.prof,
+        and a summary of the functions where the most time is spent is written in profileDirectory/day_XX_part_Y.txt.
+
+        Args:
+            methodToCall (Callable[[], int | str]): Method computing the solution.
+            day (int): Day of the solution, used to name the files.
+            isFirstPart (bool): Boolean indicating whether it is part 1 or part 2, used to name the files.
+            profileDirectory (str): Directory where the profile files are written. Created if it does not exist.
+
+        Returns:
+            The solution returned by methodToCall.
+        """
+        profiler: Profile = Profile()                                                           # Profiler recording the calls.
+        solution: int | str                                                                     # Solution returned by the method.
+        nameOfFiles: str = f"day_{day:02d}_part_{'1' if isFirstPart else '2'}"                  # Name of the files, without extension.
+        summary: StringIO = StringIO()                                                          # Text of the summary of the profile.
+
+        # Compute the solution while profiling it.
+        profiler.enable()
+        try:
+            solution = methodToCall()
+        finally:
+            profiler.disable()
+
+        # Dump the raw profile, which can be opened with pstats or snakeviz.
+        makedirs(profileDirectory, exist_ok=True)
+        profiler.dump_stats(path.join(profileDirectory, f"{nameOfFiles}.prof"))
+
+        # Write the functions where the most time is spent, without counting the time spent in sub-functions.
+        Stats(profiler, stream=summary).strip_dirs().sort_stats(SortKey.TIME).print_stats(SolutionProfiler.NUMBER_OF_HOT_FUNCTIONS)
+        with open(path.join(profileDirectory, f"{nameOfFiles}.txt"), 'w') as file:
+            file.write(summary.getvalue())
+
+        return solution
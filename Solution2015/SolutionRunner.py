@@ -0,0 +1,94 @@
+from LimitExceeded import LimitExceeded
+from Year2015_Solution import Year2015_Solution
+from time import perf_counter
+
+class SolutionRunner():
+    """
+    Class used to run the solutions of 2015, one after another or spread over a pool of processes.
+    """
+
+    @staticmethod
+    def runSolution(day: int, isFirstPart: bool, profileDirectory: str | None = None, isCacheUsed: bool = True,
+                    memoryReportDirectory: str | None = None, timeout: float | None = None, numberOfRepetitions: int = 1,
+                    numberOfWarmups: int = 0, memoryLimit: int | None = None, cpuLimit: float | None = None) -> tuple[int, bool, int | str | LimitExceeded, list[float]]:
+        """
+        Function used to compute the solution of one day / part and to measure the wall time of each run.
+
+        Args:
+            day (int): Day for which we want to retrieve the solution.
+            isFirstPart (bool): Boolean indicating whether we want to retrieve the solution for part 1 or part 2.
+            profileDirectory (str | None): If given, the solution is profiled and the profile is written in this directory.
+            isCacheUsed (bool): Boolean indicating whether the solutions stored on the disk can be used.
+            memoryReportDirectory (str | None): If given, the memory of the solution is traced and the report is written in this directory.
+            timeout (float | None): If given, the solution is stopped after timeout seconds, and a LimitExceeded is returned instead.
+            numberOfRepetitions (int): Number of measured runs. Should be at least 1.
+            numberOfWarmups (int): Number of runs done before measuring, for example to read the input once.
+            memoryLimit (int | None): If given, the address space of the process computing the solution is limited to memoryLimit bytes.
+            cpuLimit (float | None): If given, the solution is stopped after cpuLimit seconds of CPU time.
+
+        Returns:
+            A tuple containing the day, the part, the solution of the last run and the wall time of each measured run in seconds.
+        """
+        wallTimes: list[float] = []                 # Wall time of each measured run.
+        startTime: float                            # Time at which the current run started.
+        solution: int | str | LimitExceeded = ""    # Solution returned for the given day and part.
+
+        # Warm up the solution.
+        for _ in range(numberOfWarmups):
+            Year2015_Solution.getSolution(day, isFirstPart, profileDirectory, isCacheUsed, memoryReportDirectory=memoryReportDirectory, timeout=timeout,
+                                          memoryLimit=memoryLimit, cpuLimit=cpuLimit)
+
+        # Compute the solution while measuring the time each run takes.
+        for _ in range(max(1, numberOfRepetitions)):
+            startTime = perf_counter()
+            solution = Year2015_Solution.getSolution(day, isFirstPart, profileDirectory, isCacheUsed, memoryReportDirectory=memoryReportDirectory, timeout=timeout,
+                                                     memoryLimit=memoryLimit, cpuLimit=cpuLimit)
+            wallTimes.append(perf_counter() - startTime)
+
+        return (day, isFirstPart, solution, wallTimes)
+
+    @staticmethod
+    def runAll(numberOfWorkers: int = 1, days: range | list[int] = range(1, 26), *, profileDirectory: str | None = None, isCacheUsed: bool = True,
+               memoryReportDirectory: str | None = None, timeout: float | None = None, parts: tuple[int, ...] = (1, 2), numberOfRepetitions: int = 1,
+               numberOfWarmups: int = 0, memoryLimit: int | None = None, cpuLimit: float | None = None) -> list[tuple[int, bool, int | str | LimitExceeded, list[float]]]:
+        """
+        Function used to compute the solutions of the given parts of the given days. The arguments after days are keyword-only.
+
+        Args:
+            numberOfWorkers (int): Number of processes used to compute the solutions.
+                - 1 or less: Solutions are computed one after another in the current process.
+                - More than 1: Solutions are spread over a pool of numberOfWorkers processes.
+            days (range | list[int]): Days for which we want to retrieve the solutions.
+            profileDirectory (str | None): If given, every solution is profiled and the profiles are written in this directory.
+            isCacheUsed (bool): Boolean indicating whether the solutions stored on the disk can be used.
+            memoryReportDirectory (str | None): If given, the memory of every solution is traced and the reports are written in this directory.
+            timeout (float | None): If given, each solution is stopped after timeout seconds, so that one solution cannot block the others.
+            parts (tuple[int, ...]): Parts for which we want to retrieve the solutions (1, 2 or both).
+            numberOfRepetitions (int): Number of measured runs of each solution.
+            numberOfWarmups (int): Number of runs of each solution done before measuring.
+            memoryLimit (int | None): If given, each solution is computed in a process whose address space is limited to memoryLimit bytes,
+                so that one solution cannot take the memory of the machine.
+            cpuLimit (float | None): If given, each solution is stopped after cpuLimit seconds of CPU time.
+
+        Returns:
+            A list of tuples (day, isFirstPart, solution, wall times in seconds), in the order of the days and parts.
+        """
+        tasks: list[tuple[int, bool]]                                                   # Pairs of day / part that have to be solved.
+        futures: list[Future[tuple[int, bool, int | str | LimitExceeded, list[float]]]]       # Pending computations submitted to the pool.
+
+        # Construct the list of all day / part to solve, in the order they should be displayed.
+        tasks = [(day, 1 == part) for day in days for part in sorted(parts)]
+
+        # Without multiple workers, there is no need to start a pool of processes.
+        if 1 >= numberOfWorkers:
+            return [SolutionRunner.runSolution(day, isFirstPart, profileDirectory, isCacheUsed, memoryReportDirectory, timeout,
+                                               numberOfRepetitions, numberOfWarmups, memoryLimit, cpuLimit) for day, isFirstPart in tasks]
+
+        # The pool is imported only when it is used, as multiprocessing is long to import.
+        from concurrent.futures import ProcessPoolExecutor, Future
+
+        # Submit every task to the pool, and collect the results in the order of submission.
+        with ProcessPoolExecutor(max_workers=numberOfWorkers) as executor:
+            futures = [executor.submit(SolutionRunner.runSolution, day, isFirstPart, profileDirectory, isCacheUsed, memoryReportDirectory, timeout,
+                                       numberOfRepetitions, numberOfWarmups, memoryLimit, cpuLimit) for day, isFirstPart in tasks]
+            return [future.result() for future in futures]
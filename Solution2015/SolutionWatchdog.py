@@ -0,0 +1,174 @@
+from LimitError import LimitError
+from LimitExceeded import LimitExceeded
+from ReadFile import ReadFile
+from math import ceil
+from multiprocessing import Pipe, Process
+from multiprocessing.connection import Connection, wait
+from os import PathLike
+from time import perf_counter
+from typing import Any, Callable
+
+try:
+    from resource import RLIMIT_AS, RLIMIT_CPU, setrlimit
+    from signal import SIGKILL, SIGXCPU
+except ImportError:
+    setrlimit = None
+
+class SolutionWatchdog():
+    """
+    Class used to compute a solution of 2015 in a child process, which is stopped if the solution exceeds its limits:
+    its time budget, and where the system supports it (resource module), the memory and the CPU time of the child.
+    A solution that never ends (an unreachable wire on day 7, a hash never found on day 4...) or that allocates without
+    bound (the houses of day 20, the strings of day 10...) does not block the caller nor take the machine down.
+    """
+
+    @staticmethod
+    def _callInChild(sender: Connection, function: Callable[..., Any], arguments: tuple, memoryLimit: int | None, cpuLimit: float | None) -> None:
+        """
+        Function run in the child process, which applies the limits, calls the function and sends its result to the parent.
+
+        Args:
+            sender (Connection): End of the pipe used to send the result, as a tuple ("result", result), ("memory", None) or ("error", description of the error).
+            function (Callable[..., Any]): Function to call. It must be importable by the child (a method of a class of a module for example).
+            arguments (tuple): Arguments given to the function.
+            memoryLimit (int | None): If given, maximal size of the address space of the child, in bytes.
+            cpuLimit (float | None): If given, CPU time after which the child is stopped by the system, in seconds (rounded up).
+        """
+        # The soft limit of the CPU time sends SIGXCPU, whose default action stops the child. The hard limit kills it a second later.
+        if memoryLimit is not None:
+            setrlimit(RLIMIT_AS, (memoryLimit, memoryLimit))
+        if cpuLimit is not None:
+            setrlimit(RLIMIT_CPU, (ceil(cpuLimit), ceil(cpuLimit) + 1))
+
+        result: Any = None                  # Result of the function, or description of its error.
+        status: str = "result"              # "result" if the function returned, "memory" if it ran out of the memory allowed, "error" if it raised.
+
+        # The traceback of the MemoryError keeps the frames of the function, and their memory, alive until the except block is left.
+        # Nothing is sent to the parent before, as sending needs memory too.
+        try:
+            result = function(*arguments)
+        except MemoryError:
+            if memoryLimit is None:
+                raise
+            status = "memory"
+        except Exception as error:
+            result = f"{type(error).__name__}: {error}"
+            status = "error"
+
+        sender.send((status, result))
+        sender.close()
+
+    @staticmethod
+    def _solve(day: int, isFirstPart: bool, profileDirectory: str | None, isCacheUsed: bool,
+               inputSource: PathLike | str | bytes | None, memoryReportDirectory: str | None) -> int | str:
+        """
+        Function called in the child process to compute the solution. Unlike getSolution, the errors of the solution are not
+        intercepted, so that _callInChild can tell the parent that the memory limit was reached.
+
+        Args:
+            day, isFirstPart, profileDirectory, isCacheUsed, inputSource, memoryReportDirectory: See Year2015_Solution.getSolution.
+
+        Returns:
+            The solution of the day and part.
+        """
+        from Year2015_Solution import Year2015_Solution
+
+        # A solution not developed yet gets the message of getSolution.
+        if not hasattr(Year2015_Solution, f"_day_{day:02d}_Part_{'1' if isFirstPart else '2'}"):
+            return Year2015_Solution.getSolution(day, isFirstPart)
+
+        if inputSource is not None:
+            with ReadFile.useInputSource(day, inputSource):
+                return Year2015_Solution._computeSolution(day, isFirstPart, profileDirectory, isCacheUsed, memoryReportDirectory)
+        return Year2015_Solution._computeSolution(day, isFirstPart, profileDirectory, isCacheUsed, memoryReportDirectory)
+
+    @staticmethod
+    def callWithLimits(function: Callable[..., Any], arguments: tuple, timeout: float | None = None, memoryLimit: int | None = None,
+                       cpuLimit: float | None = None) -> Any:
+        """
+        Function used to call a function in a child process, within a time budget and resource limits.
+
+        Args:
+            function (Callable[..., Any]): Function to call. It must be importable by the child, and its result must be picklable.
+            arguments (tuple): Arguments given to the function. They must be picklable.
+            timeout (float | None): Time budget of the call (wall time), in seconds. If None, the call is not stopped on time.
+            memoryLimit (int | None): Maximal size of the address space of the child (RLIMIT_AS), in bytes. It includes the interpreter
+                and the memory inherited from the caller, so it should be well above the memory used by the caller.
+            cpuLimit (float | None): CPU time allowed to the child (RLIMIT_CPU), in seconds, rounded up to a whole second.
+
+        Returns:
+            The result of the function.
+
+        Raises:
+            LimitError: If the child was stopped because it exceeded a limit ("time", "memory" or "cpu").
+            ChildProcessError: If the function raised an exception, or if the child ended without sending a result.
+            OSError: If resource limits are asked on a system that does not support them.
+        """
+        if setrlimit is None and (memoryLimit is not None or cpuLimit is not None):
+            raise OSError("Memory and CPU limits are not supported on this system.")
+
+        receiver, sender = Pipe(duplex=False)   # Ends of the pipe used to receive the result from the child.
+        child: Process = Process(target=SolutionWatchdog._callInChild, args=(sender, function, arguments, memoryLimit, cpuLimit), daemon=True)
+        startTime: float                        # Time at which the child was started.
+        isReceived: bool = False                # States if the result was received from the child.
+
+        startTime = perf_counter()
+        child.start()
+        sender.close()
+
+        # Wait for the result, or for the end of the child if it stopped without sending it.
+        try:
+            if not wait([receiver, child.sentinel], timeout):
+                raise LimitError("time", timeout, perf_counter() - startTime)
+            if receiver.poll():
+                try:
+                    status, result = receiver.recv()
+                    isReceived = True
+                except EOFError:
+                    pass
+
+        # The child is stopped when the time budget is spent (or when the caller is interrupted).
+        finally:
+            if not isReceived:
+                child.kill()
+            child.join()
+            receiver.close()
+
+        # The system stops the child with SIGXCPU (soft limit) or SIGKILL (hard limit) when its CPU time is spent.
+        if not isReceived and cpuLimit is not None and child.exitcode in (- SIGXCPU, - SIGKILL):
+            raise LimitError("cpu", cpuLimit, perf_counter() - startTime)
+        if not isReceived:
+            raise ChildProcessError(f"The child process computing {function.__qualname__} ended without result (exit code {child.exitcode}).")
+        if "memory" == status:
+            raise LimitError("memory", memoryLimit, perf_counter() - startTime)
+        if "error" == status:
+            raise ChildProcessError(f"The child process computing {function.__qualname__} raised {result}.")
+
+        return result
+
+    @staticmethod
+    def runWithLimits(day: int, isFirstPart: bool, timeout: float | None = None, profileDirectory: str | None = None, isCacheUsed: bool = True,
+                      memoryReportDirectory: str | None = None, memoryLimit: int | None = None, cpuLimit: float | None = None) -> int | str | LimitExceeded:
+        """
+        Function used to compute a solution in a child process, within a time budget and resource limits (see callWithLimits).
+        The input source used for the day in the current thread (see ReadFile.useInputSource) is given to the child.
+
+        Args:
+            day (int): Day for which we want to retrieve the solution.
+            isFirstPart (bool): Boolean indicating whether we want to retrieve the solution for part 1 or part 2.
+            timeout (float | None): Time budget of the solution, in seconds.
+            profileDirectory, isCacheUsed, memoryReportDirectory: See Year2015_Solution.getSolution.
+            memoryLimit (int | None): Maximal size of the address space of the child, in bytes.
+            cpuLimit (float | None): CPU time allowed to the child, in seconds.
+
+        Returns:
+            The solution, or a LimitExceeded with the reason "time", "memory" or "cpu" if the child was stopped.
+        """
+        try:
+            return SolutionWatchdog.callWithLimits(SolutionWatchdog._solve, (day, isFirstPart, profileDirectory, isCacheUsed,
+                                                                             ReadFile._getInputSource(day), memoryReportDirectory),
+                                                   timeout, memoryLimit, cpuLimit)
+        except LimitError as error:
+            return LimitExceeded(day, isFirstPart, error.reason, error.limit, error.elapsed)
+        except ChildProcessError:
+            return "An error occured on the method called."
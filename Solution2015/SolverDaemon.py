@@ -0,0 +1,227 @@
+from argparse import ArgumentParser, Namespace
+from json import dumps, loads
+from os import path, remove, stat
+from socket import AF_UNIX, SOCK_STREAM, socket
+from socketserver import StreamRequestHandler, ThreadingUnixStreamServer
+from sys import exit
+from threading import Lock, Thread
+from time import perf_counter
+
+class SolverDaemon():
+    """
+    Class used to keep the solutions of 2015 loaded in a long-lived process, which answers requests sent over a Unix socket.
+    The solutions are imported and the inputs are read once, and each solution is computed once while its input file is unchanged,
+    so repeated requests only pay the exchange over the socket.
+
+    Each request and each response is one line of JSON:
+        - {"day": 7, "part": 1} (an optional "year" must be 2015) -> {"solution": ..., "time": ...} or {"error": ...}
+        - {"command": "stop"} -> {"stopped": true}, then the daemon stops.
+    """
+
+    SOCKET_PATH: str = path.join(path.dirname(path.abspath(__file__)), "solverDaemon.sock")    # Default path of the socket.
+    YEAR: int = 2015                                                                            # Only year answered by the daemon.
+
+    _solutions: dict[tuple[int, bool], int | str] = {}                     # Solutions already computed, indexed by day and part.
+    _signatures: dict[int, tuple[int, int]] = {}                           # Modification time and size of the input file of each day when it was read.
+    _lockOfSolutions: Lock = Lock()                                         # Lock protecting the solutions, requests being handled by several threads.
+    _isCacheUsed: bool = True                                               # States if the solutions stored on the disk are used, set by serve.
+
+    @staticmethod
+    def _invalidateIfModified(day: int) -> None:
+        """
+        Function used to forget the input and the solutions of a day if its input file changed since it was read.
+        The file is considered changed as soon as its modification time or its size is different.
+
+        Args:
+            day (int): Day of the input file to check.
+        """
+        from ReadFile import ReadFile
+
+        signature: tuple[int, int]      # Modification time (in ns) and size of the input file.
+
+        try:
+            fileStatus = stat(ReadFile.getNameOfFile(day))
+            signature = (fileStatus.st_mtime_ns, fileStatus.st_size)
+        except OSError:
+            signature = (-1, -1)
+
+        with SolverDaemon._lockOfSolutions:
+            if SolverDaemon._signatures.get(day, signature) != signature:
+                ReadFile.invalidateCache(day)
+                SolverDaemon._solutions.pop((day, True), None)
+                SolverDaemon._solutions.pop((day, False), None)
+            SolverDaemon._signatures[day] = signature
+
+    @staticmethod
+    def solve(day: int, isFirstPart: bool, isCacheUsed: bool = True) -> int | str:
+        """
+        Function used to get a solution in the daemon, computing it only if it is not known yet for the current input file.
+
+        Args:
+            day (int): Day for which we want to retrieve the solution.
+            isFirstPart (bool): Boolean indicating whether we want to retrieve the solution for part 1 or part 2.
+            isCacheUsed (bool): Boolean indicating whether the solutions stored on the disk can be used.
+
+        Returns:
+            The solution of the day and part.
+        """
+        from Year2015_Solution import Year2015_Solution
+
+        solution: int | str | None      # Solution of the day and part.
+
+        SolverDaemon._invalidateIfModified(day)
+
+        with SolverDaemon._lockOfSolutions:
+            solution = SolverDaemon._solutions.get((day, isFirstPart))
+
+        # Compute the solution outside of the lock, so that other days can be answered meanwhile.
+        if solution is None:
+            solution = Year2015_Solution.getSolution(day, isFirstPart, isCacheUsed=isCacheUsed)
+            with SolverDaemon._lockOfSolutions:
+                SolverDaemon._solutions[(day, isFirstPart)] = solution
+
+        return solution
+
+    @staticmethod
+    def answer(request: dict[str, int | str]) -> dict[str, int | str | float | bool]:
+        """
+        Function used to compute the response to one request.
+
+        Args:
+            request (dict[str, int | str]): Request received, with "day" and "part" (and optionally "year").
+
+        Returns:
+            The response, with the solution and the time taken in seconds, or an error message.
+        """
+        startTime: float = perf_counter()      # Time at which the request started to be handled.
+        solution: int | str                    # Solution of the request.
+
+        if SolverDaemon.YEAR != request.get("year", SolverDaemon.YEAR):
+            return {"error": f"Only year {SolverDaemon.YEAR} is solved by this daemon."}
+        if not isinstance(request.get("day"), int) or request.get("part") not in (1, 2):
+            return {"error": "A request must contain a day (int) and a part (1 or 2)."}
+
+        solution = SolverDaemon.solve(request["day"], 1 == request["part"], SolverDaemon._isCacheUsed)
+        return {"solution": solution, "time": perf_counter() - startTime}
+
+    @staticmethod
+    def serve(socketPath: str = SOCKET_PATH, isCacheUsed: bool = True) -> None:
+        """
+        Function used to run the daemon until a stop command is received. The solutions are imported before the first request.
+
+        Args:
+            socketPath (str): Path of the Unix socket the daemon listens to.
+            isCacheUsed (bool): Boolean indicating whether the solutions stored on the disk can be used.
+        """
+        # Import the solutions before the first request, instead of during it.
+        from Year2015_Solution import Year2015_Solution
+
+        server: ThreadingUnixStreamServer       # Server handling each connection in a thread.
+
+        class RequestHandler(StreamRequestHandler):
+            """
+            Class handling the requests of one connection, one line at a time.
+            """
+
+            def handle(self) -> None:
+                response: dict[str, int | str | float | bool]       # Response to the current request.
+
+                isStopped: bool = False                             # States if the current request is a stop command.
+
+                for line in self.rfile:
+                    try:
+                        request: dict[str, int | str] = loads(line)
+                        isStopped = "stop" == request.get("command")
+                        response = {"stopped": True} if isStopped else SolverDaemon.answer(request)
+                    except (ValueError, AttributeError):
+                        response = {"error": "A request must be one JSON object per line."}
+
+                    self.wfile.write((dumps(response) + "\n").encode())
+                    self.wfile.flush()
+
+                    # The daemon stops only once the response is sent, as the process may end before this thread.
+                    # shutdown waits for serve_forever, so it is called from another thread.
+                    if isStopped:
+                        Thread(target=server.shutdown).start()
+                        return
+
+        # A socket left by a daemon that did not stop properly is removed, but not the one of a running daemon.
+        if path.exists(socketPath):
+            try:
+                SolverDaemon.query({"command": "ping"}, socketPath)
+                exit(f"A daemon is already listening on {socketPath}.")
+            except OSError:
+                remove(socketPath)
+
+        SolverDaemon._isCacheUsed = isCacheUsed
+        server = ThreadingUnixStreamServer(socketPath, RequestHandler)
+        server.daemon_threads = True
+        try:
+            server.serve_forever()
+        finally:
+            server.server_close()
+            remove(socketPath)
+
+    @staticmethod
+    def query(request: dict[str, int | str], socketPath: str = SOCKET_PATH) -> dict[str, int | str | float | bool]:
+        """
+        Function used to send one request to the daemon and to wait for its response.
+
+        Args:
+            request (dict[str, int | str]): Request to send (see the description of the class).
+            socketPath (str): Path of the Unix socket the daemon listens to.
+
+        Returns:
+            The response of the daemon.
+
+        Raises:
+            ConnectionError: If the daemon closed the connection without responding (it was stopping for example).
+            OSError: If no daemon listens on socketPath.
+        """
+        line: str       # Response of the daemon, as a line of JSON.
+
+        with socket(AF_UNIX, SOCK_STREAM) as connection:
+            connection.connect(socketPath)
+            connection.sendall((dumps(request) + "\n").encode())
+            with connection.makefile('r') as file:
+                line = file.readline()
+
+        if not line:
+            raise ConnectionError(f"The daemon listening on {socketPath} closed the connection without responding.")
+        return loads(line)
+
+if __name__ == "__main__":
+    parser: ArgumentParser = ArgumentParser(description="Keep the solutions of the Advent Of Code 2015 loaded, and answer requests over a Unix socket.")
+    parser.add_argument("--socket", default=SolverDaemon.SOCKET_PATH, help="Path of the Unix socket.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    serveParser: ArgumentParser = commands.add_parser("serve", help="Run the daemon.")
+    serveParser.add_argument("--bundle", metavar="FILE", help="Read the inputs from a bundle made by InputBundle.py instead of the files of textfiles.")
+    serveParser.add_argument("--no-cache", action="store_true", help="Compute every solution once, even those already stored on the disk.")
+    queryParser: ArgumentParser = commands.add_parser("query", help="Ask solutions to a running daemon.")
+    queryParser.add_argument("-d", "--day", type=int, nargs="+", required=True, help="Days of the solutions.")
+    queryParser.add_argument("-p", "--part", type=int, choices=[1, 2], nargs="+", default=[1, 2], help="Parts of the solutions (both by default).")
+    commands.add_parser("stop", help="Stop a running daemon.")
+    arguments: Namespace = parser.parse_args()
+
+    if "serve" == arguments.command:
+        if arguments.bundle is not None:
+            from ReadFile import ReadFile
+            ReadFile.useInputBundle(arguments.bundle)
+        SolverDaemon.serve(arguments.socket, not arguments.no_cache)
+        exit()
+
+    try:
+        if "stop" == arguments.command:
+            SolverDaemon.query({"command": "stop"}, arguments.socket)
+        else:
+            for day in arguments.day:
+                for part in arguments.part:
+                    response: dict[str, int | str | float | bool] = SolverDaemon.query({"year": SolverDaemon.YEAR, "day": day, "part": part}, arguments.socket)
+                    if "error" in response:
+                        print(response["error"])
+                    else:
+                        print(f"Solution for year 2015, day {day:02d} part {part} is: {response['solution']} ({response['time']:.3f}s)")
+    except ConnectionError as error:
+        exit(str(error))
+    except OSError:
+        exit(f"No daemon is listening on {arguments.socket}. Start it with: python3 SolverDaemon.py serve")
@@ -0,0 +1,141 @@
+from MapReduce import MapReduce
+from ReadFile import ReadFile
+from Year2015_Solution import Year2015_Solution
+from argparse import ArgumentParser, Namespace
+from functools import partial
+from sys import stdin
+from typing import BinaryIO, Callable, Iterator
+
+class StreamSolver():
+    """
+    Class used to compute the solutions that need a single pass over their input (days 1, 2, 3, 5 and 8) from a stream
+    (pipe, standard input, file...), read in chunks of fixed size. The input is never held in memory as a whole, so inputs
+    larger than the memory can be solved. Line endings are normalized to '\\n', as ReadFile does.
+    """
+
+    STREAM_FUNCTIONS: dict[tuple[int, bool], tuple[str, tuple[int, ...]]] = {
+        (1, True): ("_day_01_helper_getFloor", ()),
+        (1, False): ("_day_01_helper_getPositionOfBasement", ()),
+        (3, True): ("_day_03_helper_getNumberOfVisitedHouses", (1,)),
+        (3, False): ("_day_03_helper_getNumberOfVisitedHouses", (2,)),
+    }                                                           # Helper of Year2015_Solution solving each day and part whose input is one line from its chunks, and its other arguments.
+    DEFAULT_CHUNK_SIZE: int = ReadFile.DEFAULT_BUFFER_SIZE     # Default size of the chunks read from the stream, in bytes.
+
+    @staticmethod
+    def isSupported(day: int, isFirstPart: bool) -> bool:
+        """
+        Function used to know if a solution can be computed from a stream.
+
+        Args:
+            day (int): Day of the solution.
+            isFirstPart (bool): Boolean indicating whether the solution is the one of part 1 or part 2.
+
+        Returns:
+            True if the solution needs a single pass over its input, False otherwise.
+        """
+        return (day, isFirstPart) in StreamSolver.STREAM_FUNCTIONS or (day, isFirstPart) in MapReduce.LINE_FUNCTIONS
+
+    @staticmethod
+    def iterText(stream: BinaryIO, chunkSize: int = DEFAULT_CHUNK_SIZE) -> Iterator[str]:
+        """
+        Function used to read a stream chunk by chunk, as text. A character (or a "\\r\\n") cut between two chunks is decoded with the next chunk.
+
+        Args:
+            stream (BinaryIO): Stream to read, opened in binary mode.
+            chunkSize (int): Number of bytes read from the stream at once.
+
+        Returns:
+            An iterator over the decoded chunks, whose line endings are normalized to '\\n'.
+        """
+        # The chunks are read until the end of the stream, and decoded as ReadFile decodes a mapped input.
+        return ReadFile.iterTextOfChunks(iter(partial(stream.read, chunkSize), b""))
+
+    @staticmethod
+    def iterLines(stream: BinaryIO, chunkSize: int = DEFAULT_CHUNK_SIZE) -> Iterator[str]:
+        """
+        Function used to read the lines of a stream one after another, keeping only the current chunk and line in memory.
+
+        Args:
+            stream (BinaryIO): Stream to read, opened in binary mode.
+            chunkSize (int): Number of bytes read from the stream at once.
+
+        Returns:
+            An iterator over the lines of the stream, ending with '\\n' (except for the last one if the stream does not end with a line ending).
+        """
+        # The lines are split as ReadFile splits the lines of a mapped input.
+        return ReadFile.iterLinesOfChunks(iter(partial(stream.read, chunkSize), b""))
+
+    @staticmethod
+    def iterInstructions(stream: BinaryIO, chunkSize: int = DEFAULT_CHUNK_SIZE) -> Iterator[str]:
+        """
+        Function used to read the first line of a stream (the input of days 1 and 3) chunk by chunk. The stream is not read after this line.
+
+        Args:
+            stream (BinaryIO): Stream to read, opened in binary mode.
+            chunkSize (int): Number of bytes read from the stream at once.
+
+        Returns:
+            An iterator over the chunks of the first line, without its line ending.
+        """
+        endOfLine: int      # Index of the end of the line in the current chunk, -1 if the line continues in the next chunk.
+
+        for text in StreamSolver.iterText(stream, chunkSize):
+            endOfLine = text.find("\n")
+            if -1 != endOfLine:
+                yield text[:endOfLine]
+                return
+            yield text
+
+    @staticmethod
+    def solve(day: int, isFirstPart: bool, stream: BinaryIO, chunkSize: int = DEFAULT_CHUNK_SIZE) -> int:
+        """
+        Function used to compute a solution from a stream. The stream is read once, and only as far as the solution needs.
+
+        Args:
+            day (int): Day of the solution. The day and part should be supported (see isSupported).
+            isFirstPart (bool): Boolean indicating whether the solution is the one of part 1 or part 2.
+            stream (BinaryIO): Stream containing the input, opened in binary mode (sys.stdin.buffer, a pipe, a file...).
+            chunkSize (int): Number of bytes read from the stream at once.
+
+        Returns:
+            The solution of the day and part.
+
+        Raises:
+            KeyError: If the day and part cannot be computed from a stream.
+        """
+        lineFunction: Callable[[str], int]      # Result of one line, for the days whose lines are independent.
+        nameOfHelper: str                       # Helper of Year2015_Solution solving a day whose input is one line.
+        arguments: tuple[int, ...]              # Arguments given to this helper after the chunks of the line.
+
+        # The input is one line, given to the helper chunk by chunk.
+        if (day, isFirstPart) in StreamSolver.STREAM_FUNCTIONS:
+            nameOfHelper, arguments = StreamSolver.STREAM_FUNCTIONS[(day, isFirstPart)]
+            return getattr(Year2015_Solution, nameOfHelper)(StreamSolver.iterInstructions(stream, chunkSize), *arguments)
+
+        if (day, isFirstPart) not in MapReduce.LINE_FUNCTIONS:
+            raise KeyError(f"The solution of day {day} part {'1' if isFirstPart else '2'} cannot be computed from a stream.")
+
+        # The lines are independent, so the result of each line is added as soon as the line is read.
+        lineFunction = getattr(Year2015_Solution, MapReduce.LINE_FUNCTIONS[(day, isFirstPart)])
+        return sum(lineFunction(line) for line in StreamSolver.iterLines(stream, chunkSize))
+
+if __name__ == "__main__":
+    parser: ArgumentParser = ArgumentParser(description="Compute a solution of days 1, 2, 3, 5 or 8 of 2015 from a stream, in constant memory.")
+    parser.add_argument("-d", "--day", type=int, choices=[1, 2, 3, 5, 8], required=True, help="Day of the solution.")
+    parser.add_argument("-p", "--part", type=int, choices=[1, 2], nargs="+", default=[1, 2], help="Parts of the solution (both by default). "
+                                                                                                "A standard input can only be read for one part.")
+    parser.add_argument("--chunk-size", type=int, default=StreamSolver.DEFAULT_CHUNK_SIZE, metavar="BYTES", help="Number of bytes read at once.")
+    parser.add_argument("input", nargs="?", default="-", help="File or named pipe containing the input (standard input by default, or with -).")
+    arguments: Namespace = parser.parse_args()
+
+    # A standard input cannot be read again for the second part.
+    if "-" == arguments.input and 1 != len(arguments.part):
+        parser.error("Only one part can be computed from the standard input, use -p.")
+
+    for part in sorted(arguments.part):
+        if "-" == arguments.input:
+            solution: int = StreamSolver.solve(arguments.day, 1 == part, stdin.buffer, arguments.chunk_size)
+        else:
+            with open(arguments.input, 'rb') as stream:
+                solution = StreamSolver.solve(arguments.day, 1 == part, stream, arguments.chunk_size)
+        print(f"Solution for year 2015, day {arguments.day:02d} part {part} is: {solution}")
@@ -1,11 +1,17 @@
 from ReadFile import ReadFile
 from re import split, findall, search
-from hashlib import md5
-import numpy as np
 from sys import maxsize
-from json import load
+from math import prod
+from os import PathLike
 from itertools import product
-from typing import Callable
+from typing import Callable, Iterable, Iterator
+from SearchContext import SearchContext
+from InputParser import InputParser
+from CircuitOperation import CircuitOperation
+from Reindeer import Reindeer
+from Ingredient import Ingredient
+from AuntSue import AuntSue
+from LimitExceeded import LimitExceeded
 
 class Year2015_Solution():
     """
@@ -13,7 +19,9 @@ class Year2015_Solution():
     """
 
     @staticmethod
-    def getSolution(day: int, isFirstPart: bool) -> int | str:
+    def getSolution(day: int, isFirstPart: bool, profileDirectory: str | None = None, isCacheUsed: bool = True,
+                    inputSource: PathLike | str | bytes | None = None, memoryReportDirectory: str | None = None,
+                    timeout: float | None = None, memoryLimit: int | None = None, cpuLimit: float | None = None) -> int | str | LimitExceeded:
         """
         Function called outside the class to obtain the solution for any day, for the first or second part.
         
@@ -22,18 +30,38 @@ class Year2015_Solution():
             isFirstPart (bool): Boolean indicating whether we want to retrieve the solution for day 1 or day 2.
                 - True:  Returns the solution for the first part of the problem.
                 - False: Returns the solution for the second part of the problem.
+            profileDirectory (str | None): If given, the solution is computed under cProfile and the profile is written in this directory.
+            isCacheUsed (bool): Boolean indicating whether the solutions already computed and stored on the disk can be used.
+                The cache is never used when the solution is profiled or when its memory is traced.
+            inputSource (PathLike | str | bytes | None): Input to solve instead of the file of the day in "textfiles":
+                a path (pathlib.Path for example), the content of the input as a string, or its raw content as bytes.
+            memoryReportDirectory (str | None): If given, the allocations of the solution are traced with tracemalloc, and a report
+                with the peak memory, the retained memory and the biggest allocation sites is written in this directory.
+            timeout (float | None): If given, the solution is computed in a child process, which is stopped after timeout seconds.
+                A LimitExceeded is then returned instead of the solution.
+            memoryLimit (int | None): If given, the solution is computed in a child process whose address space is limited to memoryLimit bytes
+                (including the interpreter). A LimitExceeded is returned instead of the solution if the limit is reached.
+            cpuLimit (float | None): If given, the solution is computed in a child process which is stopped after cpuLimit seconds of CPU time.
+                A LimitExceeded is then returned instead of the solution.
             
         Handle:
             If the solution has not yet been developed, a message is displayed.
         """
 
-        # Try to obtain the solution for the given day, for the given part.
-        try:
-            nameOfFunction: str = f"_day_{day:02d}_Part_{'1' if isFirstPart else '2'}"
+        # Solve the given input instead of the file of the day.
+        if inputSource is not None:
+            with ReadFile.useInputSource(day, inputSource):
+                return Year2015_Solution.getSolution(day, isFirstPart, profileDirectory, isCacheUsed, memoryReportDirectory=memoryReportDirectory,
+                                                     timeout=timeout, memoryLimit=memoryLimit, cpuLimit=cpuLimit)
 
-            methodToCall: Callable[[], int | str] = getattr(Year2015_Solution, nameOfFunction)
+        # Compute the solution in a child process that can be stopped, the watchdog is not imported otherwise.
+        if timeout is not None or memoryLimit is not None or cpuLimit is not None:
+            from SolutionWatchdog import SolutionWatchdog
+            return SolutionWatchdog.runWithLimits(day, isFirstPart, timeout, profileDirectory, isCacheUsed, memoryReportDirectory, memoryLimit, cpuLimit)
 
-            return methodToCall()
+        # Try to obtain the solution for the given day, for the given part.
+        try:
+            return Year2015_Solution._computeSolution(day, isFirstPart, profileDirectory, isCacheUsed, memoryReportDirectory)
         
         # Intercepts errors from a day/part that has not yet been developed.
         except AttributeError as e:
@@ -42,162 +70,308 @@ class Year2015_Solution():
             return "An error occured on the method called."
 
     @staticmethod
-    def _day_01_Part_1() -> int:
+    def _computeSolution(day: int, isFirstPart: bool, profileDirectory: str | None, isCacheUsed: bool, memoryReportDirectory: str | None) -> int | str:
         """
-        Get solution for day 1, Part 1.
+        Function used to compute the solution for any day, for the first or second part, without intercepting its errors.
+
+        Args :
+            day, isFirstPart, profileDirectory, isCacheUsed, memoryReportDirectory: See getSolution.
+
+        Returns:
+            The solution of the day and part.
+
+        Raises:
+            AttributeError: If the solution has not yet been developed.
+        """
+        nameOfFunction: str = f"_day_{day:02d}_Part_{'1' if isFirstPart else '2'}"
+
+        methodToCall: Callable[[], int | str] = getattr(Year2015_Solution, nameOfFunction)
+
+        # Profile the solution only when asked, the profiler is not imported otherwise.
+        if profileDirectory is not None:
+            from SolutionProfiler import SolutionProfiler
+            return SolutionProfiler.profileCall(methodToCall, day, isFirstPart, profileDirectory)
+
+        # Trace the memory only when asked, tracemalloc is not imported otherwise.
+        if memoryReportDirectory is not None:
+            from MemoryTracer import MemoryTracer
+            return MemoryTracer.traceCall(methodToCall, day, isFirstPart, memoryReportDirectory)
+
+        if not isCacheUsed:
+            return methodToCall()
+
+        # Look for the solution in the cache, and compute it only if it is not there.
+        from AnswerCache import AnswerCache
+        keyInCache: str = AnswerCache.getKey(Year2015_Solution, day, isFirstPart)
+        solution: int | str | None = AnswerCache.get(keyInCache)
+
+        if solution is None:
+            solution = methodToCall()
+            AnswerCache.store(keyInCache, solution)
+
+        return solution
+
+    @staticmethod
+    def getSolutions(day: int, isCacheUsed: bool = True, inputSource: PathLike | str | bytes | None = None) -> tuple[int | str, int | str]:
+        """
+        Function called outside the class to obtain the solutions of both parts of a day in one call.
+        When a day has a method _day_XX_Parts, the input is parsed once and the work common to both parts is done once.
+        Otherwise, both parts are computed independently.
+
+        Args :
+            day (int): Day for which we want to retrieve the solutions.
+            isCacheUsed (bool): Boolean indicating whether the solutions already computed and stored on the disk can be used.
+            inputSource (PathLike | str | bytes | None): Input to solve instead of the file of the day in "textfiles" (see getSolution).
+
+        Returns:
+            A tuple containing the solution of the first part and the solution of the second part.
+        """
+        nameOfFunction: str = f"_day_{day:02d}_Parts"       # Name of the method solving both parts at once.
+
+        # Solve the given input instead of the file of the day.
+        if inputSource is not None:
+            with ReadFile.useInputSource(day, inputSource):
+                return Year2015_Solution.getSolutions(day, isCacheUsed)
+
+        # Without a method sharing the work, each part is solved on its own.
+        if not hasattr(Year2015_Solution, nameOfFunction):
+            return (Year2015_Solution.getSolution(day, True, isCacheUsed=isCacheUsed), Year2015_Solution.getSolution(day, False, isCacheUsed=isCacheUsed))
+
+        # Try to obtain both solutions from the shared computation.
+        try:
+            methodToCall: Callable[[], tuple[int | str, int | str]] = getattr(Year2015_Solution, nameOfFunction)
+
+            if not isCacheUsed:
+                return methodToCall()
+
+            # Look for both solutions in the cache, and compute them only if one of them is not there.
+            from AnswerCache import AnswerCache
+            keysInCache: tuple[str, str] = (AnswerCache.getKey(Year2015_Solution, day, True), AnswerCache.getKey(Year2015_Solution, day, False))
+            solutions: tuple[int | str | None, int | str | None] = (AnswerCache.get(keysInCache[0]), AnswerCache.get(keysInCache[1]))
+
+            if None in solutions:
+                solutions = methodToCall()
+                AnswerCache.store(keysInCache[0], solutions[0])
+                AnswerCache.store(keysInCache[1], solutions[1])
+
+            return solutions
+
+        except Exception as e:
+            return ("An error occured on the method called.", "An error occured on the method called.")
+
+    @staticmethod
+    async def getSolutionAsync(day: int, isFirstPart: bool, isCacheUsed: bool = True, timeout: float | None = None) -> int | str | LimitExceeded:
+        """
+        Function called from asyncio code to obtain the solution for any day, without blocking the event loop.
+        The solution is computed in an executor (see AsyncSolver.setExecutor), and identical requests made at the same time
+        share one computation. The request can be cancelled.
+
+        Args :
+            day (int): Day for which we want to retrieve the solution.
+            isFirstPart (bool): Boolean indicating whether we want to retrieve the solution for part 1 or part 2.
+            isCacheUsed (bool): Boolean indicating whether the solutions already computed and stored on the disk can be used.
+            timeout (float | None): If given, the solution is stopped after timeout seconds, and a LimitExceeded is returned instead.
+
+        Returns:
+            The solution of the day and part.
+        """
+        # asyncio and the executors are imported only when they are used.
+        from AsyncSolver import AsyncSolver
+
+        return await AsyncSolver.solve(day, isFirstPart, isCacheUsed, timeout)
+
+    @staticmethod
+    def _day_01_helper_getFloor(instructions: Iterable[str]) -> int:
+        """
+        Helper for the solution for day 1. Follow the instructions to find the floor where Santa ends up.
         https://adventofcode.com/2015/day/1
 
+        Args:
+            instructions (Iterable[str]): Instructions for Santa, in one or more chunks (the input, or the parts of a stream read one after another).
+
         Returns:
             Floor number where Santa ends up.
         """
-        line: str               # Input of the problem, stored as a string.
-        floorNumber: int = 0    # Number of the floor where Santas is located.
-        instruction: str        # Instruction for Santa to follow.
-
-        # Get the puzzle input.
-        line = ReadFile.getLine(1)
-        
-        # For each instruction, increase or decrease the floor number.
-        for instruction in line:
-            if '(' == instruction:
-                floorNumber += 1
-            elif ')' == instruction:
-                floorNumber -= 1
-        
-        # Return Santa's floor at the end.
-        return floorNumber
+        # Each chunk moves Santa up by its number of '(' and down by its number of ')'.
+        return sum(chunk.count('(') - chunk.count(')') for chunk in instructions)
 
     @staticmethod
-    def _day_01_Part_2() -> int:
+    def _day_01_helper_getPositionOfBasement(instructions: Iterable[str]) -> int:
         """
-        Get solution for day 1, Part 2.
+        Helper for the solution for day 1. Follow the instructions until Santa enters the basement. The chunks after are not read.
         https://adventofcode.com/2015/day/1#part2
 
+        Args:
+            instructions (Iterable[str]): Instructions for Santa, in one or more chunks.
+
         Returns:
-            Position of the first character that brings Santa into the basement.
+            Position of the first character that brings Santa into the basement, -1 if Santa never enters it.
         """
-        line: str                   # Input of the problem, stored as a string.
         instruction: str            # Instruction for Santa to follow.
         indexOfCharacter: int = 0   # Index of the current character.
         floorNumber: int = 0        # Number of the floor where Santas is located.
 
-        # Get the puzzle input.
-        line = ReadFile.getLine(1)
-        
-        # For each instruction, increase or decrease the floor number.
-        for instruction in line:
+        for chunk in instructions:
+            # A chunk that does not go down more than Santa's floor cannot bring him into the basement.
+            if floorNumber >= chunk.count(')'):
+                floorNumber += chunk.count('(') - chunk.count(')')
+                indexOfCharacter += len(chunk)
+                continue
+
+            # Otherwise, follow the instructions of the chunk one by one.
+            for instruction in chunk:
+
+                # Increment the number of the character giving the instruction to Santa.
+                indexOfCharacter += 1
+                if '(' == instruction:
+                    floorNumber += 1
+                elif ')' == instruction:
+                    floorNumber -= 1
+                    # If Santa has reached the basement, return the index of the current character.
+                    if -1 == floorNumber:
+                        return indexOfCharacter
 
-            # Increment the number of the character giving the instruction to Santa.
-            indexOfCharacter += 1
-            if '(' == instruction:
-                floorNumber += 1
-            elif ')' == instruction:
-                floorNumber -= 1
-                # If Santa has reached the basement, return the index of the current character.
-                if -1 == floorNumber:
-                    return indexOfCharacter
-        
         # Return -1 if no character leads Santa to enter the basement. Should not occur on well constructed inputs.
         return -1
 
     @staticmethod
-    def _day_02_Part_1() -> int:
+    def _day_01_Part_1() -> int:
         """
-        Get solution for day 2, Part 1.
+        Get solution for day 1, Part 1.
+        https://adventofcode.com/2015/day/1
+
+        Returns:
+            Floor number where Santa ends up.
+        """
+        # Follow the instructions of the puzzle input, given as one chunk.
+        return Year2015_Solution._day_01_helper_getFloor((ReadFile.getLine(1),))
+
+    @staticmethod
+    def _day_01_Part_2() -> int:
+        """
+        Get solution for day 1, Part 2.
+        https://adventofcode.com/2015/day/1#part2
+
+        Returns:
+            Position of the first character that brings Santa into the basement.
+        """
+        # Follow the instructions of the puzzle input, given as one chunk.
+        return Year2015_Solution._day_01_helper_getPositionOfBasement((ReadFile.getLine(1),))
+
+    @staticmethod
+    def _day_02_helper_getWrappingOfGift(line: str) -> int:
+        """
+        Helper for the solution for day 2. Compute the wrapping paper needed for one gift.
         https://adventofcode.com/2015/day/2
 
+        Args:
+            line (str): Line of the input, representing the dimensions of the gift.
+
         Returns:
-            Number of square feet of wrapping paper needed to wrap gifts.
+            Number of square feet of wrapping paper needed to wrap the gift.
         """
-        lines: list[str]                # Input of the problem, stored as a list of strings.
-        line: str                       # Input of the problem, representing the dimensions of each gift.
-        squareFootWrapping: int = 0     # Number of square feet of wrapping paper required.
         dimensionsAsStr: list[str]      # Strings representing the dimensions of a gift.
         dimensionsAsInt: list[int]      # Integer list containing the dimensions of a gift.
 
-        # Get the puzzle input.
-        lines = ReadFile.getLines(2)
-        
-        # For each set of dimensions, calculate the wrapping paper required and add it to the total.
-        for line in lines:
-
-            # Convert gift dimensions into integers.
-            dimensionsAsStr = split("x", line)
-            dimensionsAsInt = [(int)(dimension) for dimension in dimensionsAsStr]
-
-            # Compute the size of wrapping paper needed for this package, and add the value to the total.
-            squareFootWrapping += 2 * (dimensionsAsInt[0]*dimensionsAsInt[1] + dimensionsAsInt[1]*dimensionsAsInt[2] + dimensionsAsInt[0]*dimensionsAsInt[2])
-            squareFootWrapping += min(dimensionsAsInt[0]*dimensionsAsInt[1], dimensionsAsInt[1]*dimensionsAsInt[2], dimensionsAsInt[0]*dimensionsAsInt[2])
+        # Convert gift dimensions into integers.
+        dimensionsAsStr = split("x", line)
+        dimensionsAsInt = [(int)(dimension) for dimension in dimensionsAsStr]
 
-        # Return the number of square feet of wrapping paper required.
-        return squareFootWrapping
+        # Compute the size of wrapping paper needed for this package: its surface, and the surface of its smallest side.
+        return 2 * (dimensionsAsInt[0]*dimensionsAsInt[1] + dimensionsAsInt[1]*dimensionsAsInt[2] + dimensionsAsInt[0]*dimensionsAsInt[2]) \
+               + min(dimensionsAsInt[0]*dimensionsAsInt[1], dimensionsAsInt[1]*dimensionsAsInt[2], dimensionsAsInt[0]*dimensionsAsInt[2])
 
     @staticmethod
-    def _day_02_Part_2() -> int:
+    def _day_02_helper_getRibbonOfGift(line: str) -> int:
         """
-        Get solution for day 2, Part 2.
+        Helper for the solution for day 2. Compute the length of ribbon needed for one gift.
         https://adventofcode.com/2015/day/2#part2
 
+        Args:
+            line (str): Line of the input, representing the dimensions of the gift.
+
         Returns:
-            Length of ribbon required for gifts.
+            Length of ribbon required for the gift.
         """
-        lines: list[str]                # Input of the problem, stored as a list of strings.
-        line: str                       # Input of the problem, representing the dimensions of each gift.
-        lengthRibbon: int = 0           # Length of ribbon required.
         dimensionsAsStr: list[str]      # Strings representing the dimensions of a gift.
         dimensionsAsInt: list[int]      # Integer list containing the dimensions of a gift.
-        
-        # Get the puzzle input.
-        lines = ReadFile.getLines(2)
 
-        # For each set of dimensions, calculate the length of ribbon required and add it to the total.
-        for line in lines:
+        # Convert gift dimensions into integers.
+        dimensionsAsStr = split("x", line)
+        dimensionsAsInt = [(int)(dimension) for dimension in dimensionsAsStr]
+
+        # Compute the length of ribbon needed for this package: the bow, and the smallest perimeter.
+        return dimensionsAsInt[0] * dimensionsAsInt[1] * dimensionsAsInt[2] + 2 * (sum(dimensionsAsInt)) - 2 * max(dimensionsAsInt)
+
+    @staticmethod
+    def _day_02_Part_1() -> int:
+        """
+        Get solution for day 2, Part 1.
+        https://adventofcode.com/2015/day/2
 
-            # Convert gift dimensions into integers.
-            dimensionsAsStr = split("x", line)
-            dimensionsAsInt = [(int)(dimension) for dimension in dimensionsAsStr]
+        Returns:
+            Number of square feet of wrapping paper needed to wrap gifts.
+        """
+        # For each set of dimensions, calculate the wrapping paper required and add it to the total.
+        return sum(Year2015_Solution._day_02_helper_getWrappingOfGift(line) for line in ReadFile.iterLines(2))
 
-            # Compute the length of ribbon needed for this package, and add the value to the total.
-            lengthRibbon += dimensionsAsInt[0] * dimensionsAsInt[1] * dimensionsAsInt[2]
-            lengthRibbon += 2 * (sum(dimensionsAsInt))
-            lengthRibbon -= 2 * max(dimensionsAsInt)
+    @staticmethod
+    def _day_02_Part_2() -> int:
+        """
+        Get solution for day 2, Part 2.
+        https://adventofcode.com/2015/day/2#part2
 
-        # Return the length of ribbon required.
-        return lengthRibbon
+        Returns:
+            Length of ribbon required for gifts.
+        """
+        # For each set of dimensions, calculate the length of ribbon required and add it to the total.
+        return sum(Year2015_Solution._day_02_helper_getRibbonOfGift(line) for line in ReadFile.iterLines(2))
     
     @staticmethod
-    def _day_03_Part_1() -> int:
+    def _day_03_helper_getNumberOfVisitedHouses(instructions: Iterable[str], numberOfSantas: int) -> int:
         """
-        Get solution for day 3, Part 1.
+        Helper for the solution for day 3. Follow the instructions, given in turn to each Santa, and count the houses visited.
         https://adventofcode.com/2015/day/3
 
+        Args:
+            instructions (Iterable[str]): Instructions for the Santas, in one or more chunks (the input, or the parts of a stream read one after another).
+            numberOfSantas (int): Number of Santas sharing the instructions (1 for Santa alone, 2 with Robo-Santa).
+
         Returns:
             Number of houses that receive at least one gift.
         """
-        line: str                                   # Input of the problem, stored as a string.
-        currentCoordinates: list[int]               # Santa's coordinates at a given iteration.
-        visitedCoordinates: set[tuple[int, int]]    # Coordinates of homes receiving at least one gift.
-        mapOfDirections: dict[str, list[int]]       # Displacement dictionary based on the character of the input puzzle.
-
-        # Get the puzzle input.
-        line = ReadFile.getLine(3)
-
-        # Initialize the variables for Santa's positions and the houses visited.
-        currentCoordinates = [0, 0]
-        visitedCoordinates = {(tuple[int, int])(currentCoordinates)}
+        coordinates: list[list[int]] = [[0, 0] for _ in range(numberOfSantas)]     # Coordinates of each Santa.
+        visitedCoordinates: set[tuple[int, int]] = {(0, 0)}                         # Coordinates of homes receiving at least one gift.
+        indexOfSanta: int = 0                                                       # Index of the Santa following the next instruction.
+        mapOfDirections: dict[str, list[int]]                                       # Displacement dictionary based on the character of the input puzzle.
 
         # Initialize the directions dictionary.
         mapOfDirections = {'<': [-1, 0], '>': [1, 0], '^': [0, 1], 'v': [0, -1]}
-        
-        # For each instruction, calculate the new coordinate and add it to the set of visited coordinates.
-        for letter in line:
-            currentCoordinates[0] += mapOfDirections[letter][0]
-            currentCoordinates[1] += mapOfDirections[letter][1]
 
-            visitedCoordinates.add((tuple[int, int])(currentCoordinates))
-        
-        # Return the number of houses visited by Santa.
+        # For each instruction, calculate the new coordinate of the Santa and add it to the set of visited coordinates.
+        # The Santas take the instructions in turn, including from one chunk to the next.
+        for chunk in instructions:
+            for letter in chunk:
+                coordinates[indexOfSanta][0] += mapOfDirections[letter][0]
+                coordinates[indexOfSanta][1] += mapOfDirections[letter][1]
+
+                visitedCoordinates.add((coordinates[indexOfSanta][0], coordinates[indexOfSanta][1]))
+                indexOfSanta = (indexOfSanta + 1) % numberOfSantas
+
+        # Return the number of houses visited.
         return len(visitedCoordinates)
+
+    @staticmethod
+    def _day_03_Part_1() -> int:
+        """
+        Get solution for day 3, Part 1.
+        https://adventofcode.com/2015/day/3
+
+        Returns:
+            Number of houses that receive at least one gift.
+        """
+        # Santa follows every instruction of the puzzle input, given as one chunk.
+        return Year2015_Solution._day_03_helper_getNumberOfVisitedHouses((ReadFile.getLine(3),), 1)
     
     @staticmethod
     def _day_03_Part_2() -> int:
@@ -208,44 +382,11 @@ class Year2015_Solution():
         Returns:
             Number of house that receives at least one present.
         """
-        line: str                                   # Input of the problem, stored as a string.
-        currentCoordinates: list[int]               # Santa's coordinates at a given iteration.
-        visitedCoordinates: set[tuple[int, int]]    # Coordinates of homes receiving at least one gift.
-        mapOfDirections: dict[str, list[int]]       # Displacement dictionary based on the character of the input puzzle.
-        direction: int                              # Index to the direction on the instructions.
-        
-        # Get the puzzle input.
-        line = ReadFile.getLine(3)
-
-        # Initialize the variables for Santa's positions and the houses visited.
-        currentCoordinates = [0, 0]
-        visitedCoordinates = {(tuple[int, int])(currentCoordinates)}
-
-        # Initialize the directions dictionary.
-        mapOfDirections = {'<': [-1, 0], '>': [1, 0], '^': [0, 1], 'v': [0, -1]}
-        
-        # For each instruction, calculate the new coordinate and add it to the set of visited coordinates.
-        for direction in range(0, len(line), 2):
-            currentCoordinates[0] += mapOfDirections[line[direction]][0]
-            currentCoordinates[1] += mapOfDirections[line[direction]][1]
-
-            visitedCoordinates.add((tuple[int, int])(currentCoordinates))
-        
-        # Re-initialize coordinates to Robo-Santa's position.
-        currentCoordinates = [0, 0]
-
-        # For each instruction, calculate the new coordinate and add it to the set of visited coordinates.
-        for direction in range(1, len(line), 2):
-            currentCoordinates[0] += mapOfDirections[line[direction]][0]
-            currentCoordinates[1] += mapOfDirections[line[direction]][1]
-
-            visitedCoordinates.add((tuple[int, int])(currentCoordinates))
-        
-        # Return the number of houses visited.
-        return len(visitedCoordinates)
+        # Santa and Robo-Santa follow the instructions of the puzzle input in turn.
+        return Year2015_Solution._day_03_helper_getNumberOfVisitedHouses((ReadFile.getLine(3),), 2)
     
     @staticmethod
-    def _day_04_helper_findFirstWithNZerosWhenEncoded(input: str, numberOfZeros: int) -> int:
+    def _day_04_helper_findFirstWithNZerosWhenEncoded(input: str, numberOfZeros: int, firstNumberToTry: int = 0) -> int:
         """
         Helper for the solution to day 4.
         Find the first number to concatenate at the end of the input in order to have numberOfZeros 0 at
@@ -258,9 +399,11 @@ class Year2015_Solution():
         Args:
             input (str): String to be followed by the output number to be encoded. 
             numberOfZeros (int): Number of zeros at the beginning of the coded string being searched for.
+            firstNumberToTry (int): First integer tested. Every integer before it is known not to conform to the rules.
         """
 
-        numberToConcatenate: int = 0        # Integer written at the beginning of the character string.
+        from hashlib import md5                         # Imported here, as only day 4 needs it.
+        numberToConcatenate: int = firstNumberToTry     # Integer written at the beginning of the character string.
         
         # While we don't have numberOfZeros 0 at the start of the encoded string, we continue with the next integer.
         while not md5(f"{input}{numberToConcatenate}".encode()).hexdigest().startswith("0" * numberOfZeros):
@@ -270,25 +413,42 @@ class Year2015_Solution():
         return numberToConcatenate
 
     @staticmethod
-    def _day_04_Part_1() -> int:
+    def _day_04_helper_findNumbersToConcatenate(numbersOfZeros: tuple[int, ...]) -> list[int]:
         """
-        Get solution for day 4, Part 1.
+        Helper for the solution to day 4. Find the numbers to concatenate to the puzzle input to have each given number of 0s,
+            in increasing order. An encoding starting with n + 1 0s also starts with n 0s, so each search continues from the previous answer.
         https://adventofcode.com/2015/day/4
 
         Returns:
-            Number of iterations to perform before there are five 0s at the start of the encoded string.
+            The smallest integer to concatenate for each number of 0s, in the same order.
+
+        Args:
+            numbersOfZeros (tuple[int, ...]): Numbers of 0s the encoded strings should start with, in increasing order.
         """
-        line: str                           # Input of the problem, stored as a string.
-        numberToConcatenate: int            # Integer to be written at the end of the string.
-        
+        line: str                                   # Input of the problem, stored as a string.
+        numbersToConcatenate: list[int] = []        # Output: Integer to be written at the end of the string for each number of 0s.
+
         # Get the puzzle input.
         line = ReadFile.getLine(4)
-        
-        # Retrieves the number to be concatenated at the end using the helper function.
-        numberToConcatenate = Year2015_Solution._day_04_helper_findFirstWithNZerosWhenEncoded(line, 5)
 
+        # Retrieves each number to be concatenated at the end, starting from the previous one.
+        for numberOfZeros in numbersOfZeros:
+            numbersToConcatenate.append(Year2015_Solution._day_04_helper_findFirstWithNZerosWhenEncoded(line, numberOfZeros,
+                                                                                                    numbersToConcatenate[-1] if numbersToConcatenate else 0))
+
+        return numbersToConcatenate
+
+    @staticmethod
+    def _day_04_Part_1() -> int:
+        """
+        Get solution for day 4, Part 1.
+        https://adventofcode.com/2015/day/4
+
+        Returns:
+            Number of iterations to perform before there are five 0s at the start of the encoded string.
+        """
         # Return the smallest integer to start with 5 zeros in the md5 encoding.
-        return numberToConcatenate
+        return Year2015_Solution._day_04_helper_findNumbersToConcatenate((5,))[0]
     
     @staticmethod
     def _day_04_Part_2() -> int:
@@ -299,69 +459,112 @@ class Year2015_Solution():
         Returns:
             Number of iterations to perform before there are six 0s at the start of the encoded string.
         """
-        line: str                           # Input of the problem, stored as a string.
-        numberToConcatenate: int            # Integer to be written at the end of the string.
-        
-        # Get the puzzle input.
-        line = ReadFile.getLine(4)
-        
-        # Retrieves the number to be concatenated at the end using the helper function.
-        numberToConcatenate = Year2015_Solution._day_04_helper_findFirstWithNZerosWhenEncoded(line, 6)
-
         # Return the smallest integer to start with 6 zeros in the md5 encoding.
-        return numberToConcatenate
+        return Year2015_Solution._day_04_helper_findNumbersToConcatenate((6,))[0]
+
+    @staticmethod
+    def _day_04_Parts() -> tuple[int, int]:
+        """
+        Get solutions for day 4, Part 1 and Part 2.
+        https://adventofcode.com/2015/day/4
+
+        Returns:
+            Number of iterations to perform before there are five, then six 0s at the start of the encoded string.
+        """
+        numberForFiveZeros: int             # Integer to be written at the end of the string to have five 0s.
+        numberForSixZeros: int              # Integer to be written at the end of the string to have six 0s.
+
+        # Search the number for six 0s from the one for five 0s.
+        numberForFiveZeros, numberForSixZeros = Year2015_Solution._day_04_helper_findNumbersToConcatenate((5, 6))
+
+        return (numberForFiveZeros, numberForSixZeros)
     
     @staticmethod
-    def _day_05_Part_1() -> int:
+    def _day_05_helper_isNice(line: str) -> bool:
         """
-        Get solution for day 5, Part 1.
+        Helper for the solution for day 5. Check if a string is nice.
         https://adventofcode.com/2015/day/5
 
+        Args:
+            line (str): String that might be nice.
+
         Returns:
-            Number of nice strings.
+            True if the string has 3 vowels, a double letter and no naughty pair, False otherwise.
         """
-        lines: list[str]                                        # All lines of the input of the problem.
-        line: str                                               # String representing the input and the strings that might be nine.
-        numberOfNiceString: int = 0                             # Number of nice strings found.
         listOfNaughty: list[str] = ["ab", "cd", "pq", "xy"]     # Set containing the naughty characters that should not be in the string.
         listOfVowels: list[str] = ['a', 'e', 'i', 'o', 'u']     # Set containing the different vowels.
+        numberOfVowels: int = 0                                 # Number of vowels in the string.
+        isContainingDouble: bool = False                        # States if a letter appears twice in a row.
 
-        # Retrieve the input of the problem.
-        lines = ReadFile.getLines(5)
+        # Check if first letter is a vowel.
+        if line[0] in listOfVowels:
+            numberOfVowels += 1
 
-        
-        # Iterating among all string and check if they respect the condition.
-        for line in lines:
-            numberOfVowels: int = 0
-            isContainingDouble: bool = False
-            isContainingNaughtyElement: bool = False
+        # Iterating among all pair of letter (starting by one)
+        for indexOfLetter in range(1, len(line)):
             
-            # Check if first letter is a vowel.
-            if line[0] in listOfVowels:
+            # Check if the pair is naughty
+            if line[indexOfLetter - 1: indexOfLetter + 1] in listOfNaughty:
+                return False
+            
+            # Check if we found at least one double
+            if line[indexOfLetter] == line[indexOfLetter - 1]:
+                isContainingDouble = True
+            
+            # Check if the letter is a vowel.
+            if line[indexOfLetter] in listOfVowels:
                 numberOfVowels += 1
 
-            # Iterating among all pair of letter (starting by one)
-            for indexOfLetter in range(1, len(line)):
-                
-                # Check if the pair is naughty
-                if line[indexOfLetter - 1: indexOfLetter + 1] in listOfNaughty:
-                    isContainingNaughtyElement = True
-                    break
-                
-                # Check if we found at least one double
-                if line[indexOfLetter] == line[indexOfLetter - 1]:
-                    isContainingDouble = True
-                
-                # Check if the letter is a vowel.
-                if line[indexOfLetter] in listOfVowels:
-                    numberOfVowels += 1
+        # The string is nice if all condition are met.
+        return isContainingDouble and (3 <= numberOfVowels)
 
-            # If all condition are met, we can increment by one the number of nice strings.
-            if isContainingDouble and (3 <= numberOfVowels) and not isContainingNaughtyElement:
-                numberOfNiceString += 1
+    @staticmethod
+    def _day_05_helper_isNiceWithNewRules(line: str) -> bool:
+        """
+        Helper for the solution for day 5. Check if a string is nice with the rules of part 2.
+        https://adventofcode.com/2015/day/5#part2
 
-        # Return the number of string that are nice.
-        return numberOfNiceString
+        Args:
+            line (str): String that might be nice.
+
+        Returns:
+            True if a pair appears twice without overlapping and a letter repeats with one letter between, False otherwise.
+        """
+        pairOfConsecutiveLetters: dict[str, int] = dict()      # Index of the first appearance of each pair of letters.
+        isPaternTwiceNotOverlapping: bool = False               # States if a pair of letters appears twice without overlapping.
+        isRepeatedWithOneSpace: bool = False                    # States if a letter is repeated with a letter in the middle.
+        
+        # Check if a letter is reated with a letter in the middle of them.
+        for indexOfLetter in range(2, len(line)):
+            if line[indexOfLetter] == line[indexOfLetter - 2]:
+                isRepeatedWithOneSpace = True
+                break
+        
+        # Check if a pair of two non-overlapping letters is in the string
+        for indexOfLetter in range(1, len(line)):
+            currentSubstring: str = line[indexOfLetter - 1: indexOfLetter + 1]
+            
+            if currentSubstring not in pairOfConsecutiveLetters:
+                pairOfConsecutiveLetters[currentSubstring] = indexOfLetter - 1
+            
+            elif pairOfConsecutiveLetters[currentSubstring] != (indexOfLetter - 2):
+                isPaternTwiceNotOverlapping = True
+                break
+
+        # The string is nice if all condition are met.
+        return isRepeatedWithOneSpace and isPaternTwiceNotOverlapping
+
+    @staticmethod
+    def _day_05_Part_1() -> int:
+        """
+        Get solution for day 5, Part 1.
+        https://adventofcode.com/2015/day/5
+
+        Returns:
+            Number of nice strings.
+        """
+        # Iterating among all string and count those that respect the condition.
+        return sum(Year2015_Solution._day_05_helper_isNice(line) for line in ReadFile.iterLines(5))
     
     @staticmethod
     def _day_05_Part_2() -> int:
@@ -372,42 +575,8 @@ class Year2015_Solution():
         Returns:
             Integer representing the number of nice strings.
         """
-        numberOfNiceString: int = 0                             # Number of nice strings found.
-        lines: list[str]                                        # All lines of the input of the problem.
-        line: str                                               # String representing the input and the strings that might be nine.
-
-        # Retrieve all lines of the input file
-        lines = ReadFile.getLines(5)
-
-        # Iterating among all string and check if they respect the condition.
-        for line in lines:
-            pairOfConsecutiveLetters: dict[str, int] = dict()
-            isPaternTwiceNotOverlapping: bool = False
-            isRepeatedWithOneSpace: bool = False
-            
-            # Check if a letter is reated with a letter in the middle of them.
-            for indexOfLetter in range(2, len(line)):
-                if line[indexOfLetter] == line[indexOfLetter - 2]:
-                    isRepeatedWithOneSpace = True
-                    break
-            
-            # Check if a pair of two non-overlapping letters is in the string
-            for indexOfLetter in range(1, len(line)):
-                currentSubstring: str = line[indexOfLetter - 1: indexOfLetter + 1]
-                
-                if currentSubstring not in pairOfConsecutiveLetters:
-                    pairOfConsecutiveLetters[currentSubstring] = indexOfLetter - 1
-                
-                elif pairOfConsecutiveLetters[currentSubstring] != (indexOfLetter - 2):
-                    isPaternTwiceNotOverlapping = True
-                    break
-
-            # If all condition are met, we can increment by one the number of nice strings.
-            if isRepeatedWithOneSpace and isPaternTwiceNotOverlapping:
-                numberOfNiceString += 1
-
-        # Return the number of string that are nice.
-        return numberOfNiceString
+        # Iterating among all string and count those that respect the condition.
+        return sum(Year2015_Solution._day_05_helper_isNiceWithNewRules(line) for line in ReadFile.iterLines(5))
     
     @staticmethod
     def _day_06_Part_1() -> int:
@@ -419,30 +588,26 @@ class Year2015_Solution():
             Integer representing the number of lights are lit.
         """
         lightsGrid: list[list[int]] = [[0 for _ in range(1000)] for _ in range(1000)]     # Grid that contains the lights information
-        lines: list[str]                                                                  # All lines of the input of the problem.
-        line: str                                                                         # String representing the input and the strings that might be nine.
+        instructions: Iterator[tuple[str, int, int, int, int]]                            # Action and corners of each instruction.
 
-        # Retrieve all lines of the input file
-        lines = ReadFile.getLines(6)
+        # Retrieve the instructions of the input file, parsed while they are read.
+        instructions = InputParser.parseDay06()
 
         # Iterating among all instructions
-        for line in lines:
-            # Retrieve the integers values
-            numbers = findall(r'\b\d+\b', line)
-            numbers = [int(e) for e in numbers]
+        for action, *numbers in instructions:
 
             # Switch on all lights on the rectangle
-            if line.startswith("turn on"):
+            if "turn on" == action:
                 for i in range(numbers[0], numbers[2] + 1):
                     for j in range(numbers[1], numbers[3] + 1):
                         lightsGrid[i][j] = 1
             # Switch off all lights on the rectangle
-            elif line.startswith("turn off"):
+            elif "turn off" == action:
                 for i in range(numbers[0], numbers[2] + 1):
                     for j in range(numbers[1], numbers[3] + 1):
                         lightsGrid[i][j] = 0
             # Toggle all lights on the rectangle
-            elif line.startswith("toggle"):
+            elif "toggle" == action:
                 for i in range(numbers[0], numbers[2] + 1):
                     for j in range(numbers[1], numbers[3] + 1):
                         lightsGrid[i][j] = 1 - lightsGrid[i][j]
@@ -460,30 +625,26 @@ class Year2015_Solution():
             Integer representing the total brightness.
         """
         lightsGrid: list[list[int]] = [[0 for _ in range(1000)] for _ in range(1000)]     # Grid that contains the lights information
-        lines: list[str]                                                                  # All lines of the input of the problem.
-        line: str                                                                         # String representing the input and the strings that might be nine.
+        instructions: Iterator[tuple[str, int, int, int, int]]                            # Action and corners of each instruction.
 
-        # Retrieve all lines of the input file
-        lines = ReadFile.getLines(6)
+        # Retrieve the instructions of the input file, parsed while they are read.
+        instructions = InputParser.parseDay06()
 
         # Iterating among all instructions
-        for line in lines:
-            # Retrieve the integers values
-            numbers = findall(r'\b\d+\b', line)
-            numbers = [int(e) for e in numbers]
+        for action, *numbers in instructions:
 
             # Increase the brightness on the rectangle
-            if line.startswith("turn on"):
+            if "turn on" == action:
                 for i in range(numbers[0], numbers[2] + 1):
                     for j in range(numbers[1], numbers[3] + 1):
                         lightsGrid[i][j] += 1
             # Decrease the brightness on the rectangle
-            elif line.startswith("turn off"):
+            elif "turn off" == action:
                 for i in range(numbers[0], numbers[2] + 1):
                     for j in range(numbers[1], numbers[3] + 1):
                         lightsGrid[i][j] = max(0, lightsGrid[i][j] - 1)
             # Increase two times the brightness on the rectangle
-            elif line.startswith("toggle"):
+            elif "toggle" == action:
                 for i in range(numbers[0], numbers[2] + 1):
                     for j in range(numbers[1], numbers[3] + 1):
                         lightsGrid[i][j] += 2
@@ -492,7 +653,7 @@ class Year2015_Solution():
         return sum(sum(lightsGrid[i]) for i in range(1000))
     
     @staticmethod
-    def _day_07_helper_getDictAndOperations() -> tuple[dict[str, int], list[tuple[str, str, str, str]]]:
+    def _day_07_helper_getDictAndOperations() -> tuple[dict[str, int], list[CircuitOperation]]:
         """
         Helper for the solution for day 7. Construct dictionnaries of wires and the list of all the operations.
         https://adventofcode.com/2015/day/7
@@ -500,78 +661,55 @@ class Year2015_Solution():
         Returns:
             A tuple containing two elements:
                 - A dictionnary. Keys: Name of wire / integer: Both are strings. Values: Value of the signal in the key.
-                - A tuple containing 4 elements:
-                    - 0 and 2 are the input of the operation.
-                    - 1 is the string reprenseting the operation.
-                    - 3 is the output wire.
+                - A list of the operations (see CircuitOperation) whose inputs are not all known yet.
         """
         dictOfValues: dict[str, int] = {}                   # First part of the output.
-        operations: list[tuple[str, str, str, str]] = []    # Second part of the output
-        patternString: str = r"\b[a-zA-Z0-9]+\b"            # Patterns for finding the elements of the operation in each line
-        lines: list[str]                                    # All lines of the input of the problem.
-        line: str                                           # String representing the input and the strings that might be nine.
-        tabOfVal: list[str]                                 # Table that will contains the elements of the REGEX.
+        operations: list[CircuitOperation] = []             # Second part of the output
+        operation: CircuitOperation                         # Operation of the input: first input, operator, second input, output.
         
-        # Retrieve all lines of the input file
-        lines = ReadFile.getLines(7)
+        # Retrieve every operations that needs to be done, parsed from the input file.
+        for operation in InputParser.parseDay07():
             
-        # Retrieve every operations that needs to be done.
-        for line in lines:
+            # Direct affectation of a value: we can store the value of the wire in the dict.
+            if "EQUAL" == operation.operator and operation.left.isnumeric():
+                dictOfValues[operation.output] = int(operation.left)
 
-            # Retrieve the operation
-            tabOfVal = findall(patternString, line)
+            # Direct affectation of a wire or NOT operator: both wire should be saved (if not done) in the dict to make the operation latter.
+            elif "" == operation.right:
+                operations.append(operation)
+                if operation.left not in dictOfValues:
+                    dictOfValues[operation.left] = -1
+                if operation.output not in dictOfValues:
+                    dictOfValues[operation.output] = -1
 
-            # len 2 is only for direct afectation
-            if 2 == len(tabOfVal):
-                # If the first value is numeric, then we can store the value of the wire in the dict.
-                if tabOfVal[0].isnumeric():
-                    dictOfValues[tabOfVal[1]] = int(tabOfVal[0])
-                
-                # Else, both wire should be saved (if not done) in the dict to make the equal latter.
-                else:
-                    operations.append((tabOfVal[0], "EQUAL", "", tabOfVal[1]))
-                    if tabOfVal[0] not in dictOfValues:
-                        dictOfValues[tabOfVal[0]] = -1
-                    if tabOfVal[1] not in dictOfValues:
-                        dictOfValues[tabOfVal[1]] = -1
-            
-            # len 3 is only when a NOT operator is done.
-            # Both wire should be saved (if not done) in the dict to make the not latter.
-            elif 3 == len(tabOfVal):
-                operations.append((tabOfVal[1], "NOT", "" , tabOfVal[2]))
-                if tabOfVal[1] not in dictOfValues:
-                        dictOfValues[tabOfVal[1]] = -1
-                if tabOfVal[2] not in dictOfValues:
-                        dictOfValues[tabOfVal[2]] = -1
-            
-            # len 4 is for all other operators: AND, OR, LSHIFT, RSHIFT
+            # All other operators: AND, OR, LSHIFT, RSHIFT
             # Wires should be saved (if not done) in the dict to make the operator latter.
             else :
-                operations.append(tuple[str, str, str, str](tabOfVal))
-                if tabOfVal[0] not in dictOfValues:
-                    dictOfValues[tabOfVal[0]] = int(tabOfVal[0]) if tabOfVal[0].isnumeric() else -1
-                if tabOfVal[2] not in dictOfValues:
-                    dictOfValues[tabOfVal[2]] = int(tabOfVal[2]) if tabOfVal[2].isnumeric() else -1
-                if tabOfVal[3] not in dictOfValues:
-                    dictOfValues[tabOfVal[3]] = -1
+                operations.append(operation)
+                if operation.left not in dictOfValues:
+                    dictOfValues[operation.left] = int(operation.left) if operation.left.isnumeric() else -1
+                if operation.right not in dictOfValues:
+                    dictOfValues[operation.right] = int(operation.right) if operation.right.isnumeric() else -1
+                if operation.output not in dictOfValues:
+                    dictOfValues[operation.output] = -1
         
         return (dictOfValues, operations)
 
     @staticmethod
-    def _day_07_helper_findValueOfWireA(dictOfValues: dict[str, int], operations: list[tuple[str, str, str, str]]) -> int:
+    def _day_07_helper_findValueOfWireA(dictOfValues: dict[str, int], operations: list[CircuitOperation]) -> int:
         """
         Helper for the solution for day 7. Compute the different operations while the value of wire A is not found.
         https://adventofcode.com/2015/day/7
 
         Args:
             - dictOfValues (dict[str, int]): Dictionnary containing all wire and their values
-            - operations (list[tuple[str, str, str, str]]): List of tuple containing all operations that needs to be done.
+            - operations (list[CircuitOperation]): List of all operations that needs to be done.
         Returns:
             Value of the Wire A as soon as we got it.
         """
 
         dictOfValuesLocal: dict[str, int] = dictOfValues.copy()                 # Copy of the dict, to avoid overwritting values
-        operationsLocal: list[tuple[str, str, str, str]] = operations[:]        # Copy of the operation, to avoid delete the needed operation
+        operationsLocal: list[CircuitOperation] = operations[:]                 # Copy of the operation, to avoid delete the needed operation
         
         functionsMap = {"AND": lambda a, b: a & b,                              # Map of the function, that allows to take a string and make the
                         "OR": lambda a, b: a ^ b,                               # corresponding operation
@@ -581,47 +719,68 @@ class Year2015_Solution():
         # While the value of the Wire a is not found, we iterate among all operations to make those that are possible
         while -1 == dictOfValuesLocal["a"]:
             for operationIndex in range(len(operationsLocal) -1, -1, -1):
+                operation: CircuitOperation = operationsLocal[operationIndex]
                 
                 # NOT and EQUAL operations only
-                if "" == operationsLocal[operationIndex][2]:
-                    if -1 != dictOfValuesLocal[operationsLocal[operationIndex][0]]:
-                        if "NOT" == operationsLocal[operationIndex][1]:
-                            dictOfValuesLocal[operationsLocal[operationIndex][3]] = 65535 - dictOfValuesLocal[operationsLocal[operationIndex][0]]
-                        elif "EQUAL" == operationsLocal[operationIndex][1]:
-                            dictOfValuesLocal[operationsLocal[operationIndex][3]] = dictOfValuesLocal[operationsLocal[operationIndex][0]]
+                if "" == operation.right:
+                    if -1 != dictOfValuesLocal[operation.left]:
+                        if "NOT" == operation.operator:
+                            dictOfValuesLocal[operation.output] = 65535 - dictOfValuesLocal[operation.left]
+                        elif "EQUAL" == operation.operator:
+                            dictOfValuesLocal[operation.output] = dictOfValuesLocal[operation.left]
                         
                         del operationsLocal[operationIndex]
                 
                 # All other operations: OR, AND, LSHIFT, RSHIFT. Use the operation declared in functionsMap
-                elif -1 != dictOfValuesLocal[operationsLocal[operationIndex][0]] and -1 != dictOfValuesLocal[operationsLocal[operationIndex][2]] :
-                    if operationsLocal[operationIndex][1] in ("AND", "OR", "LSHIFT", "RSHIFT"):
-                        dictOfValuesLocal[operationsLocal[operationIndex][3]] = functionsMap[operationsLocal[operationIndex][1]](dictOfValuesLocal[operationsLocal[operationIndex][0]], dictOfValuesLocal[operationsLocal[operationIndex][2]])
+                elif -1 != dictOfValuesLocal[operation.left] and -1 != dictOfValuesLocal[operation.right] :
+                    if operation.operator in ("AND", "OR", "LSHIFT", "RSHIFT"):
+                        dictOfValuesLocal[operation.output] = functionsMap[operation.operator](dictOfValuesLocal[operation.left], dictOfValuesLocal[operation.right])
                     
                     del operationsLocal[operationIndex]
         
         return dictOfValuesLocal["a"]
     
     @staticmethod
-    def _day_07_Part_1() -> int:
+    def _day_07_helper_getValuesOfWireA(numberOfIterations: int) -> list[int]:
         """
-        Get solution for day 7, Part 1
+        Helper for the solution for day 7. Compute the value of the wire A, then overwrite the value of the wire B with it
+            and compute the value of the wire A again, numberOfIterations times.
         https://adventofcode.com/2015/day/7
 
         Returns:
-            Integer representing the value of the signal in the wire A.
+            The value of the wire A after each iteration.
+
+        Args:
+            numberOfIterations (int): Number of times the value of the wire A is computed.
         """
         dictOfValues: dict[str, int]                                                        # Dict containing the information of all wires.
-        operations: list[tuple[str, str, str, str]]                                         # List of all the operations given in the input.
-        outputOfA: int                                                                      # Value returned by the helper function.
+        operations: list[CircuitOperation]                                                  # List of all the operations given in the input.
+        outputsOfA: list[int] = []                                                          # Output: Value of the wire A after each iteration.
 
         # Retrieve dict and list from the helper function
         dictOfValues, operations = Year2015_Solution._day_07_helper_getDictAndOperations()
 
-        # Compute the value of the wires until the value of A is found
-        outputOfA = Year2015_Solution._day_07_helper_findValueOfWireA(dictOfValues, operations)
+        for _ in range(numberOfIterations):
+            # Overwrite the value of wire B with the previous value of A, if any.
+            if outputsOfA:
+                dictOfValues["b"] = outputsOfA[-1]
+
+            # Compute the value of the wires until the value of A is found
+            outputsOfA.append(Year2015_Solution._day_07_helper_findValueOfWireA(dictOfValues, operations))
 
+        return outputsOfA
+
+    @staticmethod
+    def _day_07_Part_1() -> int:
+        """
+        Get solution for day 7, Part 1
+        https://adventofcode.com/2015/day/7
+
+        Returns:
+            Integer representing the value of the signal in the wire A.
+        """
         # Return the value of the wire A
-        return outputOfA
+        return Year2015_Solution._day_07_helper_getValuesOfWireA(1)[-1]
     
     @staticmethod
     def _day_07_Part_2() -> int:
@@ -632,70 +791,99 @@ class Year2015_Solution():
         Returns:
             Integer representing the value of the signal in the wire A after 2 iteration (value of A overwrite the value of B).
         """
-        dictOfValues: dict[str, int]                                                        # Dict containing the information of all wires.
-        operations: list[tuple[str, str, str, str]]                                         # List of all the operations given in the input.
-        outputOfA: int                                                                      # Value returned by the helper function.
-
-        # Retrieve dict and list from the helper function
-        dictOfValues, operations = Year2015_Solution._day_07_helper_getDictAndOperations()
+        # Return the value of the wire A after the second iteration
+        return Year2015_Solution._day_07_helper_getValuesOfWireA(2)[-1]
+    
+    @staticmethod
+    def _day_07_Parts() -> tuple[int, int]:
+        """
+        Get solutions for day 7, Part 1 and Part 2
+        https://adventofcode.com/2015/day/7
 
-        # Compute the value of the wires until the value of A is found
-        outputOfA = Year2015_Solution._day_07_helper_findValueOfWireA(dictOfValues, operations)
+        Returns:
+            Values of the signal in the wire A after the first and the second iteration.
+        """
+        firstOutputOfA: int                                                                 # Value of the wire A after the first iteration.
+        secondOutputOfA: int                                                                # Value of the wire A after the second iteration.
 
-        # Overwrite the value of wire B and reset the value of A
-        dictOfValues["b"] = outputOfA
-        
-        # Compute the value of the wires until the value of A is found
-        outputOfA = Year2015_Solution._day_07_helper_findValueOfWireA(dictOfValues, operations)
+        # The second iteration starts from the wires of the first one.
+        firstOutputOfA, secondOutputOfA = Year2015_Solution._day_07_helper_getValuesOfWireA(2)
 
-        # Return the value of the wire A
-        return outputOfA
+        return (firstOutputOfA, secondOutputOfA)
     
     @staticmethod
-    def _day_08_Part_1() -> int:
+    def _day_08_helper_getCodeMinusLitteral(line: str) -> int:
         """
-        Get solution for day 8, Part 1
+        Helper for the solution for day 8. Count the characters of code of a string that are not in its litteral.
         https://adventofcode.com/2015/day/8
 
+        Args:
+            line (str): Line of the input, the code of the string (surrounding spaces are ignored).
+
+        Returns:
+            Number of characters of code of the string minus the number of characters of its litteral.
+        """
+        numberCharacterOfCode: int          # Number of character that are written in the code
+        numberCharacterLitteral: int        # Number of character that it represents.
+        charIndex: int = 0                  # Index of the current character of the code.
+
+        # Retrieve the number of character on the line, add it to the code
+        # And delete 2 for Litteral for the first and last "
+        line = line.strip()
+        numberCharacterOfCode = len(line)
+        numberCharacterLitteral = len(line) - 2
+
+        # Iterating among all letters
+        while charIndex < len(line):
+            # If we find a \ character, it means that there are more characters for code than litteral
+            if "\\" == line[charIndex]:
+                # If the next one is a \ or a ", there are 2 characters of code for 1 litteral
+                if line[charIndex + 1] in ("\"", "\\"):
+                    numberCharacterLitteral -= 1
+                    charIndex += 1
+                # If the next one is a #, there are 4 characters of code for 1 litteral
+                elif "x" == line[charIndex + 1]:
+                    numberCharacterLitteral -= 3
+                    charIndex += 3
+            charIndex += 1
+
+        # Return the number of characters that are done for code only.
+        return numberCharacterOfCode - numberCharacterLitteral
+
+    @staticmethod
+    def _day_08_helper_getEncodedMinusCode(line: str) -> int:
+        """
+        Helper for the solution for day 8. Count the characters added when the code of a string is encoded.
+        https://adventofcode.com/2015/day/8#part2
+
+        Args:
+            line (str): Line of the input, the code of the string (surrounding spaces are ignored).
+
         Returns:
-            Integer representing the number of character that are done for coding but not present in litteral.
+            Number of characters of the encoded code minus the number of characters of the code.
         """
-        numberCharacterOfCode: int = 0      # Number of character that are written in the code
-        numberCharacterLitteral: int = 0    # Number of character that it represents.
-        currentNumberCharacter: int         # Number of character by line.
-        lines: list[str]                    # All lines of the input of the problem.
-        line: str                           # String representing the input and the strings that might be nine.
+        numberCharacterAdded: int = 4       # Number of character added by the encoding, starting with 4 for the first and last "
 
-        # Retrieve all lines of the input file
-        lines = ReadFile.getLines(8)
-        lines = [line.strip() for line in lines]
+        # Each time a \\ or a \" is found, add 1 character for encoding.
+        line = line.strip()
+        for charIndex in range(1, len(line) - 1):
+            if line[charIndex] in ("\\", "\""):
+                numberCharacterAdded += 1
 
-        # Iterating among all strings
-        for line in lines:
+        # Return the number of character added for the encoding.
+        return numberCharacterAdded
 
-            # Retrieve the number of character on the line, add it to the code
-            # And delete 2 for Litteral for the first and last "
-            currentNumberCharacter = len(line)
-            numberCharacterOfCode += currentNumberCharacter
-            numberCharacterLitteral += currentNumberCharacter - 2
-
-            # Iterating among all letters
-            charIndex: int = 0
-            while charIndex < len(line):
-                # If we find a \ character, it means that there are more characters for code than litteral
-                if "\\" == line[charIndex]:
-                    # If the next one is a \ or a ", there are 2 characters of code for 1 litteral
-                    if line[charIndex + 1] in ("\"", "\\"):
-                        numberCharacterLitteral -= 1
-                        charIndex += 1
-                    # If the next one is a #, there are 4 characters of code for 1 litteral
-                    elif "x" == line[charIndex + 1]:
-                        numberCharacterLitteral -= 3
-                        charIndex += 3
-                charIndex += 1
+    @staticmethod
+    def _day_08_Part_1() -> int:
+        """
+        Get solution for day 8, Part 1
+        https://adventofcode.com/2015/day/8
 
-        # Return the number of characters that are done for code only.
-        return numberCharacterOfCode - numberCharacterLitteral
+        Returns:
+            Integer representing the number of character that are done for coding but not present in litteral.
+        """
+        # Iterating among all strings, and add the characters that are done for code only.
+        return sum(Year2015_Solution._day_08_helper_getCodeMinusLitteral(line) for line in ReadFile.iterLines(8))
 
     @staticmethod
     def _day_08_Part_2() -> int:
@@ -706,36 +894,11 @@ class Year2015_Solution():
         Returns:
             Integer representing the number of character should be added if we want to have the code in an encoded.
         """
-        numberCharacterOfCode: int = 0      # Number of character that are written in the code
-        numberCharacterEncoded: int = 0     # Number of character that it would be once encoded.
-        currentNumberCharacter: int         # Number of character by line.
-        lines: list[str]                    # All lines of the input of the problem.
-        line: str                           # String representing the input and the strings that might be nine.
-
-        # Retrieve all lines of the input file
-        lines = ReadFile.getLines(8)
-        lines = [line.strip() for line in lines]
-
-        # Iterating among all strings
-        for line in lines:
-            # Retrieve the number of character on the line, add it to the code
-            # And add 4 for encoded for the first and last "
-            currentNumberCharacter = len(line)
-            numberCharacterOfCode += currentNumberCharacter
-            numberCharacterEncoded += currentNumberCharacter + 4
-
-            # Each time a \\ or a \" is found, add 1 character for encoding.
-            for charIndex in range(1, len(line) - 1):
-                if line[charIndex] in ("\\", "\""):
-                    numberCharacterEncoded += 1
-
-        # Return the number of character added for the encoding.
-        return numberCharacterEncoded - numberCharacterOfCode
+        # Iterating among all strings, and add the characters added by the encoding.
+        return sum(Year2015_Solution._day_08_helper_getEncodedMinusCode(line) for line in ReadFile.iterLines(8))
     
-    _day_09_distanceSolution: int = maxsize
-
     @staticmethod
-    def _day_09_helper_dfs(listOfVisitedCities: list[int], matrixOfDistances: list[list[int]], currentDistance: int, isMin: bool) -> None:
+    def _day_09_helper_dfs(listOfVisitedCities: list[int], matrixOfDistances: list[list[int]], currentDistance: int, isMin: bool, context: SearchContext) -> None:
         """
         Helper for the solution for day 9. Use DFS to find the smallest distance.
         https://adventofcode.com/2015/day/9
@@ -745,9 +908,14 @@ class Year2015_Solution():
             - matrixOfDistances (list[list[int]]): Distance between every cities.
             - currentDistance (int): Distance travelled for the current path.
             - isMin (bool): True if the MIN function is applied, FALSE if the MAX function is applied.
+            - context (SearchContext): State of the search. Its best value is the best distance found.
         """
         indexOfCity: int            # Index of the cities that we are looking for minimizing distances.
         
+        # Count the node when the effort of the search is counted.
+        if context.effort is not None:
+            context.effort["nodesExpanded"] += 1
+        
         # Iterating among all cities to find the next one that Santa is going to visit.
         for indexOfCity in range(len(matrixOfDistances)):
             # If the city is visited, we don't want to go in this one anymore.
@@ -760,18 +928,23 @@ class Year2015_Solution():
             
             # If all cities are visited, we can try saving the new distance.
             if len(matrixOfDistances) == len(listOfVisitedCities):
+                if context.effort is not None:
+                    context.effort["leavesReached"] += 1
+                    context.effort["bestUpdates"] += int(currentDistance < context.bestValue if isMin else currentDistance > context.bestValue)
                 if isMin:
-                    Year2015_Solution._day_09_distanceSolution = min(Year2015_Solution._day_09_distanceSolution, currentDistance)
+                    context.bestValue = min(context.bestValue, currentDistance)
                 else:
-                    Year2015_Solution._day_09_distanceSolution = max(Year2015_Solution._day_09_distanceSolution, currentDistance)
+                    context.bestValue = max(context.bestValue, currentDistance)
             
             # If we want the min distance, we want to continue only if the distance is smaller than the one we already have.
             elif isMin:
-                if Year2015_Solution._day_09_distanceSolution > currentDistance:
-                    Year2015_Solution._day_09_helper_dfs(listOfVisitedCities, matrixOfDistances, currentDistance, isMin)
+                if context.bestValue > currentDistance:
+                    Year2015_Solution._day_09_helper_dfs(listOfVisitedCities, matrixOfDistances, currentDistance, isMin, context)
+                elif context.effort is not None:
+                    context.effort["nodesPruned"] += 1
             # Else, we want the max so we always keep doing dfs
             else:
-                Year2015_Solution._day_09_helper_dfs(listOfVisitedCities, matrixOfDistances, currentDistance, isMin)
+                Year2015_Solution._day_09_helper_dfs(listOfVisitedCities, matrixOfDistances, currentDistance, isMin, context)
             
             # Delete the last path and substract the useless distance.
             currentDistance -= matrixOfDistances[listOfVisitedCities[-2]][listOfVisitedCities[-1]]
@@ -789,20 +962,18 @@ class Year2015_Solution():
         dictOfCitiesAndIndex: dict[str, int] = {}       # Dictionary to find where the distances should be written in matrix.
         lastIndex: int = 0                              # Integer to map name of cities to index.
         matrixOfDistances: list[list[int]]              # Output: Matrix of the distances between each cities.
-        lines: list[str]                                # All lines of the input of the problem.
-        line: str                                       # String representing the input line by line.
+        routes: list[tuple[str, str, int]]              # Both cities and the distance of each line of the input.
 
-        # Retrieve all lines of the input file
-        lines = ReadFile.getLines(9)
+        # Retrieve the routes of the input file
+        routes = InputParser.parseDay09()
         
         # Construct the dict to know which city correspond to which path
-        for line in lines:
-            strings = findall(r"\b[a-zA-Z]+\b", line)
-            if strings[0] not in dictOfCitiesAndIndex:
-                dictOfCitiesAndIndex[strings[0]] = lastIndex
+        for firstCity, secondCity, _ in routes:
+            if firstCity not in dictOfCitiesAndIndex:
+                dictOfCitiesAndIndex[firstCity] = lastIndex
                 lastIndex += 1
-            if strings[2] not in dictOfCitiesAndIndex:
-                dictOfCitiesAndIndex[strings[2]] = lastIndex
+            if secondCity not in dictOfCitiesAndIndex:
+                dictOfCitiesAndIndex[secondCity] = lastIndex
                 lastIndex += 1
         
         # Fill a matrix with INFINITE distances
@@ -813,39 +984,47 @@ class Year2015_Solution():
             matrixOfDistances[lineOfMatrix][lineOfMatrix] = 0
 
         # Retrieve the given distances.
-        for line in lines:
-            strings = findall(r"\b[a-zA-Z]+\b", line)
-            distance = int(findall(r"\b[0-9]+\b", line)[0])
-
-            matrixOfDistances[dictOfCitiesAndIndex[strings[0]]][dictOfCitiesAndIndex[strings[2]]] = distance
-            matrixOfDistances[dictOfCitiesAndIndex[strings[2]]][dictOfCitiesAndIndex[strings[0]]] = distance
+        for firstCity, secondCity, distance in routes:
+            matrixOfDistances[dictOfCitiesAndIndex[firstCity]][dictOfCitiesAndIndex[secondCity]] = distance
+            matrixOfDistances[dictOfCitiesAndIndex[secondCity]][dictOfCitiesAndIndex[firstCity]] = distance
         
         # Return the matrix with all distances
         return matrixOfDistances
 
     @staticmethod
-    def _day_09_Part_1() -> int:
+    def _day_09_helper_findBestRoute(matrixOfDistances: list[list[int]], isMin: bool) -> int:
         """
-        Get solution for day 9, Part 1
+        Helper for the solution for day 9. Find the distance of the shortest or of the longest route, starting from each city.
         https://adventofcode.com/2015/day/9
 
         Returns:
-            Distance of the shortest route Santa can take to go through all locations.
+            Distance of the shortest route if isMin, of the longest route otherwise.
+
+        Args:
+            - matrixOfDistances (list[list[int]]): Distance between every cities.
+            - isMin (bool): True if the MIN function is applied, FALSE if the MAX function is applied.
         """
-        matrixOfDistances: list[list[int]]  # Matrix containing all the distances between every locations
-        
-        # Set the solution to max value to make the comparaison logical with min function
-        Year2015_Solution._day_09_distanceSolution = maxsize
+        # Set the solution to max value when minimizing (min value when maximizing) to make the comparaison logical.
+        context: SearchContext = SearchContext(maxsize if isMin else 0)
 
-        # Retrieve the matrix thanks to the helper function
-        matrixOfDistances = Year2015_Solution._day_09_helper_buildMatrixOfDistances()
-        
-        # Find the smallest route by starting from each cities.
+        # Find the best route by starting from each cities.
         for indexCity in range(len(matrixOfDistances)):
-            Year2015_Solution._day_09_helper_dfs([indexCity], matrixOfDistances, 0, True)
+            Year2015_Solution._day_09_helper_dfs([indexCity], matrixOfDistances, 0, isMin, context)
 
+        # Return the best path found
+        return context.bestValue
+
+    @staticmethod
+    def _day_09_Part_1() -> int:
+        """
+        Get solution for day 9, Part 1
+        https://adventofcode.com/2015/day/9
+
+        Returns:
+            Distance of the shortest route Santa can take to go through all locations.
+        """
         # Return the smallest path found
-        return Year2015_Solution._day_09_distanceSolution
+        return Year2015_Solution._day_09_helper_findBestRoute(Year2015_Solution._day_09_helper_buildMatrixOfDistances(), True)
     
     @staticmethod
     def _day_09_Part_2() -> int:
@@ -854,42 +1033,72 @@ class Year2015_Solution():
         https://adventofcode.com/2015/day/9#part2
 
         Returns:
-            Distance of the longest route Santa can take to go through all locations.
+            Distance of the longest route Santa can take to go through all locations.
+        """
+        # Return the longest path found
+        return Year2015_Solution._day_09_helper_findBestRoute(Year2015_Solution._day_09_helper_buildMatrixOfDistances(), False)
+    
+    @staticmethod
+    def _day_09_Parts() -> tuple[int, int]:
+        """
+        Get solutions for day 9, Part 1 and Part 2
+        https://adventofcode.com/2015/day/9
+
+        Returns:
+            Distances of the shortest and of the longest routes Santa can take to go through all locations.
+        """
+        matrixOfDistances: list[list[int]]                          # Matrix containing all the distances between every locations
+
+        # Retrieve the matrix once for both searches.
+        matrixOfDistances = Year2015_Solution._day_09_helper_buildMatrixOfDistances()
+
+        return (Year2015_Solution._day_09_helper_findBestRoute(matrixOfDistances, True),
+                Year2015_Solution._day_09_helper_findBestRoute(matrixOfDistances, False))
+    
+    @staticmethod
+    def _day_10_helper_getLookAndSayLengthsAfterOccurences(numbersOfOccurences: tuple[int, ...]) -> list[int]:
+        """
+        Helper for the solution for day 10. Find the length of the message of look-and-say after each given number of iterations.
+        Each game continues from the sentence of the previous number of iterations.
+        https://adventofcode.com/2015/day/10
+
+        Returns:
+            Length of the string after each numberOfOccurences play of look-and-say, in the same order.
+        
+        Args:
+            numbersOfOccurences (tuple[int, ...]): Numbers of game the Elves will play, in increasing order.
         """
-        matrixOfDistances: list[list[int]]  # Matrix containing all the distances between every locations
+        line: str                           # Input of the problem, stored on a string.
+        numberOfGamesPlayed: int = 0        # Number of games already played on the line.
+        lengths: list[int] = []             # Output: Length of the sentence after each number of games.
+        
+        # Retrieve the input of the problem.
+        line = ReadFile.getLine(10)
 
-        # Set the solution to min value to make the comparaison logical with max function
-        Year2015_Solution._day_09_distanceSolution = 0
+        # Play the games missing to reach each number of games, and keep the number of characters in the sentence said by the elves.
+        for numberOfOccurences in numbersOfOccurences:
+            line = Year2015_Solution._day_10_helper_playLookAndSay(line, numberOfOccurences - numberOfGamesPlayed)
+            numberOfGamesPlayed = numberOfOccurences
+            lengths.append(len(line))
+
+        return lengths
 
-        # Retrieve the matrix thanks to the helper function
-        matrixOfDistances = Year2015_Solution._day_09_helper_buildMatrixOfDistances()
-        
-        # Find the longest route by starting from each cities.
-        for indexStart in range(len(matrixOfDistances)):
-            Year2015_Solution._day_09_helper_dfs([indexStart], matrixOfDistances, 0, False)
-        
-        # Return the longest path found
-        return Year2015_Solution._day_09_distanceSolution
-    
     @staticmethod
-    def _day_10_helper_getLookAndSayLengthAfterOccurences(numberOfOccurences: int) -> int:
+    def _day_10_helper_playLookAndSay(line: str, numberOfOccurences: int) -> str:
         """
-        Helper for the solution for day 10. Find the length of the message of look-and-say after a given number of iterations.
+        Helper for the solution for day 10. Play a given number of games of look-and-say from a given sentence.
         https://adventofcode.com/2015/day/10
 
         Returns:
-            Length of the string after numberOfOccurences play of look-and-say.
+            The sentence said by the elves after numberOfOccurences play of look-and-say.
         
         Args:
+            line (str): Sentence said by the elves before the first game.
             numberOfOccurences (int): Number of game the Elves will play.
         """
-        line: str                           # Input of the problem, stored on a string.
         charIndex: int                      # Index of the instruction the Santa has to follow
         newReadValue: str                   # New version of what is read by the elves at step n
         numberOfOccurenceLastDigit: int     # Number of time the last integer is written
-        
-        # Retrieve the input of the problem.
-        line = ReadFile.getLine(10)
 
         # Play the game numberOfOccurences times
         for _ in range(numberOfOccurences):
@@ -912,8 +1121,8 @@ class Year2015_Solution():
             # Update the content of the input for next iteration
             line = newReadValue
         
-        # Return the number of characters in the sentence said by the elves after numberOfOccurences games.
-        return len(line)
+        # Return the sentence said by the elves after numberOfOccurences games.
+        return line
     
     @staticmethod
     def _day_10_Part_1() -> int:
@@ -924,7 +1133,7 @@ class Year2015_Solution():
         Returns:
             Numbers of elements in the string after the Elves made 40 games of look-and-say.
         """
-        solutionAfterFortyGames: int = Year2015_Solution._day_10_helper_getLookAndSayLengthAfterOccurences(40)  # Length of the string after 40 games of look-and-say
+        solutionAfterFortyGames: int = Year2015_Solution._day_10_helper_getLookAndSayLengthsAfterOccurences((40,))[0]  # Length of the string after 40 games of look-and-say
         
         return solutionAfterFortyGames
     
@@ -937,9 +1146,26 @@ class Year2015_Solution():
         Returns:
             Numbers of elements in the string after the Elves made 50 games of look-and-say.
         """
-        solutionAfterFiftyGames: int = Year2015_Solution._day_10_helper_getLookAndSayLengthAfterOccurences(50)  # Length of the string after 40 games of look-and-say
+        solutionAfterFiftyGames: int = Year2015_Solution._day_10_helper_getLookAndSayLengthsAfterOccurences((50,))[0]  # Length of the string after 40 games of look-and-say
 
         return solutionAfterFiftyGames
+
+    @staticmethod
+    def _day_10_Parts() -> tuple[int, int]:
+        """
+        Get solutions for day 10, Part 1 and Part 2
+        https://adventofcode.com/2015/day/10
+
+        Returns:
+            Numbers of elements in the string after the Elves made 40 and 50 games of look-and-say.
+        """
+        lengthAfterFortyGames: int          # Length of the sentence said by the elves after 40 games.
+        lengthAfterFiftyGames: int          # Length of the sentence said by the elves after 50 games.
+
+        # Play the 40 first games, and continue from there for the 10 following games.
+        lengthAfterFortyGames, lengthAfterFiftyGames = Year2015_Solution._day_10_helper_getLookAndSayLengthsAfterOccurences((40, 50))
+
+        return (lengthAfterFortyGames, lengthAfterFiftyGames)
     
     @staticmethod
     def _day_11_helper_doesStringContainsIncreasingSubsequence(stringToCheck: str) -> bool:
@@ -1098,24 +1324,45 @@ class Year2015_Solution():
         return currentPassword   
 
     @staticmethod
-    def _day_11_Part_1() -> str:
+    def _day_11_helper_findNextPasswords(numberOfPasswords: int) -> list[str]:
         """
-        Get solution for day 11, Part 1
+        Helper for the solution for day 11. Find the numberOfPasswords next passwords of Santa, each one following the previous.
         https://adventofcode.com/2015/day/11
 
         Returns:
-            The next password that Santa should have following the rules of the Security-Elf
+            The next passwords of Santa, in order.
+
+        Args:
+            numberOfPasswords (int): Number of passwords to find.
         """
-        line: str               # Input of the problem, which is the previous password of Santa.
+        line: str                       # Input of the problem, which is the previous password of Santa.
+        passwords: list[str] = []       # Output: Next passwords of Santa.
 
         # Retrieve the input of the problem.
         line = ReadFile.getLine(11)
-        
-        # Retrieve the next password
-        line = Year2015_Solution._day_11_helper_findFollowingPassword(line)
 
+        for _ in range(numberOfPasswords):
+            # Increment by one the previous password, if any, before finding a new password
+            if passwords:
+                line = Year2015_Solution._day_11_helper_IncrementByOneFromIndex(line, len(line) - 1)
+
+            # Find the next password of Santa
+            line = Year2015_Solution._day_11_helper_findFollowingPassword(line)
+            passwords.append(line)
+
+        return passwords
+
+    @staticmethod
+    def _day_11_Part_1() -> str:
+        """
+        Get solution for day 11, Part 1
+        https://adventofcode.com/2015/day/11
+
+        Returns:
+            The next password that Santa should have following the rules of the Security-Elf
+        """
         # Return the new password of Santa
-        return line
+        return Year2015_Solution._day_11_helper_findNextPasswords(1)[-1]
 
     @staticmethod
     def _day_11_Part_2() -> str:
@@ -1126,22 +1373,25 @@ class Year2015_Solution():
         Returns:
             The password of Santa updated 2 times, according to the new Security-Elf rules.
         """
-        line: str               # Input of the problem, which is the previous password of Santa.
-
-        # Retrieve the input of the problem.
-        line = ReadFile.getLine(11)
+        # Return the updated password of Santa
+        return Year2015_Solution._day_11_helper_findNextPasswords(2)[-1]
 
-        # Find the next password of Santa
-        line = Year2015_Solution._day_11_helper_findFollowingPassword(line)
+    @staticmethod
+    def _day_11_Parts() -> tuple[str, str]:
+        """
+        Get solutions for day 11, Part 1 and Part 2
+        https://adventofcode.com/2015/day/11
 
-        # Increment by one the password before finding a new password
-        line = Year2015_Solution._day_11_helper_IncrementByOneFromIndex(line, len(line) - 1)
+        Returns:
+            The next password of Santa, and the one after it.
+        """
+        firstPassword: str      # Next password of Santa.
+        secondPassword: str     # Password of Santa updated 2 times.
 
-        # Find the next password of Santa
-        line = Year2015_Solution._day_11_helper_findFollowingPassword(line)
+        # The second password is searched from the first one.
+        firstPassword, secondPassword = Year2015_Solution._day_11_helper_findNextPasswords(2)
 
-        # Return the updated password of Santa
-        return line
+        return (firstPassword, secondPassword)
     
     @staticmethod
     def _day_12_helper_computeSumInsideDict(dictToComputeSum: dict) -> int:
@@ -1245,12 +1495,12 @@ class Year2015_Solution():
             The Sum of all integers on the JSON file without counting twice "red" elements.
         """
         
+        from json import loads              # Imported here, as only day 12 needs it.
         totalSum: int                       # Sum of all numbers in the document.
         dictOfCurrentElements: dict         # Dictionnary of the elements found in the JSON input.
 
         # Retrieve the input of the problem.
-        with open(ReadFile.getNameOfFile(12), mode="r", encoding="utf-8") as file:
-            dictOfCurrentElements = load(file)
+        dictOfCurrentElements = loads(ReadFile.getText(12))
         
         # Find the sum of all elements without counting twice the "red" elements.
         totalSum = Year2015_Solution._day_12_helper_computeSumInsideDict(dictOfCurrentElements)
@@ -1258,10 +1508,8 @@ class Year2015_Solution():
         # Return the sum of according to the new rule in the Elves document.
         return totalSum
     
-    _day_13_happinessSolution: int = - maxsize
-
     @staticmethod
-    def _day_13_helper_dfs(listOfPersonAtDinningTable: list[int], matrixOfHappiness: list[list[int]], currentHappiness: int) -> None:
+    def _day_13_helper_dfs(listOfPersonAtDinningTable: list[int], matrixOfHappiness: list[list[int]], currentHappiness: int, context: SearchContext) -> None:
         """
         Helper for the solution for day 13. Use DFS to find the maximum happiness.
         https://adventofcode.com/2015/day/13
@@ -1270,9 +1518,14 @@ class Year2015_Solution():
             - listOfPersonAtDinningTable (list[int]): List of all persons at the table, in the order they are.
             - matrixOfHappiness (list[list[int]]): Matrix that contains the happiness of people when they are next to the other.
             - currentHappiness (int): Happiness of the current configuration.
+            - context (SearchContext): State of the search. Its best value is the maximum happiness found.
         """
         indexOfPerson: int            # Index of the person that we are looking for maximizing happiness.
 
+        # Count the node when the effort of the search is counted.
+        if context.effort is not None:
+            context.effort["nodesExpanded"] += 1
+
         # Iterating among all persons to find the next one should be at the table
         for indexOfPerson in range(len(matrixOfHappiness)):
             # If the person is at the table, we don't want to add him a second time.
@@ -1286,13 +1539,17 @@ class Year2015_Solution():
             
             # If all persons are on the table, we store the max happiness.
             if len(matrixOfHappiness) == len(listOfPersonAtDinningTable):
-                Year2015_Solution._day_13_happinessSolution = max(Year2015_Solution._day_13_happinessSolution, \
-                                                                 currentHappiness + matrixOfHappiness[listOfPersonAtDinningTable[-1]][listOfPersonAtDinningTable[0]] \
-                                                                 + matrixOfHappiness[listOfPersonAtDinningTable[0]][listOfPersonAtDinningTable[-1]])
+                if context.effort is not None:
+                    context.effort["leavesReached"] += 1
+                    context.effort["bestUpdates"] += int(context.bestValue < currentHappiness + matrixOfHappiness[listOfPersonAtDinningTable[-1]][listOfPersonAtDinningTable[0]]
+                                                         + matrixOfHappiness[listOfPersonAtDinningTable[0]][listOfPersonAtDinningTable[-1]])
+                context.bestValue = max(context.bestValue, \
+                                        currentHappiness + matrixOfHappiness[listOfPersonAtDinningTable[-1]][listOfPersonAtDinningTable[0]] \
+                                        + matrixOfHappiness[listOfPersonAtDinningTable[0]][listOfPersonAtDinningTable[-1]])
             
             # if not everyone is here, we should try adding more
             else:
-                Year2015_Solution._day_13_helper_dfs(listOfPersonAtDinningTable, matrixOfHappiness, currentHappiness)
+                Year2015_Solution._day_13_helper_dfs(listOfPersonAtDinningTable, matrixOfHappiness, currentHappiness, context)
 
             # Delete the last person and substract the useless happiness.
             currentHappiness -= matrixOfHappiness[listOfPersonAtDinningTable[-2]][listOfPersonAtDinningTable[-1]]
@@ -1311,20 +1568,18 @@ class Year2015_Solution():
         dictOfHappinessAndIndex: dict[str, int] = {}    # Dictionary to find where the happiness should be written in matrix.
         lastIndex: int = 0                              # Integer to map name of persons to index.
         matrixOfHappiness: list[list[int]]              # Output: Matrix of the happiness between each person.
-        lines: list[str]                                # All lines of the input of the problem.
-        line: str                                       # String representing the input line by line.
+        happinessOfNeighbours: list[tuple[str, str, int]]   # Person, neighbour and happiness of each line of the input.
 
-        # Retrieve all lines of the input file
-        lines = ReadFile.getLines(13)
+        # Retrieve the happiness of the input file
+        happinessOfNeighbours = InputParser.parseDay13()
         
         # Construct the dict to know which name correspond to which happiness
-        for line in lines:
-            strings = findall(r"\b[a-zA-Z]+\b", line)
-            if strings[0] not in dictOfHappinessAndIndex:
-                dictOfHappinessAndIndex[strings[0]] = lastIndex
+        for person, neighbour, _ in happinessOfNeighbours:
+            if person not in dictOfHappinessAndIndex:
+                dictOfHappinessAndIndex[person] = lastIndex
                 lastIndex += 1
-            if strings[-1] not in dictOfHappinessAndIndex:
-                dictOfHappinessAndIndex[strings[-1]] = lastIndex
+            if neighbour not in dictOfHappinessAndIndex:
+                dictOfHappinessAndIndex[neighbour] = lastIndex
                 lastIndex += 1
         
         # Fill a matrix with - INFINITE happiness
@@ -1335,15 +1590,9 @@ class Year2015_Solution():
             matrixOfHappiness[lineOfMatrix][lineOfMatrix] = 0
 
         # Retrieve the given happiness.
-        for line in lines:
-            strings = findall(r"\b[a-zA-Z]+\b", line)
-            happiness = int(findall(r"\b[0-9]+\b", line)[0])
-
-            matrixOfHappiness[dictOfHappinessAndIndex[strings[0]]][dictOfHappinessAndIndex[strings[-1]]] = happiness
-
-            # If the happiness is lost, it's negative happiness.
-            if "would lose" in line:
-                matrixOfHappiness[dictOfHappinessAndIndex[strings[0]]][dictOfHappinessAndIndex[strings[-1]]] *= -1
+        # A lost happiness is already negative.
+        for person, neighbour, happiness in happinessOfNeighbours:
+            matrixOfHappiness[dictOfHappinessAndIndex[person]][dictOfHappinessAndIndex[neighbour]] = happiness
         
         # Return the matrix with all happiness.
         return matrixOfHappiness
@@ -1367,27 +1616,37 @@ class Year2015_Solution():
         matrixOfHappiness.append([0 for _ in range(len(matrixOfHappiness))])
     
     @staticmethod
-    def _day_13_Part_1() -> int:
+    def _day_13_helper_findMaxHappiness(matrixOfHappiness: list[list[int]]) -> int:
         """
-        Get solution for day 13, Part 1
+        Helper for the solution for day 13. Find the maximum happiness of the table configurations.
         https://adventofcode.com/2015/day/13
 
         Returns:
-            Maximum happiness we can have when making the table configuration
+            Maximum happiness we can have when making the table configuration.
+
+        Args:
+            - matrixOfHappiness (list[list[int]]): Matrix that contains the happiness of people when they are next to the other.
         """
-        matrixOfHappiness: list[list[int]]  # Matrix containing all the happiness between everyone
-        
-        # Set the solution to max value to make the comparaison logical with min function
-        Year2015_Solution._day_13_happinessSolution = - maxsize
+        # Set the solution to min value to make the comparaison logical with max function
+        context: SearchContext = SearchContext(- maxsize)
 
-        # Retrieve the matrix thanks to the helper function
-        matrixOfHappiness = Year2015_Solution._day_13_helper_buildMatrixOfHappiness()
-        
         # Find the max happiness possible. The person who sits first does not change anyhting as the table is round.
-        Year2015_Solution._day_13_helper_dfs([0], matrixOfHappiness, 0)
+        Year2015_Solution._day_13_helper_dfs([0], matrixOfHappiness, 0, context)
+
+        # Return the max happiness found
+        return context.bestValue
+
+    @staticmethod
+    def _day_13_Part_1() -> int:
+        """
+        Get solution for day 13, Part 1
+        https://adventofcode.com/2015/day/13
 
+        Returns:
+            Maximum happiness we can have when making the table configuration
+        """
         # Return the max happiness found
-        return Year2015_Solution._day_13_happinessSolution
+        return Year2015_Solution._day_13_helper_findMaxHappiness(Year2015_Solution._day_13_helper_buildMatrixOfHappiness())
     
     @staticmethod
     def _day_13_Part_2() -> int:
@@ -1400,47 +1659,52 @@ class Year2015_Solution():
         """
         matrixOfHappiness: list[list[int]]  # Matrix containing all the happiness between everyone
         
-        # Set the solution to max value to make the comparaison logical with min function
-        Year2015_Solution._day_13_happinessSolution = - maxsize
-
         # Retrieve the matrix thanks to the helper function
         matrixOfHappiness = Year2015_Solution._day_13_helper_buildMatrixOfHappiness()
 
         # Add myself to the table
         Year2015_Solution._day_13_helper_AddMyselfToTable(matrixOfHappiness)
         
-        # Find the max happiness possible. The person who sits first does not change anyhting as the table is round.
-        Year2015_Solution._day_13_helper_dfs([0], matrixOfHappiness, 0)
-
         # Return the max happiness found
-        return Year2015_Solution._day_13_happinessSolution
+        return Year2015_Solution._day_13_helper_findMaxHappiness(matrixOfHappiness)
 
     @staticmethod
-    def _day_14_helper_getSpeedAndTimesForReindeers() -> list[list[int]]:
+    def _day_13_Parts() -> tuple[int, int]:
         """
-        Helper for the solution for day 14. Create a matrix with all informations for all reindeers. 
-        https://adventofcode.com/2015/day/14
+        Get solutions for day 13, Part 1 and Part 2
+        https://adventofcode.com/2015/day/13
 
         Returns:
-            A list where in each element we have:
-                - 0. The speed when mooving
-                - 1. The time the reindeer can move
-                - 2. The time the reindeer will rest
+            Maximum happiness we can have when making the table configuration, without and with me at the table.
         """
-        lines: list[str]                                         # All lines of the input of the problem.
-        line: str                                                # String representing the input line by line.
-        regexForFidingIntegers: str = "[0-9]+"                   # Regex used to find all numerics value in the input.
-        distancesByTimeForEachReindeer: list[list[int]] = []     # List of all distances that reindeer can make in the associated time
+        matrixOfHappiness: list[list[int]]  # Matrix containing all the happiness between everyone
+        happinessWithoutMe: int             # Maximum happiness without me at the table.
 
-        # Retrieve the input of the problem.
-        lines = ReadFile.getLines(14)
+        # Retrieve the matrix once for both searches.
+        matrixOfHappiness = Year2015_Solution._day_13_helper_buildMatrixOfHappiness()
 
-        # Iterating among all lines to retrieve informations of speed and rest time
-        for line in lines:
-            distancesByTimeForEachReindeer.append(findall(regexForFidingIntegers, line))
-            distancesByTimeForEachReindeer[-1] = [int(val) for val in distancesByTimeForEachReindeer[-1]]
+        # Find the max happiness possible without me.
+        happinessWithoutMe = Year2015_Solution._day_13_helper_findMaxHappiness(matrixOfHappiness)
+
+        # Add myself to the table, and find the max happiness possible again.
+        Year2015_Solution._day_13_helper_AddMyselfToTable(matrixOfHappiness)
+
+        return (happinessWithoutMe, Year2015_Solution._day_13_helper_findMaxHappiness(matrixOfHappiness))
+
+    @staticmethod
+    def _day_14_helper_getSpeedAndTimesForReindeers() -> list[Reindeer]:
+        """
+        Helper for the solution for day 14. Create a list with all informations for all reindeers. 
+        https://adventofcode.com/2015/day/14
 
-        return distancesByTimeForEachReindeer
+        Returns:
+            A list where for each reindeer we have:
+                - speed: The speed when mooving
+                - flightTime: The time the reindeer can move
+                - restTime: The time the reindeer will rest
+        """
+        # Retrieve informations of speed and rest time, parsed while the input is read.
+        return list(InputParser.parseDay14())
 
     @staticmethod
     def _day_14_Part_1():
@@ -1452,7 +1716,7 @@ class Year2015_Solution():
             Distance the winning reindeer traveled for Reindeer Olympics!
         """
         numberOfSeconds: int = 2503                              # Number of seconds the race last.
-        distancesByTimeForEachReindeer: list[list[int]] = []     # List of all distances that reindeer can make in the associated time
+        distancesByTimeForEachReindeer: list[Reindeer] = []      # List of all distances that reindeer can make in the associated time
         mostDistanceTravelled: int = 0                           # Value of the most distance done.
 
         # Retrieve Reindeers informations
@@ -1462,12 +1726,12 @@ class Year2015_Solution():
         for reindeer in distancesByTimeForEachReindeer:
             
             # Compute the number of 'full traject' (Fly + rest)
-            nbOfTrajectWithBreak: int = int(numberOfSeconds / (reindeer[1] + reindeer[2]))
+            nbOfTrajectWithBreak: int = int(numberOfSeconds / (reindeer.flightTime + reindeer.restTime))
             # Compute the number of seconds the reindeer will fly after his last break
-            nbSecondsLeft: int = min(reindeer[1], numberOfSeconds - nbOfTrajectWithBreak * (reindeer[1] + reindeer[2]))
+            nbSecondsLeft: int = min(reindeer.flightTime, numberOfSeconds - nbOfTrajectWithBreak * (reindeer.flightTime + reindeer.restTime))
 
             # Compute the distance of the current reindeer. 
-            currentDistance: int = reindeer[0] * (nbOfTrajectWithBreak * reindeer[1] + nbSecondsLeft)
+            currentDistance: int = reindeer.speed * (nbOfTrajectWithBreak * reindeer.flightTime + nbSecondsLeft)
 
             # Compute the most distance travelled.
             mostDistanceTravelled = max(mostDistanceTravelled, currentDistance)
@@ -1485,7 +1749,7 @@ class Year2015_Solution():
             Distance the winning reindeer traveled for Reindeer Olympics with new rules!
         """
         numberOfSeconds: int = 2503                              # Number of seconds the race last.
-        distancesByTimeForEachReindeer: list[list[int]] = []     # List of all distances that reindeer can make in the associated time
+        distancesByTimeForEachReindeer: list[Reindeer] = []      # List of all distances that reindeer can make in the associated time
         distanceAndScoreByReindeer: list[list[int]] = []         # Store the distance and the score of a reinder after n second.
         nbOfReindeer: int                                        # Number of reindeer making the race
 
@@ -1504,10 +1768,10 @@ class Year2015_Solution():
             # Store the list of all reindeers position
             listIndexMostTravelled:list[int] = [0]
     
-            for indexReindeer in range(nbOfReindeer):
+            for indexReindeer, reindeer in enumerate(distancesByTimeForEachReindeer):
                 # If the deer is in a mooving phase, make him move
-                if distancesByTimeForEachReindeer[indexReindeer][1] > currentTime % (distancesByTimeForEachReindeer[indexReindeer][1] + distancesByTimeForEachReindeer[indexReindeer][2]):
-                    distanceAndScoreByReindeer[indexReindeer][0] += distancesByTimeForEachReindeer[indexReindeer][0]
+                if reindeer.flightTime > currentTime % (reindeer.flightTime + reindeer.restTime):
+                    distanceAndScoreByReindeer[indexReindeer][0] += reindeer.speed
                 
                 # For all reindeers of index 1 or more, check if the have the max distance
                 if 0 != indexReindeer:
@@ -1519,120 +1783,111 @@ class Year2015_Solution():
                         listIndexMostTravelled = [indexReindeer]
             
             # Give one point to all of them who are at the front of the race
-            for reindeer in listIndexMostTravelled:
-                distanceAndScoreByReindeer[reindeer][1] += 1
+            for indexOfLeader in listIndexMostTravelled:
+                distanceAndScoreByReindeer[indexOfLeader][1] += 1
         
         # Return the most distance that has been travelled.
         return max(distanceAndScoreByReindeer[indexReindeer][1] for indexReindeer in range(nbOfReindeer))
     
-    _day_15_cookieWithMaxScore = 0
-
     @staticmethod
-    def _day_15_helper_getMaxScore(listOfIngredients: list[dict[str, int]], quantityOfIngredients: list[int], isCalorieCounted: bool):
+    def _day_15_helper_getMaxScore(listOfIngredients: list[Ingredient], quantityOfIngredients: list[int], context: SearchContext | None,
+                                   contextWithCalories: SearchContext | None):
         """
-        Helper for the solution for day 15. Create all possibles cookies combinaison.
+        Helper for the solution for day 15. Create all possibles cookies combinaison, and keep the best score of the cookies
+        and / or the best score of the cookies with 500 calories.
         https://adventofcode.com/2015/day/15
 
         Args:
-            - listOfIngredients (list[dict[str, int]]): List of all ingredients with their caracteristics stored in a map.
+            - listOfIngredients (list[Ingredient]): List of all ingredients with their caracteristics.
             - quantityOfIngredients (list[int]): Number of teaspoon of each ingredient, in the same order.
-            - isCalorieCounted (bool): A boolean that states is the calorie is checked. When checked, they have to be 500.
+            - context (SearchContext | None): Its bestValue is the best score of all cookies found so far. None if this score is not searched.
+            - contextWithCalories (SearchContext | None): Its bestValue is the best score of the cookies with exactly 500 calories found so far.
+              None if this score is not searched.
         """
-        numberOfTeaspoon: int = 100         # Number of teaspoon of ingredients that should be used.
+        numberOfTeaspoon: int = 100                                                         # Number of teaspoon of ingredients that should be used.
+        cookieScore: int | None = None                                                      # Score of the cookie when all ingredients are used.
+        searchContext: SearchContext = context if context is not None else contextWithCalories   # Context counting the effort of the enumeration.
         
-        # If all ingredients are used, we can try to update the best cookie if the calorie are not counted or equal to 500.
+        # If all ingredients are used, we can try to update the best cookie, and the best cookie with 500 calories.
+        # The calories are checked first, so that the score is computed only for the cookies that can be kept.
         if len(quantityOfIngredients) == len(listOfIngredients):
-            if not isCalorieCounted or 500 == sum(quantityOfIngredients[i] * listOfIngredients[i]["calories"] for i in range(len(listOfIngredients))):
-                Year2015_Solution._day_15_cookieWithMaxScore = max(Year2015_Solution._day_15_cookieWithMaxScore, Year2015_Solution._day_15_helper_computeCookieValue(listOfIngredients, quantityOfIngredients))
+            if searchContext.effort is not None:
+                searchContext.effort["leavesReached"] += 1
+            if context is not None:
+                cookieScore = Year2015_Solution._day_15_helper_computeCookieValue(listOfIngredients, quantityOfIngredients)
+                if context.effort is not None:
+                    context.effort["bestUpdates"] += int(cookieScore > context.bestValue)
+                context.bestValue = max(context.bestValue, cookieScore)
+            if contextWithCalories is not None \
+            and 500 == sum(quantityOfIngredients[i] * listOfIngredients[i].calories for i in range(len(listOfIngredients))):
+                if cookieScore is None:
+                    cookieScore = Year2015_Solution._day_15_helper_computeCookieValue(listOfIngredients, quantityOfIngredients)
+                if contextWithCalories.effort is not None:
+                    contextWithCalories.effort["bestUpdates"] += int(cookieScore > contextWithCalories.bestValue)
+                contextWithCalories.bestValue = max(contextWithCalories.bestValue, cookieScore)
+            return
+
+        # Count the node when the effort of the search is counted.
+        if searchContext.effort is not None:
+            searchContext.effort["nodesExpanded"] += 1
         
         # If one ingredient is missing only, the quantity has to be the number of missing teaspoon. Add it and and the next call it will check which
         # Cookie is the best.
-        elif len(quantityOfIngredients) == (len(listOfIngredients) - 1):
+        if len(quantityOfIngredients) == (len(listOfIngredients) - 1):
             quantityOfIngredients.append(numberOfTeaspoon - sum(quantityOfIngredients))
-            Year2015_Solution._day_15_helper_getMaxScore(listOfIngredients, quantityOfIngredients, isCalorieCounted)
+            Year2015_Solution._day_15_helper_getMaxScore(listOfIngredients, quantityOfIngredients, context, contextWithCalories)
             quantityOfIngredients.pop()
         
         # If multiple ingredient are missing, multiple choice can be done. We could add from 0 to nbMissingIngredients the next ingredient.
         else:
             for i in range(0, numberOfTeaspoon - sum(quantityOfIngredients)):
                 quantityOfIngredients.append(i)
-                Year2015_Solution._day_15_helper_getMaxScore(listOfIngredients, quantityOfIngredients, isCalorieCounted)
+                Year2015_Solution._day_15_helper_getMaxScore(listOfIngredients, quantityOfIngredients, context, contextWithCalories)
                 quantityOfIngredients.pop()
     
     @staticmethod
-    def _day_15_helper_computeCookieValue(listOfIngredients: list[dict[str, int]], quantityOfIngredients: list[int]) -> int:
+    def _day_15_helper_computeCookieValue(listOfIngredients: list[Ingredient], quantityOfIngredients: list[int]) -> int:
         """
         Helper for the solution for day 15. Compute the score of a given cookie.
         https://adventofcode.com/2015/day/15
 
         Args:
-            - listOfIngredients (list[dict[str, int]]): List of all ingredients with their caracteristics stored in a map.
+            - listOfIngredients (list[Ingredient]): List of all ingredients with their caracteristics.
             - quantityOfIngredients (list[int]): Number of teaspoon of each ingredient, in the same order.
         Returns:
             Score of the current cookie.
         """
-        numberOfElements = len(listOfIngredients)                           # Number of caracteristic an ingredient has.
-        scores = [0 for _ in range(len(listOfIngredients[0]) - 1)]          # Score for each caracteristic of a cookie.
-        ingredientIndex: int                                                # Index of a caracteristic in the map of cookies.
-        scoresIndex: int                                                    # Index of the score we are looking at when looking an ingredient.
+        scores: list[int] = [0, 0, 0, 0]                                    # Score for each caracteristic of a cookie (capacity, durability, flavor, texture).
+        ingredient: Ingredient                                              # Ingredient we are looking at.
+        quantity: int                                                       # Number of teaspoon of this ingredient.
         
-        # Iterating among all characteristics
-        for ingredientIndex in range(numberOfElements):
-            
-            # Re-Initialize the index of the score of the map
-            scoresIndex = 0
+        # Iterating among all ingredients, the calories do not count for score.
+        for ingredient, quantity in zip(listOfIngredients, quantityOfIngredients):
             
-            # Iterating among all caracteristics
-            for key, val in listOfIngredients[ingredientIndex].items():
-                
-                # If the caracteristic is calories, it does not count for score
-                if "calories" == key:
-                    continue
-                
-                # Compute the score of the caracteristic
-                scores[scoresIndex] += quantityOfIngredients[ingredientIndex] * val
-                # Go to the next caracteristic to count
-                scoresIndex += 1
+            # Compute the score of each caracteristic
+            scores[0] += quantity * ingredient.capacity
+            scores[1] += quantity * ingredient.durability
+            scores[2] += quantity * ingredient.flavor
+            scores[3] += quantity * ingredient.texture
 
         # If we have at least one negative score, the global score of the cookie is 0.
         if any(element <= 0 for element in scores):
             return 0
         
         # Return the score of a cookie: the product of all caracteristics.
-        return int(np.prod(scores))
+        return prod(scores)
 
     @staticmethod
-    def _day_15_helper_constructTableOfIngredients() -> list[dict[str, int]]:
+    def _day_15_helper_constructTableOfIngredients() -> list[Ingredient]:
         """
         Helper for the solution for day 15. Create a table that contains all mapping of information for each ingredients.
         https://adventofcode.com/2015/day/15
 
         Returns:
-            A list which contains the map of each ingredient.
+            A list which contains each ingredient.
         """
-        listOfAllIngredients: list[dict[str, int]] = []              # Output table that contains all needed information.
-        mappingOfOneIngredient: dict[str, int]                       # One map for a given ingredient.
-        lines: list[str]                                            # All lines of the input of the problem.
-        line: str                                                   # String representing the input line by line.
-        regexForIngredients: str = r'\b[A-Za-z]+\s[-]?\d+\b'        # Regex for finding informations of the ingredients.
-        matches: list[str]                                    # Table that contain the output of the search via the regex.
-
-        # Retrieve the input of the problem.
-        lines = ReadFile.getLines(15)
-
-        # Iterating among all ingredients
-        for line in lines:
-            # Find all caracteristics of the ingredient
-            matches = findall(regexForIngredients, line)
-
-            # Construct the information of the current ingredient 
-            mappingOfOneIngredient = {match.split()[0]: int(match.split()[1]) for match in matches}
-
-            # Add the ingredient to the list of known ingredients
-            listOfAllIngredients.append(mappingOfOneIngredient)
-        
-        # Return all ingredients formatted
-        return listOfAllIngredients
+        # Retrieve the caracteristics of each ingredient, parsed from the input file.
+        return InputParser.parseDay15()
 
     @staticmethod
     def _day_15_Part_1() -> int:
@@ -1643,19 +1898,17 @@ class Year2015_Solution():
         Returns:
             The best score a cookie can have!
         """
-        tableOfIngredients: list[dict[str, int]]        # Table of used ingredients
+        tableOfIngredients: list[Ingredient]            # Table of used ingredients
+        context: SearchContext = SearchContext(0)       # State of the search, with the best score found.
         
         # Retrieve ingredients and their caracteristics
         tableOfIngredients = Year2015_Solution._day_15_helper_constructTableOfIngredients()
 
-        # Re-initialize the max score ever found.
-        Year2015_Solution._day_15_cookieWithMaxScore = 0
-
-        # Find the cookie with the best score, without looking at calories.
-        Year2015_Solution._day_15_helper_getMaxScore(tableOfIngredients, [], False)
+        # Find the cookie with the best score.
+        Year2015_Solution._day_15_helper_getMaxScore(tableOfIngredients, [], context, None)
 
-        # Return the best score obtained.
-        return Year2015_Solution._day_15_cookieWithMaxScore
+        # Return the best score obtained, without looking at calories.
+        return context.bestValue
 
     @staticmethod
     def _day_15_Part_2() -> int:
@@ -1666,19 +1919,34 @@ class Year2015_Solution():
         Returns:
             The best score a cookie can have when calories should be 500!
         """
-        tableOfIngredients: list[dict[str, int]]        # Table of used ingredients
+        tableOfIngredients: list[Ingredient]            # Table of used ingredients
+        context: SearchContext = SearchContext(0)       # State of the search, with the best score found among cookies of 500 calories.
         
         # Retrieve ingredients and their caracteristics
         tableOfIngredients = Year2015_Solution._day_15_helper_constructTableOfIngredients()
 
-        # Re-initialize the max score ever found.
-        Year2015_Solution._day_15_cookieWithMaxScore = 0
+        # Find the cookie with the best score.
+        Year2015_Solution._day_15_helper_getMaxScore(tableOfIngredients, [], None, context)
+
+        # Return the best score obtained, taking care of the number of calories.
+        return context.bestValue
+
+    @staticmethod
+    def _day_15_Parts() -> tuple[int, int]:
+        """
+        Get solutions for day 15, Part 1 and Part 2
+        https://adventofcode.com/2015/day/15
+
+        Returns:
+            The best score a cookie can have, and the best score a cookie with 500 calories can have.
+        """
+        context: SearchContext = SearchContext(0)               # State of the search, with the best score of all cookies.
+        contextWithCalories: SearchContext = SearchContext(0)   # Best score of the cookies with 500 calories.
 
-        # Find the cookie with the best score, and taking care of the number of calories.
-        Year2015_Solution._day_15_helper_getMaxScore(tableOfIngredients, [], True)
+        # Enumerate every cookie once, both scores are kept during the enumeration.
+        Year2015_Solution._day_15_helper_getMaxScore(Year2015_Solution._day_15_helper_constructTableOfIngredients(), [], context, contextWithCalories)
 
-        # Return the best score obtained.
-        return Year2015_Solution._day_15_cookieWithMaxScore
+        return (context.bestValue, contextWithCalories.bestValue)
 
     @staticmethod
     def _day_16_helper_getInformationFromMFCSAM() -> dict[str, int]:
@@ -1715,25 +1983,19 @@ class Year2015_Solution():
         Returns:
             Which one of the 500 aunt Sue send a gift.
         """
-        lines: list[str]                                            # All lines of the input of the problem.
-        line: str                                                   # String representing the input line by line.
-        matches: list[str]                                          # Matches of the information we have about the current Aunt Sue.
-        regexForItemAndValue: str = r'\b[A-Za-z]+:\s\d+\b'          # Regex for finding information about the current Sue
+        aunts: Iterator[AuntSue]                                    # Information we have about each Aunt Sue.
+        mappingOfInformations: AuntSue                              # Information we have about the current Aunt Sue.
         informationFromMFCSAM: dict[str, int]                       # Dictionnary that contains information of the letter received.
         areAllInformationCorrect: bool                              # States if all information are passing for the current Sue.
 
-        # Retrieve the input of the problem.
-        lines = ReadFile.getLines(16)
+        # Retrieve the Aunts Sue of the input, parsed while they are read.
+        aunts = InputParser.parseDay16()
 
         # Retrieve the information from the letter
         informationFromMFCSAM = Year2015_Solution._day_16_helper_getInformationFromMFCSAM()
 
         # Iterate among all aunts
-        for index, line in enumerate(lines):
-            
-            # Find all characteristic of the current Sue and store it in a map
-            matches = findall(regexForItemAndValue, line)
-            mappingOfInformations = {match.split()[0][:-1]: int(match.split()[1]) for match in matches}
+        for index, mappingOfInformations in enumerate(aunts):
             
             # Re-init the information correctness
             areAllInformationCorrect = True
@@ -1761,25 +2023,19 @@ class Year2015_Solution():
         Returns:
             Which one of the 500 aunt Sue send a gift.
         """
-        lines: list[str]                                            # All lines of the input of the problem.
-        line: str                                                   # String representing the input line by line.
-        matches: list[str]                                          # Matches of the information we have about the current Aunt Sue.
-        regexForItemAndValue: str = r'\b[A-Za-z]+:\s\d+\b'          # Regex for finding information about the current Sue
+        aunts: Iterator[AuntSue]                                    # Information we have about each Aunt Sue.
+        mappingOfInformations: AuntSue                              # Information we have about the current Aunt Sue.
         informationFromMFCSAM: dict[str, int]                       # Dictionnary that contains information of the letter received.
         areAllInformationCorrect: bool                              # States if all information are passing for the current Sue.
 
-        # Retrieve the input of the problem.
-        lines = ReadFile.getLines(16)
+        # Retrieve the Aunts Sue of the input, parsed while they are read.
+        aunts = InputParser.parseDay16()
 
         # Retrieve the information from the letter
         informationFromMFCSAM = Year2015_Solution._day_16_helper_getInformationFromMFCSAM()
 
         # Iterate among all aunts
-        for index, line in enumerate(lines):
-            
-            # Find all characteristic of the current Sue and store it in a map
-            matches = findall(regexForItemAndValue, line)
-            mappingOfInformations = {match.split()[0][:-1]: int(match.split()[1]) for match in matches}
+        for index, mappingOfInformations in enumerate(aunts):
             
             # Re-init the information correctness
             areAllInformationCorrect = True
@@ -1813,12 +2069,10 @@ class Year2015_Solution():
         # Should not be there, it would mean that no Sue is valid.
         return -1
     
-    _day_17_dictOfCombination: dict[int, int] = {}
-
     @staticmethod
-    def _day_17_helper_findNumberOfCombination(listOfContainers: list[int], indexOfContainer: int, eggnogMissing: int, currentNumber: int):
+    def _day_17_helper_findNumberOfCombination(listOfContainers: list[int], indexOfContainer: int, eggnogMissing: int, currentNumber: int, context: SearchContext):
         """
-        Helper for the solution for day 17. Fill the dictOfCombination variable to find the quantity of possible combinaison
+        Helper for the solution for day 17. Fill the valuesByKey of the context to find the quantity of possible combinaison
         for the different number of containers choosen.
         https://adventofcode.com/2015/day/17
 
@@ -1827,18 +2081,28 @@ class Year2015_Solution():
             - indexOfContainer (int): Index of the container we are going to fill or not
             - eggnogMissing: (int): Eggnog that still has to be put on a container.
             - currentNumber (int): Number of containers that are already filled.
+            - context (SearchContext): State of the search. Its valuesByKey maps a number of containers to the number of combinations using it,
+              and its bestValue is the smallest number of containers found.
         """
         # If all the eggnog is in container, add the information in the dict and stop the function.
         if 0 == eggnogMissing:
-            if currentNumber not in Year2015_Solution._day_17_dictOfCombination:
-                Year2015_Solution._day_17_dictOfCombination[currentNumber] = 1
+            if context.effort is not None:
+                context.effort["leavesReached"] += 1
+                context.effort["bestUpdates"] += int(currentNumber < context.bestValue)
+            context.bestValue = min(context.bestValue, currentNumber)
+            if currentNumber not in context.valuesByKey:
+                context.valuesByKey[currentNumber] = 1
             else:
-                Year2015_Solution._day_17_dictOfCombination[currentNumber] += 1
+                context.valuesByKey[currentNumber] += 1
             return
         
         # If we reached the end of the table, we don't have anymore containers.
         if indexOfContainer == len(listOfContainers):
             return
+
+        # Count the node when the effort of the search is counted.
+        if context.effort is not None:
+            context.effort["nodesExpanded"] += 1
         
         # Iterate among 0 and 1: Take the current container or not.
         for nbOfContainer in range(0, 2):
@@ -1851,7 +2115,9 @@ class Year2015_Solution():
             
             # If there is still eggnog, call the function with the next container index
             if 0 <= eggnogMissing:
-                Year2015_Solution._day_17_helper_findNumberOfCombination(listOfContainers, indexOfContainer + 1, eggnogMissing, currentNumber)
+                Year2015_Solution._day_17_helper_findNumberOfCombination(listOfContainers, indexOfContainer + 1, eggnogMissing, currentNumber, context)
+            elif context.effort is not None:
+                context.effort["nodesPruned"] += 1
             
             # Decrement (or not) the number of container according to if we filled the current container.
             currentNumber += nbOfContainer
@@ -1861,15 +2127,14 @@ class Year2015_Solution():
             eggnogMissing += nbOfContainer * listOfContainers[indexOfContainer]
 
     @staticmethod
-    def _day_17_Part_1() -> int:
+    def _day_17_helper_getCombinationsByNumberOfContainers() -> dict[int, int]:
         """
-        Get solution for day 17, Part 1
+        Helper for the solution for day 17. Find all the combinations of containers that can fit exactly 150 litters of eggnog.
         https://adventofcode.com/2015/day/17
 
         Returns:
-            How much combinations of containers can fit exactly 150 litters of eggnog.
+            The number of combinations for each number of containers used.
         """
-
         lines: list[str]        # All lines of the input of the problem.
         containers: list[int]   # All possible containers.
 
@@ -1883,14 +2148,25 @@ class Year2015_Solution():
         containers.sort()
         containers.reverse()
 
-        # Re-initialize the possible combination.
-        Year2015_Solution._day_17_dictOfCombination = {}
+        # Create the state of the search, which will contain the possible combinations and the smallest number of containers.
+        context: SearchContext = SearchContext(maxsize)
 
         # Call the dfs function to find all possibilities of storing eggnogs.
-        Year2015_Solution._day_17_helper_findNumberOfCombination(containers, 0, 150, 0)
+        Year2015_Solution._day_17_helper_findNumberOfCombination(containers, 0, 150, 0, context)
+
+        return context.valuesByKey
+
+    @staticmethod
+    def _day_17_Part_1() -> int:
+        """
+        Get solution for day 17, Part 1
+        https://adventofcode.com/2015/day/17
 
+        Returns:
+            How much combinations of containers can fit exactly 150 litters of eggnog.
+        """
         # Return the total number of combination.
-        return sum(val for _, val in Year2015_Solution._day_17_dictOfCombination.items())
+        return sum(Year2015_Solution._day_17_helper_getCombinationsByNumberOfContainers().values())
     
     @staticmethod
     def _day_17_Part_2() -> int:
@@ -1902,36 +2178,32 @@ class Year2015_Solution():
             How much combinations of containers can fit exactly 150 litters of eggnog, according to
             the smallest number of containers we want.
         """
+        combinationsByNumberOfContainers: dict[int, int]    # Number of combinations for each number of containers used.
 
-        lines: list[str]                            # All lines of the input of the problem.
-        containers: list[int]                       # All possible containers.
-        smallestNumberOfContainers: int = maxsize   # Number of containers we took for making the smallest possible combination.
-        numberOfCombinations: int = 0               # Number of valid combinations.
-        
-        # Retrieve the input of the problem.
-        lines = ReadFile.getLines(17)
-        
-        # Get the list of all possible size.
-        containers = [int(line) for line in lines]
+        # Find all possibilities of storing eggnogs.
+        combinationsByNumberOfContainers = Year2015_Solution._day_17_helper_getCombinationsByNumberOfContainers()
 
-        # Sorting containers and revert them to try filling the biggest possible first.
-        containers.sort()
-        containers.reverse()
+        # Return the total number of combination for the smaller number of container
+        return combinationsByNumberOfContainers[min(combinationsByNumberOfContainers)] if combinationsByNumberOfContainers else 0
 
-        # Re-initialize the possible combination.
-        Year2015_Solution._day_17_dictOfCombination = {}
+    @staticmethod
+    def _day_17_Parts() -> tuple[int, int]:
+        """
+        Get solutions for day 17, Part 1 and Part 2
+        https://adventofcode.com/2015/day/17
 
-        # Call the dfs function to find all possibilities of storing eggnogs.
-        Year2015_Solution._day_17_helper_findNumberOfCombination(containers, 0, 150, 0)
+        Returns:
+            How much combinations of containers can fit exactly 150 litters of eggnog, in total and for the smallest
+            number of containers.
+        """
+        combinationsByNumberOfContainers: dict[int, int]    # Number of combinations for each number of containers used.
 
-        # Find the smallest number of containers used and store the number of combination for this amount of container.
-        for key, val in Year2015_Solution._day_17_dictOfCombination.items():
-            if key < smallestNumberOfContainers:
-                smallestNumberOfContainers = key
-                numberOfCombinations = val
+        # Find all possibilities of storing eggnogs once.
+        combinationsByNumberOfContainers = Year2015_Solution._day_17_helper_getCombinationsByNumberOfContainers()
 
-        # Return the total number of combination for the smaller number of container
-        return numberOfCombinations
+        # Return the total number of combinations, and the number of combinations using the smallest number of containers.
+        return (sum(combinationsByNumberOfContainers.values()),
+                combinationsByNumberOfContainers[min(combinationsByNumberOfContainers)] if combinationsByNumberOfContainers else 0)
 
     @staticmethod
     def _day_18_helper_getNextStateForOneLight(currentLightState: int, sumSurrounding: int) -> int:
@@ -2060,19 +2332,18 @@ class Year2015_Solution():
         return lightsState
 
     @staticmethod
-    def _day_18_Part_1() -> int:
+    def _day_18_helper_getLightsState() -> list[list[int]]:
         """
-        Get solution for day 18, Part 1
+        Helper for the solution for day 18. Create the matrix of the lights from the input.
         https://adventofcode.com/2015/day/18
 
         Returns:
-            How many lights are on after 100 steps.
+            Matrix containg 1 for on lights, and 0 for off lights.
         """
         lines: list[str]                                            # All lines of the input of the problem.
         line: str                                                   # String representing the input line by line.
-        lightsState: list[list[int]] = []                           # Matrix containg all information about the lights at a given step.
-        numberOfSteps: int = 100                                    # Number of steps the process is repeated.
-        
+        lightsState: list[list[int]] = []                           # Matrix containg all information about the lights.
+
         # Retrieve the input of the problem.
         lines = ReadFile.getLines(18)
 
@@ -2080,12 +2351,41 @@ class Year2015_Solution():
         for line in lines:
             line = line.strip()
             lightsState.append([1 if "#" == letter else 0 for letter in line])
-        
+
+        return lightsState
+
+    @staticmethod
+    def _day_18_helper_getNumberOfLightsOn(lightsState: list[list[int]], areCornerStucked: bool) -> int:
+        """
+        Helper for the solution for day 18. Find how many lights are on after 100 steps.
+        https://adventofcode.com/2015/day/18
+
+        Returns:
+            How many lights are on after 100 steps.
+
+        Args:
+            lightsState (list[list[int]]): Lights before the first step. Not modified by the steps.
+            areCornerStucked (bool): True if the lights in the corners are always on.
+        """
+        numberOfSteps: int = 100                                    # Number of steps the process is repeated.
+
         # Get the state after numberOfSteps iterations.
-        lightsState = Year2015_Solution._day_18_helper_getNextSteps(lightsState, numberOfSteps, False)
+        lightsState = Year2015_Solution._day_18_helper_getNextSteps(lightsState, numberOfSteps, areCornerStucked)
 
         # Return the number of lights that are on.
         return sum(sum(lightLine) for lightLine in lightsState)
+
+    @staticmethod
+    def _day_18_Part_1() -> int:
+        """
+        Get solution for day 18, Part 1
+        https://adventofcode.com/2015/day/18
+
+        Returns:
+            How many lights are on after 100 steps.
+        """
+        # Return the number of lights that are on.
+        return Year2015_Solution._day_18_helper_getNumberOfLightsOn(Year2015_Solution._day_18_helper_getLightsState(), False)
     
     @staticmethod
     def _day_18_Part_2() -> int:
@@ -2096,24 +2396,26 @@ class Year2015_Solution():
         Returns:
             How many lights are on after 100 steps when corner are blocked.
         """
-        lines: list[str]                                            # All lines of the input of the problem.
-        line: str                                                   # String representing the input line by line.
-        lightsState: list[list[int]] = []                           # Matrix containg all information about the lights at a given step.
-        numberOfSteps: int = 100                                    # Number of steps the process is repeated.
-        
-        # Retrieve the input of the problem.
-        lines = ReadFile.getLines(18)
+        # Return the number of lights that are on. The corner are stucked in this part.
+        return Year2015_Solution._day_18_helper_getNumberOfLightsOn(Year2015_Solution._day_18_helper_getLightsState(), True)
 
-        # Iterating among all lines. Create a matrix with 1 for on lights, and 0 for off lights.
-        for line in lines:
-            line = line.strip()
-            lightsState.append([1 if "#" == letter else 0 for letter in line])
-        
-        # Get the state after numberOfSteps iterations. The corner are stucked in this part.
-        lightsState = Year2015_Solution._day_18_helper_getNextSteps(lightsState, numberOfSteps, True)
+    @staticmethod
+    def _day_18_Parts() -> tuple[int, int]:
+        """
+        Get solutions for day 18, Part 1 and Part 2
+        https://adventofcode.com/2015/day/18
 
-        # Return the number of lights that are on.
-        return sum(sum(lightLine) for lightLine in lightsState)
+        Returns:
+            How many lights are on after 100 steps, when corner are free and when corner are blocked.
+        """
+        initialLightsState: list[list[int]]                         # Matrix of the lights before the first step. Not modified by the steps.
+
+        # Retrieve the input of the problem once.
+        initialLightsState = Year2015_Solution._day_18_helper_getLightsState()
+
+        # Return the number of lights that are on for both rules.
+        return (Year2015_Solution._day_18_helper_getNumberOfLightsOn(initialLightsState, False),
+                Year2015_Solution._day_18_helper_getNumberOfLightsOn(initialLightsState, True))
     
     @staticmethod
     def _day_19_Part_1() -> int:
@@ -2534,46 +2836,48 @@ class Year2015_Solution():
         """
 
         val: dict[str, int] = {'b': 0, 'a': initValueOfRegisterA}   # Register with their different values
-        lines: list[str] = ReadFile.getLines(23)     # All executions that may be executed.
+        instructions: list[tuple[str, str, int]] = InputParser.parseDay23()     # All executions that may be executed.
         lineIndex: int = 0                                          # Index of the current execution
-        elementsOfInstruction: list[str]                            # Elements that are on the instruction we are executing.
+        nameOfInstruction: str                                      # Name of the instruction we are executing.
+        register: str                                               # Register used by the instruction we are executing.
+        offset: int                                                 # Offset of the jump of the instruction we are executing.
 
         # While the index is pointeing to a valid instruction, execute instruction.
-        while 0 <= lineIndex and len(lines) > lineIndex:
+        while 0 <= lineIndex and len(instructions) > lineIndex:
             
             # Retrieve the elements of the instruction.
-            elementsOfInstruction = findall(r"[a-z]+", lines[lineIndex])
+            nameOfInstruction, register, offset = instructions[lineIndex]
             
             # Divide by 2 the value of the register, and go to the next instruction
-            if "hlf" == elementsOfInstruction[0]:
-                val[elementsOfInstruction[-1]] = int(val[elementsOfInstruction[-1]] / 2)
+            if "hlf" == nameOfInstruction:
+                val[register] = int(val[register] / 2)
                 lineIndex += 1
             
             # Triple the value of the register, and go to the next instruction
-            elif "tpl" == elementsOfInstruction[0]:
-                val[elementsOfInstruction[-1]] = val[elementsOfInstruction[-1]] * 3
+            elif "tpl" == nameOfInstruction:
+                val[register] = val[register] * 3
                 lineIndex += 1
             
             # Increment by 1 the value of the register, and go to the next instruction
-            elif "inc" == elementsOfInstruction[0]:
-                val[elementsOfInstruction[-1]] += 1
+            elif "inc" == nameOfInstruction:
+                val[register] += 1
                 lineIndex += 1
             
             # Jump a given number of instruction
-            elif "jmp" == elementsOfInstruction[0]:
-                lineIndex += int(findall(r"-?\d+", lines[lineIndex])[0])
+            elif "jmp" == nameOfInstruction:
+                lineIndex += offset
             
             # Jump a given number of instruction if the value in the register is even. Else, go to the next instruction.
-            elif "jie" == elementsOfInstruction[0]:
-                if 0 == val[elementsOfInstruction[-1]] % 2:
-                    lineIndex += int(findall(r"-?\d+", lines[lineIndex])[0])
+            elif "jie" == nameOfInstruction:
+                if 0 == val[register] % 2:
+                    lineIndex += offset
                 else:
                     lineIndex += 1
             
             # Jump a given number of instruction if the value in the register is one. Else, go to the next instruction.
-            elif "jio" == elementsOfInstruction[0]:
-                if 1 == val[elementsOfInstruction[-1]]:
-                    lineIndex += int(findall(r"-?\d+", lines[lineIndex])[0])
+            elif "jio" == nameOfInstruction:
+                if 1 == val[register]:
+                    lineIndex += offset
                 else:
                     lineIndex += 1
         
@@ -2616,8 +2920,6 @@ class Year2015_Solution():
         # Return the final value of b.
         return valueOfRegisterBAfterExecutions
 
-    _day_24_minQEForEqualWeights: int = maxsize
-    
     @staticmethod
     def _day_24_helper_getQE(listOfWeight: list[int], listOfChoosen: list[bool]) -> int:
         """
@@ -2644,7 +2946,7 @@ class Year2015_Solution():
         return quantumEtranglement
     
     @staticmethod
-    def _day_24_helper_dfsFoundSmallestQE(listOfWeight: list[int], indexOfPackage: int, currentWeight: int, targetWeight: int, listOfChoosen: list[bool]):
+    def _day_24_helper_dfsFoundSmallestQE(listOfWeight: list[int], indexOfPackage: int, currentWeight: int, targetWeight: int, listOfChoosen: list[bool], context: SearchContext):
         """
         Helper for the solution for day 24. Find the smallest QE possible by using dfs.
         https://adventofcode.com/2015/day/24
@@ -2655,17 +2957,25 @@ class Year2015_Solution():
             currentWeight (int): Weight that is currently taken.
             targetWeight (int): Weight that should be on each zone of the sleigh.
             listOfChoosen (list[bool]): Booleans that states if each package is taken or not.
+            context (SearchContext): State of the search. Its best value is the smallest QE found.
         """
         
         # If the current weight is the one wanted, we can compute the QE of the new package and stop the function
         # (as long as no package has a null weight)
         if currentWeight == targetWeight:
-            Year2015_Solution._day_24_minQEForEqualWeights = min(Year2015_Solution._day_24_minQEForEqualWeights, Year2015_Solution._day_24_helper_getQE(listOfWeight, listOfChoosen))
+            if context.effort is not None:
+                context.effort["leavesReached"] += 1
+                context.effort["bestUpdates"] += int(Year2015_Solution._day_24_helper_getQE(listOfWeight, listOfChoosen) < context.bestValue)
+            context.bestValue = min(context.bestValue, Year2015_Solution._day_24_helper_getQE(listOfWeight, listOfChoosen))
             return
         
         # If we reached the end of the list, we can stop the call.
         if indexOfPackage == len(listOfWeight):
             return
+
+        # Count the node when the effort of the search is counted.
+        if context.effort is not None:
+            context.effort["nodesExpanded"] += 1
         
         # Choose or not the package in the current group.
         for isPackageChoosen in (True, False):
@@ -2676,35 +2986,46 @@ class Year2015_Solution():
             
             # If we can add more weight on the current group, call the function with the next package.
             if targetWeight >= currentWeight:
-                Year2015_Solution._day_24_helper_dfsFoundSmallestQE(listOfWeight, indexOfPackage + 1, currentWeight, targetWeight, listOfChoosen)
+                Year2015_Solution._day_24_helper_dfsFoundSmallestQE(listOfWeight, indexOfPackage + 1, currentWeight, targetWeight, listOfChoosen, context)
+            elif context.effort is not None:
+                context.effort["nodesPruned"] += 1
 
             # Delete the weight of the package we are not taking anymore.
             currentWeight -= listOfWeight[indexOfPackage] * int(isPackageChoosen)
             listOfChoosen[indexOfPackage] = False
             
     @staticmethod
-    def _day_24_helper_getMinQEForNumberOfGroup(numberOfGroups: int) -> int:
+    def _day_24_helper_getWeightOfPackages() -> list[int]:
         """
-        Helper for the solution for day 24. Construct the searching for the smallest QE, according to the number of groups done.
+        Helper for the solution for day 24. Retrieve the weight of the packages from the input.
         https://adventofcode.com/2015/day/24
 
-        Args:
-            numberOfGroups (int): Number of group of packages that should be the same weight.
-        
         Returns:
-            Smallest Quantum etranglement for the given number of groups.
+            Weight of all packages.
         """
         lines: list[str]                # Input of the problem
-        weightOfPackages: list[int]     # Weight of all packages.
-        
-        # Re-initialize the value of the QE to max because we want the smallest possible.
-        Year2015_Solution._day_24_minQEForEqualWeights = maxsize
 
         # Retrieve the input of the problem.
         lines = ReadFile.getLines(24)
 
         # Convert the weights to integer.
-        weightOfPackages = [int(line) for line in lines]
+        return [int(line) for line in lines]
+
+    @staticmethod
+    def _day_24_helper_getMinQEForNumberOfGroup(weightOfPackages: list[int], numberOfGroups: int) -> int:
+        """
+        Helper for the solution for day 24. Construct the searching for the smallest QE, according to the number of groups done.
+        https://adventofcode.com/2015/day/24
+
+        Args:
+            weightOfPackages (list[int]): Weight of all packages.
+            numberOfGroups (int): Number of group of packages that should be the same weight.
+        
+        Returns:
+            Smallest Quantum etranglement for the given number of groups.
+        """
+        # Initialize the value of the QE to max because we want the smallest possible.
+        context: SearchContext = SearchContext(maxsize)
 
         # Compute the total weight that should be on each area.
         totalWeightPerArea: int = int(sum(package for package in weightOfPackages) / numberOfGroups)
@@ -2713,10 +3034,10 @@ class Year2015_Solution():
         isPackageChoosen = [False for _ in range(len(weightOfPackages))]
         
         # Use DFS to find the smallest QE possible.
-        Year2015_Solution._day_24_helper_dfsFoundSmallestQE(weightOfPackages, 0, 0, totalWeightPerArea, isPackageChoosen)
+        Year2015_Solution._day_24_helper_dfsFoundSmallestQE(weightOfPackages, 0, 0, totalWeightPerArea, isPackageChoosen, context)
         
         # Return the minimum QE that has been found.
-        return Year2015_Solution._day_24_minQEForEqualWeights
+        return context.bestValue
 
     @staticmethod
     def _day_24_Part_1() -> int:
@@ -2731,7 +3052,7 @@ class Year2015_Solution():
         minQEForThreeParts: int        # Value of the QE
 
         # Retrieve the value of the smallest QE for 3 equal parts
-        minQEForThreeParts = Year2015_Solution._day_24_helper_getMinQEForNumberOfGroup(3)
+        minQEForThreeParts = Year2015_Solution._day_24_helper_getMinQEForNumberOfGroup(Year2015_Solution._day_24_helper_getWeightOfPackages(), 3)
 
         # Return the value of the QE.
         return minQEForThreeParts
@@ -2749,11 +3070,28 @@ class Year2015_Solution():
         minQEForThreeParts: int        # Value of the QE
 
         # Retrieve the value of the smallest QE for 4 equal parts
-        minQEForThreeParts = Year2015_Solution._day_24_helper_getMinQEForNumberOfGroup(4)
+        minQEForThreeParts = Year2015_Solution._day_24_helper_getMinQEForNumberOfGroup(Year2015_Solution._day_24_helper_getWeightOfPackages(), 4)
 
         # Return the value of the QE.
         return minQEForThreeParts
 
+    @staticmethod
+    def _day_24_Parts() -> tuple[int, int]:
+        """
+        Get solutions for day 24, Part 1 and Part 2
+        https://adventofcode.com/2015/day/24
+
+        Returns:
+            Smallest QE possible when the weight is divided in 3 parts, and in 4 parts.
+        """
+        weightOfPackages: list[int]     # Weight of all packages.
+
+        # Retrieve the weights once. Both searches have a different target weight, so they can't share their enumeration.
+        weightOfPackages = Year2015_Solution._day_24_helper_getWeightOfPackages()
+
+        return (Year2015_Solution._day_24_helper_getMinQEForNumberOfGroup(weightOfPackages, 3),
+                Year2015_Solution._day_24_helper_getMinQEForNumberOfGroup(weightOfPackages, 4))
+
     @staticmethod
     def _day_25_Part_1():
         """
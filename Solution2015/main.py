@@ -1,6 +1,47 @@
-from Year2015_Solution import Year2015_Solution
+from LimitExceeded import LimitExceeded
+from ReadFile import ReadFile
+from SolutionRunner import SolutionRunner
+from argparse import ArgumentParser, Namespace
+from json import dumps
+from os import cpu_count
 
 if __name__ == "__main__":
-    for day in range(1, 26):
-        for isFirstPart in (True, False):
-            print(f"Solution for year 2015, day {day:02d} part {'1' if isFirstPart else '2'} is: {Year2015_Solution.getSolution(day, isFirstPart)}")
+    parser: ArgumentParser = ArgumentParser(description="Display the solutions of the Advent Of Code 2015.")
+    parser.add_argument("-d", "--day", type=int, nargs="+", default=list(range(1, 26)), help="Days of the solutions (all by default).")
+    parser.add_argument("-p", "--part", type=int, choices=[1, 2], nargs="+", default=[1, 2], help="Parts of the solutions (both by default).")
+    parser.add_argument("-r", "--repeat", type=int, default=1, help="Number of timed runs of each solution.")
+    parser.add_argument("-w", "--warmup", type=int, default=0, help="Number of runs of each solution done before the timed runs.")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="Number of processes used to compute the solutions (0: one per CPU).")
+    parser.add_argument("--bundle", metavar="FILE", help="Read the inputs from a bundle made by InputBundle.py instead of the files of textfiles.")
+    parser.add_argument("--json", action="store_true", help="Print the solutions and their timings as JSON.")
+    parser.add_argument("--profile", metavar="DIRECTORY", help="Profile each solution with cProfile and write the profiles in DIRECTORY.")
+    parser.add_argument("--memory", metavar="DIRECTORY", help="Trace the memory of each solution with tracemalloc and write the reports in DIRECTORY.")
+    parser.add_argument("--timeout", type=float, metavar="SECONDS", help="Stop each solution that takes longer than SECONDS.")
+    parser.add_argument("--memory-limit", type=int, metavar="MIB", help="Stop each solution whose process uses more than MIB mebibytes of address space.")
+    parser.add_argument("--cpu-limit", type=float, metavar="SECONDS", help="Stop each solution that uses more than SECONDS of CPU time.")
+    parser.add_argument("--no-cache", action="store_true", help="Compute every solution, even those already stored on the disk. "
+                                                                "The cache is never used when the runs are repeated or warmed up.")
+    arguments: Namespace = parser.parse_args()
+
+    # The pool of processes inherits the bundle from this process.
+    if arguments.bundle is not None:
+        ReadFile.useInputBundle(arguments.bundle)
+
+    # Timing the same solution several times only makes sense if it is computed each time.
+    isCacheUsed: bool = not arguments.no_cache and 1 >= arguments.repeat and 0 >= arguments.warmup
+    results: list[tuple[int, bool, int | str | LimitExceeded, list[float]]] = SolutionRunner.runAll(
+        arguments.jobs if 0 != arguments.jobs else cpu_count(), arguments.day, profileDirectory=arguments.profile, isCacheUsed=isCacheUsed,
+        memoryReportDirectory=arguments.memory, timeout=arguments.timeout, parts=tuple(arguments.part), numberOfRepetitions=arguments.repeat,
+        numberOfWarmups=arguments.warmup, memoryLimit=arguments.memory_limit * 1024 * 1024 if arguments.memory_limit is not None else None,
+        cpuLimit=arguments.cpu_limit)
+
+    if arguments.json:
+        print(dumps([{"day": day, "part": 1 if isFirstPart else 2,
+                      "solution": str(solution) if isinstance(solution, LimitExceeded) else solution,
+                      "limitExceeded": solution.reason if isinstance(solution, LimitExceeded) else None,
+                      "times": wallTimes} for day, isFirstPart, solution, wallTimes in results], indent=4))
+    else:
+        for day, isFirstPart, solution, wallTimes in results:
+            print(f"Solution for year 2015, day {day:02d} part {'1' if isFirstPart else '2'} is: {solution} ("
+                  + (f"{wallTimes[0]:.3f}s" if 1 == len(wallTimes) else f"runs: {', '.join(f'{wallTime:.4f}s' for wallTime in wallTimes)}; min {min(wallTimes):.4f}s")
+                  + ")")
@@ -0,0 +1,85 @@
+from AnswerCache import AnswerCache
+from ReadFile import ReadFile
+from json import loads
+from os import path
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+
+class FirstSolutions():
+    """
+    Solutions of a day, whose key is compared to the key of other solutions.
+    """
+
+    @staticmethod
+    def _day_01_Part_1() -> int:
+        return len(ReadFile.getText(1))
+
+class SecondSolutions():
+    """
+    Same solutions as FirstSolutions, with another source code.
+    """
+
+    @staticmethod
+    def _day_01_Part_1() -> int:
+        return len(ReadFile.getText(1).strip())
+
+class TestAnswerCache(TestCase):
+    """
+    Tests of the keys and of the storage of the solutions in AnswerCache, with a cache file in a temporary directory.
+    """
+
+    def setUp(self) -> None:
+        self.directory: TemporaryDirectory = TemporaryDirectory()                  # Directory of the cache file, removed after the test.
+        self.cacheFile: str = AnswerCache.CACHE_FILE                               # Cache file restored after the test.
+        AnswerCache.CACHE_FILE = path.join(self.directory.name, "answerCache.json")
+        AnswerCache._entries = None
+
+    def tearDown(self) -> None:
+        AnswerCache.CACHE_FILE = self.cacheFile
+        AnswerCache._entries = None
+        AnswerCache._isModified = False
+        self.directory.cleanup()
+
+    def test_key_changes_with_source(self) -> None:
+        with ReadFile.useInputSource(1, "(()"):
+            self.assertEqual(AnswerCache.getKey(FirstSolutions, 1, True), AnswerCache.getKey(FirstSolutions, 1, True))
+            self.assertNotEqual(AnswerCache.getKey(FirstSolutions, 1, True), AnswerCache.getKey(SecondSolutions, 1, True))
+            self.assertNotEqual(AnswerCache.getKey(FirstSolutions, 1, True), AnswerCache.getKey(FirstSolutions, 1, False))
+
+    def test_key_changes_with_input(self) -> None:
+        with ReadFile.useInputSource(1, "(()"):
+            firstKey: str = AnswerCache.getKey(FirstSolutions, 1, True)
+        with ReadFile.useInputSource(1, "())"):
+            self.assertNotEqual(firstKey, AnswerCache.getKey(FirstSolutions, 1, True))
+
+    def test_store_written_on_flush(self) -> None:
+        AnswerCache.store("first", 1)
+        AnswerCache.store("second", "two")
+        self.assertFalse(path.exists(AnswerCache.CACHE_FILE))
+        self.assertEqual("two", AnswerCache.get("second"))
+
+        AnswerCache.flush()
+        with open(AnswerCache.CACHE_FILE, 'r') as file:
+            self.assertEqual({"first": 1, "second": "two"}, {key: entry["solution"] for key, entry in loads(file.read()).items()})
+
+        # Another process reads the solutions from the file.
+        AnswerCache._entries = None
+        self.assertEqual(1, AnswerCache.get("first"))
+
+    def test_least_recently_used_removed(self) -> None:
+        maxSizeInBytes: int = AnswerCache.MAX_SIZE_IN_BYTES     # Size restored after the test.
+        AnswerCache.MAX_SIZE_IN_BYTES = 100
+        try:
+            for index in range(5):
+                AnswerCache.store(f"solution-{index}", index)
+            AnswerCache.flush()
+        finally:
+            AnswerCache.MAX_SIZE_IN_BYTES = maxSizeInBytes
+
+        with open(AnswerCache.CACHE_FILE, 'r') as file:
+            self.assertIn("solution-4", loads(file.read()))
+        AnswerCache._entries = None
+        self.assertIsNone(AnswerCache.get("solution-0"))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+from AsyncSolver import AsyncSolver
+from InputBundle import InputBundle
+from ReadFile import ReadFile
+from asyncio import gather, run
+from concurrent.futures import ThreadPoolExecutor
+from os import path
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+
+class CountingExecutor(ThreadPoolExecutor):
+    """
+    Pool of threads counting the computations submitted to it.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(max_workers=2)
+        self.numberOfSubmissions: int = 0       # Number of computations submitted.
+
+    def submit(self, *arguments, **keywordArguments):
+        self.numberOfSubmissions += 1
+        return super().submit(*arguments, **keywordArguments)
+
+class TestAsyncSolver(TestCase):
+    """
+    Tests of the solutions computed from asyncio code by AsyncSolver, on the inputs of a bundle.
+    """
+
+    def setUp(self) -> None:
+        self.directory: TemporaryDirectory = TemporaryDirectory()     # Directory of the bundle, removed after the test.
+
+        # Santa ends on floor -1, and enters the basement on the fifth instruction.
+        InputBundle.write(path.join(self.directory.name, "inputs.bin"), {1: b"(()))"})
+        ReadFile.useInputBundle(path.join(self.directory.name, "inputs.bin"))
+
+    def tearDown(self) -> None:
+        AsyncSolver.setExecutor(None)
+        ReadFile.useInputBundle(None)
+        self.directory.cleanup()
+
+    def test_identical_requests_share_computation(self) -> None:
+        async def solveRequests() -> list:
+            return await gather(AsyncSolver.solve(1, False, False), AsyncSolver.solve(1, False, False), AsyncSolver.solve(1, True, False))
+
+        with CountingExecutor() as executor:
+            AsyncSolver.setExecutor(executor)
+            self.assertEqual([5, 5, -1], run(solveRequests()))
+        self.assertEqual(2, executor.numberOfSubmissions)
+        self.assertEqual({}, AsyncSolver._computations)
+
+    def test_default_pool_shut_down(self) -> None:
+        self.assertEqual(-1, run(AsyncSolver.solve(1, True, False)))
+        AsyncSolver.shutdown()
+        self.assertIsNone(AsyncSolver._executor)
+
+    def test_chosen_executor_not_shut_down(self) -> None:
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            AsyncSolver.setExecutor(executor)
+            AsyncSolver.shutdown()
+            self.assertIs(executor, AsyncSolver.getExecutor())
+            self.assertEqual(2, executor.submit(len, "ab").result())
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+from BatchSolver import BatchSolver
+from csv import DictReader
+from io import StringIO
+from json import loads
+from os import makedirs, path
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+
+INPUTS: dict[str, tuple[str, int, int]] = {
+    "01/first.txt": ("(()))", -1, 5),
+    "01/second.txt": ("()())", -1, 5),
+    "02/first.txt": ("2x3x4\n1x1x10\n", 101, 48),
+    "09/first.txt": ("A to B = 1\nA to C = 2\nB to C = 3\n", 3, 5),
+}                                                               # Inputs written in the directory, and their solutions.
+
+class TestBatchSolver(TestCase):
+    """
+    Tests of the inputs of a directory solved by BatchSolver.
+    """
+
+    def setUp(self) -> None:
+        self.directory: TemporaryDirectory = TemporaryDirectory()     # Directory of the inputs, removed after the test.
+
+        for name, (content, _, _) in INPUTS.items():
+            makedirs(path.dirname(path.join(self.directory.name, name)), exist_ok=True)
+            with open(path.join(self.directory.name, name), 'w') as file:
+                file.write(content)
+        # Files that are not inputs are ignored.
+        with open(path.join(self.directory.name, "01", "notes.md"), 'w') as file:
+            file.write("not an input")
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_inputs_found(self) -> None:
+        self.assertEqual([(int(name[:2]), path.join(self.directory.name, name)) for name in INPUTS],
+                         BatchSolver.findInputs(self.directory.name))
+        self.assertEqual([(9, path.join(self.directory.name, "09/first.txt"))], BatchSolver.findInputs(self.directory.name, [3, 9]))
+
+    def test_inputs_solved(self) -> None:
+        inputs: list[tuple[int, str]] = BatchSolver.findInputs(self.directory.name)      # Inputs of the directory.
+
+        # The pool gives the same results, in the same order.
+        for numberOfWorkers in (1, 2):
+            with self.subTest(numberOfWorkers=numberOfWorkers):
+                self.assertEqual([(path.join(self.directory.name, name), part1, part2) for name, (_, part1, part2) in INPUTS.items()],
+                                 [(result["input"], result["part1"], result["part2"]) for result in BatchSolver.solveAll(inputs, numberOfWorkers)])
+
+    def test_results_written(self) -> None:
+        results: list[dict[str, int | str | float]] = BatchSolver.solveAll(BatchSolver.findInputs(self.directory.name, [2]))
+        output: StringIO = StringIO()       # Results written by BatchSolver.
+
+        BatchSolver.writeResults(results, output, "json")
+        self.assertEqual(results, loads(output.getvalue()))
+
+        output = StringIO()
+        BatchSolver.writeResults(results, output, "csv")
+        self.assertEqual([{"day": "2", "part1": "101", "part2": "48"}],
+                         [{field: row[field] for field in ("day", "part1", "part2")} for row in DictReader(StringIO(output.getvalue()))])
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+from Benchmark import Benchmark
+from InputBundle import InputBundle
+from ReadFile import ReadFile
+from json import load
+from os import path
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+
+class TestBenchmark(TestCase):
+    """
+    Tests of the measures, history and baseline of Benchmark, with files in a temporary directory.
+    """
+
+    def setUp(self) -> None:
+        self.directory: TemporaryDirectory = TemporaryDirectory()     # Directory of the bundle and of the JSON files, removed after the test.
+
+        # The routes of day 9 go through 3 cities.
+        InputBundle.write(path.join(self.directory.name, "inputs.bin"), {1: b"(()))", 9: b"A to B = 1\nA to C = 2\nB to C = 3\n"})
+        ReadFile.useInputBundle(path.join(self.directory.name, "inputs.bin"))
+
+    def tearDown(self) -> None:
+        ReadFile.useInputBundle(None)
+        self.directory.cleanup()
+
+    def test_measures(self) -> None:
+        results: dict[str, dict[str, int | str | float]] = Benchmark.runAll([1, 9], 1, 3, isSearchEffortCounted=True)
+
+        self.assertEqual(["day_01_part_1", "day_01_part_2", "day_09_part_1", "day_09_part_2"], list(results))
+        self.assertEqual((-1, 5, 3, 5), tuple(measures["solution"] for measures in results.values()))
+        self.assertLessEqual(results["day_01_part_1"]["min"], results["day_01_part_1"]["median"])
+        self.assertNotIn("nodesExpanded", results["day_01_part_1"])
+        self.assertEqual(9, results["day_09_part_2"]["nodesExpanded"])
+
+    def test_history_appended(self) -> None:
+        historyFile: str = path.join(self.directory.name, "history.json")      # History written by the test.
+
+        Benchmark.appendToHistory({"day_01_part_1": {"solution": -1, "median": 0.1}}, historyFile, 3)
+        Benchmark.appendToHistory({"day_01_part_2": {"solution": 5, "median": 0.2}}, historyFile, 5)
+        with open(historyFile, 'r') as file:
+            self.assertEqual([3, 5], [run["repetitions"] for run in load(file)])
+
+    def test_baseline_merged(self) -> None:
+        baselineFile: str = path.join(self.directory.name, "baseline.json")    # Baseline written by the test.
+
+        Benchmark.updateBaseline({"day_01_part_1": {"solution": -1, "median": 0.1}, "day_01_part_2": {"solution": 5, "median": 0.2}}, baselineFile)
+        Benchmark.updateBaseline({"day_01_part_2": {"solution": 5, "median": 0.3}}, baselineFile)
+        with open(baselineFile, 'r') as file:
+            self.assertEqual({"day_01_part_1": 0.1, "day_01_part_2": 0.3}, {name: measures["median"] for name, measures in load(file).items()})
+
+    def test_regressions(self) -> None:
+        baseline: dict[str, dict[str, int | str | float]] = {"day_01_part_1": {"solution": -1, "median": 0.1, "nodesExpanded": 10},
+                                                             "day_01_part_2": {"solution": 5, "median": 0.1}}
+
+        self.assertEqual([], Benchmark.compareToBaseline({"day_01_part_1": {"solution": -1, "median": 0.105, "nodesExpanded": 10}}, baseline, 0.1))
+        self.assertEqual(3, len(Benchmark.compareToBaseline({"day_01_part_1": {"solution": 0, "median": 0.2, "nodesExpanded": 20}}, baseline, 0.1)))
+        self.assertEqual([], Benchmark.compareToBaseline({"day_02_part_1": {"solution": 0, "median": 0.2}}, baseline, 0.1))
+
+if __name__ == "__main__":
+    main()
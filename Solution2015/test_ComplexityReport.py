@@ -0,0 +1,47 @@
+from ComplexityReport import ComplexityReport
+from unittest import TestCase, main
+
+class TestComplexityReport(TestCase):
+    """
+    Tests of the growth fitted by ComplexityReport, on known measures and on small series of inputs.
+    """
+
+    def test_exponent_fitted(self) -> None:
+        self.assertAlmostEqual(2, ComplexityReport.fitExponent([1, 2, 4, 8], [3 * size ** 2 for size in [1, 2, 4, 8]]))
+        self.assertAlmostEqual(1, ComplexityReport.fitExponent([0.25, 0.5, 1], [0.5, 1, 2]))
+        self.assertAlmostEqual(0, ComplexityReport.fitExponent([1, 2, 4], [7, 7, 7]))
+
+    def test_exponent_without_enough_points(self) -> None:
+        self.assertIsNone(ComplexityReport.fitExponent([1], [1]))
+        self.assertIsNone(ComplexityReport.fitExponent([1, 1], [1, 2]))
+        # Values that are not positive (memory not traced...) are ignored.
+        self.assertIsNone(ComplexityReport.fitExponent([1, 2, 4], [0, 0, 5]))
+        self.assertAlmostEqual(3, ComplexityReport.fitExponent([1, 2, 4], [0, 8, 64]))
+
+    def test_input_truncated(self) -> None:
+        self.assertEqual("a\nb\n", ComplexityReport.truncateInput("a\nb\nc\nd\n", 0.5))
+        self.assertEqual("a\n", ComplexityReport.truncateInput("a\nb\nc\nd\n", 0.01))
+        # An input of one line is truncated by characters, without its line ending.
+        self.assertEqual("((((", ComplexityReport.truncateInput("(((((((()\n", 0.5))
+
+    def test_series_sorted(self) -> None:
+        self.assertEqual([0.5, 1, 2], [size for size, _ in ComplexityReport.getInputSeries(9, True, [2, 0.5, 1])])
+
+    def test_solution_analysed(self) -> None:
+        analysis: dict[str, float | bool | str | list[dict[str, float | int | str]] | None] = ComplexityReport.analyseSolution(1, True, [(0.5, "(()"), (1, "(()((("), (2, "(()(((" * 2)], 60)
+
+        self.assertEqual([1, 4, 8], [point["solution"] for point in analysis["points"]])
+        self.assertTrue(all(0 < point["peakMemory"] for point in analysis["points"]))
+        self.assertIsNone(analysis["stoppedAt"])
+
+    def test_series_stopped(self) -> None:
+        # The second circuit never gives a value to wire a.
+        analysis: dict[str, float | bool | str | list[dict[str, float | int | str]] | None] = ComplexityReport.analyseSolution(7, True, [(1, "3 -> b\nb -> a\n"), (2, "3 -> b\nc -> a\na -> c\n"), (4, "3 -> a\n")], 0.5)
+        self.assertEqual([3], [point["solution"] for point in analysis["points"]])
+        self.assertEqual("time limit at size 2", analysis["stoppedAt"])
+
+        analysis = ComplexityReport.analyseSolution(2, True, [(1, "2x3x4\n"), (2, "2x3\n")], 60)
+        self.assertEqual("error at size 2", analysis["stoppedAt"])
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+from Year2015_Solution import Year2015_Solution
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase, main
+
+INPUTS: list[tuple[int, str]] = [
+    (9, "A to B = 1\nA to C = 2\nB to C = 3\n"),
+    (9, "London to Dublin = 464\nLondon to Belfast = 518\nDublin to Belfast = 141\n"),
+    (17, "100\n50\n150\n50\n"),
+    (17, "150\n150\n20\n130\n"),
+    (24, "1\n2\n3\n4\n5\n7\n8\n9\n10\n11\n"),
+    (24, "1\n2\n3\n4\n5\n6\n7\n8\n"),
+]                                                               # Different inputs of the same days, solved at the same time.
+
+class TestConcurrentSolutions(TestCase):
+    """
+    Tests of the solutions computed at the same time in several threads, each one with its own input.
+    """
+
+    def test_same_solutions_as_sequential(self) -> None:
+        tasks: list[tuple[int, bool, str]] = [(day, isFirstPart, content) for day, content in INPUTS for isFirstPart in (True, False)] * 4
+        expectedSolutions: list[int | str] = [Year2015_Solution.getSolution(day, isFirstPart, isCacheUsed=False, inputSource=content)
+                                              for day, isFirstPart, content in tasks]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            solutions: list[int | str] = list(executor.map(lambda task: Year2015_Solution.getSolution(task[0], task[1], isCacheUsed=False, inputSource=task[2]),
+                                                           tasks))
+
+        self.assertEqual(expectedSolutions, solutions)
+        # The inputs of a same day give different solutions, so a state shared between the threads would be seen.
+        self.assertNotEqual(expectedSolutions[0], expectedSolutions[2])
+
+if __name__ == "__main__":
+    main()
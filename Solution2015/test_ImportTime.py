@@ -0,0 +1,28 @@
+from Benchmark import Benchmark
+from os import path
+from subprocess import run
+from sys import executable
+from unittest import TestCase, main
+
+class TestImportTime(TestCase):
+    """
+    Tests of the modules imported with the solutions, each import being done in a new interpreter.
+    """
+
+    def test_heavy_modules_not_imported(self) -> None:
+        # These modules are only imported by the days or the options that use them.
+        importedModules: str = run([executable, "-c", "import sys, SolutionRunner; print(' '.join(sys.modules))"],
+                                   capture_output=True, text=True, check=True, cwd=path.dirname(path.abspath(__file__))).stdout
+        for nameOfModule in ("numpy", "hashlib", "json", "concurrent.futures", "multiprocessing", "tracemalloc", "cProfile"):
+            with self.subTest(nameOfModule=nameOfModule):
+                self.assertNotIn(nameOfModule, importedModules.split())
+
+    def test_import_time_measured(self) -> None:
+        importTimes: list[tuple[str, int, int]] = Benchmark.measureImportTime("SolutionRunner")
+
+        self.assertIn("Year2015_Solution", [nameOfModule for nameOfModule, _, _ in importTimes])
+        self.assertEqual(sorted((cumulativeTime for _, _, cumulativeTime in importTimes), reverse=True),
+                         [cumulativeTime for _, _, cumulativeTime in importTimes])
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+from InputBundle import InputBundle
+from ReadFile import ReadFile
+from os import path
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+
+class TestInputBundle(TestCase):
+    """
+    Tests of the bundles written and read by InputBundle, in a temporary directory.
+    """
+
+    def setUp(self) -> None:
+        self.directory: TemporaryDirectory = TemporaryDirectory()                 # Directory of the bundles, removed after the test.
+        self.pathOfBundle: str = path.join(self.directory.name, "inputs.bin")      # Bundle written by the tests.
+
+    def tearDown(self) -> None:
+        ReadFile.useInputBundle(None)
+        self.directory.cleanup()
+
+    def test_inputs_indexed(self) -> None:
+        InputBundle.write(self.pathOfBundle, {9: b"A to B = 1\n", 1: b"(()))", 2: b""})
+        bundle: InputBundle = InputBundle(self.pathOfBundle)
+
+        self.assertEqual([1, 2, 9], sorted(bundle.index))
+        self.assertIn(9, bundle)
+        self.assertNotIn(3, bundle)
+        self.assertEqual(b"(()))", bytes(bundle.getContent(1)))
+        self.assertEqual(b"", bytes(bundle.getContent(2)))
+        self.assertEqual(b"A to B = 1\n", bytes(bundle.getContent(9)))
+        with self.assertRaises(KeyError):
+            bundle.getContent(3)
+        bundle.close()
+
+    def test_corrupted_input_found(self) -> None:
+        InputBundle.write(self.pathOfBundle, {1: b"(()))", 2: b"2x3x4\n"})
+        bundle: InputBundle = InputBundle(self.pathOfBundle)
+        self.assertEqual([], bundle.verify())
+        bundle.close()
+
+        # The last byte of the file belongs to the input of day 2.
+        with open(self.pathOfBundle, 'r+b') as file:
+            file.seek(-1, 2)
+            file.write(b"\r")
+        bundle = InputBundle(self.pathOfBundle)
+        self.assertEqual([2], bundle.verify())
+        bundle.close()
+
+    def test_modification_detected(self) -> None:
+        InputBundle.write(self.pathOfBundle, {1: b"(()))"})
+        bundle: InputBundle = InputBundle(self.pathOfBundle)
+        self.assertFalse(bundle.isModified())
+
+        InputBundle.write(self.pathOfBundle, {1: b"((("})
+        self.assertTrue(bundle.isModified())
+        bundle.close()
+
+    def test_invalid_files(self) -> None:
+        with open(self.pathOfBundle, 'wb') as file:
+            file.write(b"(()))")
+        with self.assertRaises(ValueError):
+            InputBundle(self.pathOfBundle)
+
+        # The index of a truncated bundle points outside of the file.
+        InputBundle.write(self.pathOfBundle, {1: b"(()))"})
+        with open(self.pathOfBundle, 'r+b') as file:
+            file.truncate(path.getsize(self.pathOfBundle) - 1)
+        with self.assertRaises(ValueError):
+            InputBundle(self.pathOfBundle)
+
+    def test_directory_packed(self) -> None:
+        for day, content in ((1, "(()))"), (3, "^>v<")):
+            with open(path.join(self.directory.name, f"{day:02d}.txt"), 'w') as file:
+                file.write(content)
+
+        self.assertEqual([1, 3], InputBundle.writeDirectory(self.directory.name, self.pathOfBundle))
+
+        # The inputs of the bundle are read instead of the files of "textfiles", for the days it contains.
+        ReadFile.useInputBundle(self.pathOfBundle)
+        self.assertEqual("^>v<", ReadFile.getText(3))
+        self.assertEqual(self.pathOfBundle, ReadFile.getNameOfFile(1))
+        self.assertNotEqual(self.pathOfBundle, ReadFile.getNameOfFile(2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+from InputGenerator import InputGenerator
+from Year2015_Solution import Year2015_Solution
+from os import listdir
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+
+class TestInputGenerator(TestCase):
+    """
+    Tests of the validity of the inputs generated by InputGenerator, at small scales.
+    """
+
+    @staticmethod
+    def fillGroups(weights: list[int], spaceLeft: list[int], index: int = 0) -> bool:
+        """
+        Function used to check that weights can be put in groups, by putting them one by one in every group where they fit.
+
+        Args:
+            weights (list[int]): Weights to put in the groups, from the heaviest.
+            spaceLeft (list[int]): Weight that can still be put in each group.
+            index (int): Index of the next weight to put in a group.
+
+        Returns:
+            True if every weight from index can be put in a group.
+        """
+        if index == len(weights):
+            return True
+
+        # Groups with the same space left give the same choice, only one of them is tried.
+        for group in {space: group for group, space in enumerate(spaceLeft)}.values():
+            if weights[index] <= spaceLeft[group]:
+                spaceLeft[group] -= weights[index]
+                if TestInputGenerator.fillGroups(weights, spaceLeft, index + 1):
+                    return True
+                spaceLeft[group] += weights[index]
+
+        return False
+
+    @staticmethod
+    def canSplit(weights: list[int], numberOfGroups: int) -> bool:
+        """
+        Function used to check that weights can be split in groups of the same weight.
+
+        Args:
+            weights (list[int]): Weights to split.
+            numberOfGroups (int): Number of groups.
+
+        Returns:
+            True if the weights can be split in numberOfGroups groups of the same weight.
+        """
+        return (0 == sum(weights) % numberOfGroups
+                and TestInputGenerator.fillGroups(sorted(weights, reverse=True), [sum(weights) // numberOfGroups] * numberOfGroups))
+
+    def test_same_seed_same_input(self) -> None:
+        for day in range(1, 26):
+            with self.subTest(day=day):
+                self.assertEqual(InputGenerator.generateInput(day, 0.1, 3), InputGenerator.generateInput(day, 0.1, 3))
+        self.assertNotEqual(InputGenerator.generateInput(9, 1, 3), InputGenerator.generateInput(9, 1, 4))
+
+    def test_scaled_sizes(self) -> None:
+        self.assertEqual(10 * len(InputGenerator.generateInput(1, 1)), len(InputGenerator.generateInput(1, 10)))
+        self.assertEqual(45, len(InputGenerator.generateInput(9, 10 / 8).splitlines()))
+
+    def test_circuit_of_day_07(self) -> None:
+        for scale in (0.01, 0.1, 1):
+            with self.subTest(scale=scale):
+                inputsOfWires: dict[str, list[str]] = {}        # Inputs of the gate of each wire.
+                for line in InputGenerator.generateInput(7, scale).splitlines():
+                    gate, output = line.split(" -> ")
+                    self.assertNotIn(output, inputsOfWires)
+                    inputsOfWires[output] = [word for word in gate.split() if word.islower()]
+
+                # "a" depends on every wire, "b" included.
+                wiresReached: set[str] = set()                  # Wires "a" depends on.
+                wiresToVisit: list[str] = ["a"]                 # Wires whose inputs are not visited yet.
+                while wiresToVisit:
+                    wire: str = wiresToVisit.pop()
+                    if wire not in wiresReached:
+                        wiresReached.add(wire)
+                        wiresToVisit.extend(inputsOfWires[wire])
+                self.assertIn("b", wiresReached)
+                self.assertEqual(set(inputsOfWires), wiresReached)
+
+                for solution in Year2015_Solution.getSolutions(7, False, InputGenerator.generateInput(7, scale)):
+                    self.assertTrue(0 <= solution < 65536)
+
+    def test_packages_of_day_24(self) -> None:
+        for seed in range(3):
+            with self.subTest(seed=seed):
+                weights: list[int] = [int(line) for line in InputGenerator.generateInput(24, 0, seed).splitlines()]
+
+                self.assertEqual(24, len(weights))
+                self.assertEqual(len(weights), len(set(weights)))
+                self.assertTrue(self.canSplit(weights, 3))
+                self.assertTrue(self.canSplit(weights, 4))
+
+        # The check finds the weights that cannot be split.
+        self.assertFalse(self.canSplit([5, 1, 3, 3], 3))
+
+    def test_inputs_solved(self) -> None:
+        # The days whose inputs are long to solve, even small, are left out.
+        for day in (1, 2, 3, 5, 7, 8, 9, 12, 13, 14, 15, 16, 17, 21, 23):
+            with self.subTest(day=day):
+                for solution in Year2015_Solution.getSolutions(day, False, InputGenerator.generateInput(day, 0.1)):
+                    self.assertIsInstance(solution, int)
+
+        # The passwords keep their length.
+        for solution in Year2015_Solution.getSolutions(11, False, InputGenerator.generateInput(11)):
+            self.assertEqual(8, len(solution))
+
+    def test_inputs_written(self) -> None:
+        with TemporaryDirectory() as directory:
+            self.assertEqual(2, len(InputGenerator.writeInputs(directory, 0.1, 0, [1, 9])))
+            self.assertEqual(["01.txt", "09.txt"], sorted(listdir(directory)))
+
+if __name__ == "__main__":
+    main()
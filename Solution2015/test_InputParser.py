@@ -0,0 +1,53 @@
+from AuntSue import AuntSue
+from InputParser import InputParser
+from ReadFile import ReadFile
+from unittest import TestCase, main
+
+class TestInputParser(TestCase):
+    """
+    Tests of the records parsed by InputParser, from small inputs with empty lines and "\\r\\n".
+    """
+
+    def test_day_06(self) -> None:
+        with ReadFile.useInputSource(6, "turn on 0,0 through 999,999\r\ntoggle 0,0 through 999,0\n\nturn off 499,499 through 500,500"):
+            self.assertEqual([("turn on", 0, 0, 999, 999), ("toggle", 0, 0, 999, 0), ("turn off", 499, 499, 500, 500)], list(InputParser.parseDay06()))
+
+    def test_day_07(self) -> None:
+        with ReadFile.useInputSource(7, "123 -> x\nx AND y -> d\nx LSHIFT 2 -> f\nNOT y -> i\n1 OR x -> e\n\n"):
+            self.assertEqual(["CircuitOperation(left='123', operator='EQUAL', right='', output='x')",
+                              "CircuitOperation(left='x', operator='AND', right='y', output='d')",
+                              "CircuitOperation(left='x', operator='LSHIFT', right='2', output='f')",
+                              "CircuitOperation(left='y', operator='NOT', right='', output='i')",
+                              "CircuitOperation(left='1', operator='OR', right='x', output='e')"],
+                             [repr(operation) for operation in InputParser.parseDay07()])
+
+    def test_day_09(self) -> None:
+        with ReadFile.useInputSource(9, "London to Dublin = 464\r\n\r\nDublin to Belfast = 141\r\n"):
+            self.assertEqual([("London", "Dublin", 464), ("Dublin", "Belfast", 141)], InputParser.parseDay09())
+
+    def test_day_13(self) -> None:
+        with ReadFile.useInputSource(13, "Alice would gain 54 happiness units by sitting next to Bob.\nBob would lose 7 happiness units by sitting next to Alice.\n"):
+            self.assertEqual([("Alice", "Bob", 54), ("Bob", "Alice", -7)], InputParser.parseDay13())
+
+    def test_day_14(self) -> None:
+        with ReadFile.useInputSource(14, "Comet can fly 14 km/s for 10 seconds, but then must rest for 127 seconds.\n\n"):
+            self.assertEqual(["Reindeer(speed=14, flightTime=10, restTime=127)"], [repr(reindeer) for reindeer in InputParser.parseDay14()])
+
+    def test_day_15(self) -> None:
+        with ReadFile.useInputSource(15, "Butterscotch: capacity -1, durability -2, flavor 6, texture 3, calories 8\n\n"):
+            self.assertEqual(["Ingredient(capacity=-1, durability=-2, flavor=6, texture=3, calories=8)"],
+                             [repr(ingredient) for ingredient in InputParser.parseDay15()])
+
+    def test_day_16(self) -> None:
+        with ReadFile.useInputSource(16, "Sue 1: goldfish: 6, trees: 9, akitas: 0\nSue 2: cars: 10, children: 1, perfumes: 4\n"):
+            auntsSue: list[AuntSue] = list(InputParser.parseDay16())
+            self.assertEqual([[("akitas", 0), ("goldfish", 6), ("trees", 9)], [("children", 1), ("cars", 10), ("perfumes", 4)]],
+                             [list(auntSue.items()) for auntSue in auntsSue])
+            self.assertIsNone(auntsSue[0].cats)
+
+    def test_day_23(self) -> None:
+        with ReadFile.useInputSource(23, "inc a\njio a, +2\ntpl a\njmp -7\nhlf b\n"):
+            self.assertEqual([("inc", "a", 0), ("jio", "a", 2), ("tpl", "a", 0), ("jmp", "", -7), ("hlf", "b", 0)], InputParser.parseDay23())
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+from InputBundle import InputBundle
+from MapReduce import MapReduce
+from ReadFile import ReadFile
+from Year2015_Solution import Year2015_Solution
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+
+INPUTS: dict[int, bytes] = {
+    2: b"2x3x4\r\n1x1x10\n3x3x3\n10x2x5\n",
+    5: b"ugknbfddgicrmopn\naaa\njchzalrnumimnmhp\r\nqjhvhtzxzqqjkmpb\nxxyxx\nuurcxstgmygtbstg\nieodomkazucvgmuy\n",
+    8: b'""\n"abc"\n"aaa\\"aaa"\n"\\x27"\n"\\\\"',
+}                                                               # Small inputs of the days solved in map-reduce.
+
+class TestMapReduce(TestCase):
+    """
+    Tests of the solutions computed in map-reduce by MapReduce, from inputs given directly, from files and from a bundle.
+    """
+
+    def setUp(self) -> None:
+        self.directory: TemporaryDirectory = TemporaryDirectory()     # Directory of the inputs, removed after the test.
+
+    def tearDown(self) -> None:
+        ReadFile.useInputBundle(None)
+        self.directory.cleanup()
+
+    def assertSameSolutions(self, day: int, content: bytes) -> None:
+        """
+        Function used to check that both parts of a day in map-reduce give the solutions of Year2015_Solution, with the input of the day already given to ReadFile.
+
+        Args:
+            day (int): Day of the input.
+            content (bytes): Content of the input.
+        """
+        for isFirstPart in (True, False):
+            expectedSolution: int | str = Year2015_Solution.getSolution(day, isFirstPart, isCacheUsed=False, inputSource=content)
+            # Chunks of a few bytes are spread over several processes, the largest ones are solved in the current process.
+            for numberOfWorkers, chunkSize in ((1, 1), (2, 8), (2, 1024)):
+                with self.subTest(day=day, isFirstPart=isFirstPart, numberOfWorkers=numberOfWorkers, chunkSize=chunkSize):
+                    self.assertEqual(expectedSolution, MapReduce.solve(day, isFirstPart, numberOfWorkers, chunkSize))
+
+    def test_input_given_directly(self) -> None:
+        for day, content in INPUTS.items():
+            with ReadFile.useInputSource(day, content):
+                self.assertSameSolutions(day, content)
+
+    def test_input_of_file(self) -> None:
+        for day, content in INPUTS.items():
+            Path(self.directory.name, f"{day:02d}.txt").write_bytes(content)
+            with ReadFile.useInputSource(day, Path(self.directory.name, f"{day:02d}.txt")):
+                self.assertSameSolutions(day, content)
+
+    def test_input_of_bundle(self) -> None:
+        # The inputs do not start at the beginning of the bundle.
+        InputBundle.write(str(Path(self.directory.name, "inputs.bin")), INPUTS)
+        ReadFile.useInputBundle(Path(self.directory.name, "inputs.bin"))
+        for day, content in INPUTS.items():
+            self.assertSameSolutions(day, content)
+
+    def test_chunks_end_with_lines(self) -> None:
+        content: bytes = b"ab\ncdef\n\ng\nhij"      # Content split in chunks.
+
+        for chunkSize in (1, 2, 4, 100):
+            with self.subTest(chunkSize=chunkSize):
+                chunks: list[tuple[int, int]] = MapReduce.splitIntoChunks(content, 1, len(content), chunkSize)
+                self.assertEqual(1, chunks[0][0])
+                self.assertEqual(len(content), chunks[-1][1])
+                for (_, end), (start, _) in zip(chunks, chunks[1:]):
+                    self.assertEqual(end, start)
+                    self.assertEqual(b"\n", content[end - 1:end])
+
+    def test_unsupported_day(self) -> None:
+        self.assertFalse(MapReduce.isSupported(9, True))
+        with self.assertRaises(KeyError):
+            MapReduce.solve(9, True)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+from MemoryTracer import MemoryTracer
+from os import path
+from tempfile import TemporaryDirectory
+from tracemalloc import is_tracing
+from unittest import TestCase, main
+
+def allocate() -> int:
+    """
+    Function traced by the tests, which allocates 1 MiB and frees it.
+
+    Returns:
+        Number of bytes allocated.
+    """
+    return len(bytearray(1024 * 1024))
+
+def fail() -> int:
+    """
+    Function traced by the tests, which raises an error.
+    """
+    raise ValueError("The solution failed.")
+
+class TestMemoryTracer(TestCase):
+    """
+    Tests of the memory measured by MemoryTracer.
+    """
+
+    def test_peak_of_allocation(self) -> None:
+        solution, memory, _ = MemoryTracer.measureCall(allocate)
+        self.assertEqual(1024 * 1024, solution)
+        self.assertGreaterEqual(memory["peak"], 1024 * 1024)
+        self.assertLess(memory["retained"], 1024 * 1024)
+        self.assertFalse(is_tracing())
+
+    def test_tracing_stopped_after_error(self) -> None:
+        with self.assertRaises(ValueError):
+            MemoryTracer.measureCall(fail)
+        self.assertFalse(is_tracing())
+
+    def test_report_written(self) -> None:
+        with TemporaryDirectory() as memoryReportDirectory:
+            self.assertEqual(1024 * 1024, MemoryTracer.traceCall(allocate, 4, False, memoryReportDirectory))
+            with open(path.join(memoryReportDirectory, "day_04_part_2.txt"), 'r') as file:
+                self.assertEqual("Day 04 part 2", file.readline().strip())
+                self.assertTrue(file.readline().startswith("Peak memory: "))
+
+if __name__ == "__main__":
+    main()
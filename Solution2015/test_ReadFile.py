@@ -0,0 +1,97 @@
+from ReadFile import ReadFile
+from contextlib import redirect_stdout
+from io import StringIO
+from os import path
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+
+class TestReadFile(TestCase):
+    """
+    Tests of the inputs read by ReadFile, from files written in a temporary directory.
+    """
+
+    def setUp(self) -> None:
+        self.directory: TemporaryDirectory = TemporaryDirectory()     # Directory of the inputs, removed after the test.
+
+    def tearDown(self) -> None:
+        ReadFile.invalidateCache()
+        self.directory.cleanup()
+
+    def writeInput(self, content: bytes) -> Path:
+        """
+        Function used to write an input in the temporary directory.
+
+        Args:
+            content (bytes): Content of the input.
+
+        Returns:
+            Path of the input.
+        """
+        pathOfInput: Path = Path(self.directory.name, "input.txt")
+        pathOfInput.write_bytes(content)
+        return pathOfInput
+
+    def test_input_read_once_until_invalidated(self) -> None:
+        pathOfInput: Path = self.writeInput(b"first input\n")
+
+        with ReadFile.useInputSource(1, pathOfInput):
+            self.assertIs(ReadFile.getText(1), ReadFile.getText(1))
+
+            # The file is modified, but the content already read is kept until the cache is invalidated.
+            view: memoryview = ReadFile.getMemoryView(1)
+            pathOfInput.write_bytes(b"second, longer input\n")
+            self.assertEqual("first input\n", ReadFile.getLine(1))
+
+            # The mapping is still used by a view, it is released with the view. The file is read again.
+            ReadFile.invalidateCache(1)
+            view.release()
+            self.assertEqual("second, longer input\n", ReadFile.getLine(1))
+            self.assertEqual(b"second, longer input\n", bytes(ReadFile.getMemoryView(1)))
+
+    def test_empty_input(self) -> None:
+        with ReadFile.useInputSource(1, self.writeInput(b"")):
+            self.assertEqual(b"", bytes(ReadFile.getMemoryView(1)))
+            self.assertEqual("", ReadFile.getText(1))
+            self.assertEqual([], list(ReadFile.iterLines(1)))
+
+    def test_iter_lines_normalizes_line_endings(self) -> None:
+        expectedLines: list[str] = ["a\n", "b\n", "c\n", "été\n", "d"]
+        pathOfInput: Path = self.writeInput("a\r\nb\rc\nété\r\nd".encode())
+
+        with ReadFile.useInputSource(1, pathOfInput):
+            # Streamed from the disk.
+            self.assertEqual(expectedLines, list(ReadFile.iterLines(1, 2)))
+
+            # Decoded from the mapping, with "\r\n" and the two bytes of "é" cut between two parts.
+            ReadFile.getMemoryView(1)
+            for bufferSize in (1, 2, 3, 64):
+                self.assertEqual(expectedLines, list(ReadFile.iterLines(1, bufferSize)))
+
+            # Taken from the decoded text.
+            self.assertEqual(expectedLines, ReadFile.getLines(1))
+            self.assertEqual(expectedLines, list(ReadFile.iterLines(1)))
+
+        # Given directly.
+        with ReadFile.useInputSource(1, "a\r\nb\rc\nété\r\nd"):
+            self.assertEqual(expectedLines, list(ReadFile.iterLines(1)))
+
+    def test_iter_lines_of_missing_file(self) -> None:
+        output: StringIO = StringIO()       # Message printed by ReadFile.
+
+        with ReadFile.useInputSource(1, Path(self.directory.name, "missing.txt")), redirect_stdout(output):
+            self.assertEqual([], list(ReadFile.iterLines(1)))
+            self.assertEqual([], ReadFile.getLines(1))
+        self.assertIn("cannot be opened", output.getvalue())
+
+    def test_iter_lines_of_invalid_content(self) -> None:
+        output: StringIO = StringIO()       # Message printed by ReadFile.
+
+        with ReadFile.useInputSource(1, self.writeInput(b"a\n\xff\n")), redirect_stdout(output):
+            # The lines decoded before the error may be given.
+            self.assertIn(list(ReadFile.iterLines(1, 2)), ([], ["a\n"]))
+            self.assertEqual([], ReadFile.getLines(1))
+        self.assertIn("cannot be opened", output.getvalue())
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+from AuntSue import AuntSue
+from CircuitOperation import CircuitOperation
+from Ingredient import Ingredient
+from Reindeer import Reindeer
+from sys import getsizeof
+from unittest import TestCase, main
+
+class TestRecords(TestCase):
+    """
+    Tests of the record classes of the parsed inputs, which keep their fields in slots.
+    """
+
+    def test_fields_in_slots(self) -> None:
+        records: list[object] = [Reindeer(14, 10, 127), Ingredient(-1, -2, 6, 3, 8), AuntSue(cats=7), CircuitOperation("x", "AND", "y", "d")]
+
+        for record in records:
+            with self.subTest(record=type(record).__name__):
+                self.assertFalse(hasattr(record, "__dict__"))
+                with self.assertRaises(AttributeError):
+                    record.unknownField = 0
+                # A record is smaller than the dict it replaces.
+                self.assertLess(getsizeof(record), getsizeof({field: getattr(record, field) for field in type(record).__slots__}))
+
+    def test_fields(self) -> None:
+        reindeer: Reindeer = Reindeer(14, 10, 127)                      # Reindeer of the example of day 14.
+        ingredient: Ingredient = Ingredient(-1, -2, 6, 3, 8)            # Ingredient of the example of day 15.
+        operation: CircuitOperation = CircuitOperation("x", "AND", "y", "d")    # Operation of the example of day 7.
+
+        self.assertEqual((14, 10, 127), (reindeer.speed, reindeer.flightTime, reindeer.restTime))
+        self.assertEqual((-1, -2, 6, 3, 8), (ingredient.capacity, ingredient.durability, ingredient.flavor, ingredient.texture, ingredient.calories))
+        self.assertEqual(("x", "AND", "y", "d"), (operation.left, operation.operator, operation.right, operation.output))
+
+    def test_things_of_aunt_sue(self) -> None:
+        auntSue: AuntSue = AuntSue(trees=3, cats=7)                     # Sue with two things known.
+
+        self.assertEqual([("cats", 7), ("trees", 3)], list(auntSue.items()))
+        self.assertIsNone(auntSue.goldfish)
+        with self.assertRaises(TypeError):
+            AuntSue(dogs=1)
+
+if __name__ == "__main__":
+    main()
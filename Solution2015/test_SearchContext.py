@@ -0,0 +1,65 @@
+from SearchContext import SearchContext
+from Year2015_Solution import Year2015_Solution
+from unittest import TestCase, main
+
+ROUTES: str = "London to Dublin = 464\nLondon to Belfast = 518\nDublin to Belfast = 141\n"     # 3 cities, from the example of day 9.
+CONTAINERS: str = "100\n50\n150\n50\n"                                                          # 4 containers, 3 of their combinations hold 150 litters.
+INGREDIENTS: str = ("Butterscotch: capacity -1, durability -2, flavor 6, texture 3, calories 8\n"  # 2 ingredients, from the example of day 15.
+                    "Cinnamon: capacity 2, durability 3, flavor -2, texture -1, calories 3\n")
+
+class TestSearchContext(TestCase):
+    """
+    Tests of the effort counted by SearchContext, on the searches of small hand-built inputs.
+    """
+
+    def test_effort_not_counted_by_default(self) -> None:
+        self.assertIsNone(SearchContext().effort)
+
+    def test_effort_counted_in_with_statement(self) -> None:
+        with SearchContext.countEffort() as effort:
+            context: SearchContext = SearchContext()
+            context.effort["nodesExpanded"] += 2
+        self.assertEqual(dict(nodesExpanded=2, nodesPruned=0, leavesReached=0, bestUpdates=0), effort)
+        self.assertIsNone(SearchContext().effort)
+
+    def test_day_09_longest_route(self) -> None:
+        with SearchContext.countEffort() as effort:
+            solution: int | str = Year2015_Solution.getSolution(9, False, isCacheUsed=False, inputSource=ROUTES)
+        self.assertEqual(982, solution)
+        # 3 starting cities and 6 routes of 2 cities are expanded, each of the 6 routes ends on a leaf.
+        # The best is improved by London-Dublin-Belfast (605), London-Belfast-Dublin (659) and Dublin-London-Belfast (982).
+        self.assertEqual(dict(nodesExpanded=9, nodesPruned=0, leavesReached=6, bestUpdates=3), effort)
+
+    def test_day_09_shortest_route(self) -> None:
+        with SearchContext.countEffort() as effort:
+            solution: int | str = Year2015_Solution.getSolution(9, True, isCacheUsed=False, inputSource=ROUTES)
+        self.assertEqual(605, solution)
+        # No route of 2 cities is longer than 605, so none is pruned. The first route found is already the shortest.
+        self.assertEqual(dict(nodesExpanded=9, nodesPruned=0, leavesReached=6, bestUpdates=1), effort)
+
+    def test_day_17_combinations(self) -> None:
+        with SearchContext.countEffort() as effort:
+            solution: int | str = Year2015_Solution.getSolution(17, True, isCacheUsed=False, inputSource=CONTAINERS)
+        self.assertEqual(3, solution)
+        # The container of 150 is skipped first: 100 + 50 is found first (2 containers), then 150 alone (1 container).
+        self.assertEqual(3, effort["leavesReached"])
+        self.assertEqual(2, effort["bestUpdates"])
+
+    def test_day_15_parts_enumerate_once(self) -> None:
+        with SearchContext.countEffort() as effortOfFirstPart:
+            Year2015_Solution.getSolution(15, True, isCacheUsed=False, inputSource=INGREDIENTS)
+        with SearchContext.countEffort() as effortOfSecondPart:
+            Year2015_Solution.getSolution(15, False, isCacheUsed=False, inputSource=INGREDIENTS)
+        with SearchContext.countEffort() as effortOfParts:
+            solutions: tuple[int | str, int | str] = Year2015_Solution.getSolutions(15, isCacheUsed=False, inputSource=INGREDIENTS)
+
+        self.assertEqual((62842880, 57600000), solutions)
+        # Only 40 teaspoons of Butterscotch and 60 of Cinnamon make 500 calories.
+        self.assertEqual(1, effortOfSecondPart["bestUpdates"])
+        # Both parts share the cookies enumerated, but each part counts the improvements of its own best score.
+        self.assertEqual(effortOfFirstPart["nodesExpanded"], effortOfParts["nodesExpanded"])
+        self.assertEqual(effortOfFirstPart["leavesReached"], effortOfParts["leavesReached"])
+        self.assertEqual(effortOfFirstPart["bestUpdates"] + effortOfSecondPart["bestUpdates"], effortOfParts["bestUpdates"])
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,22 @@
+from Year2015_Solution import Year2015_Solution
+from os import listdir, path
+from pstats import Stats
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+
+class TestSolutionProfiler(TestCase):
+    """
+    Tests of the profiles written when getSolution is given a directory of profiles.
+    """
+
+    def test_profile_written(self) -> None:
+        with TemporaryDirectory() as profileDirectory:
+            # Santa enters the basement on the fifth instruction.
+            self.assertEqual(5, Year2015_Solution.getSolution(1, False, path.join(profileDirectory, "profiles"), inputSource="(()))"))
+
+            self.assertEqual(["day_01_part_2.prof", "day_01_part_2.txt"], sorted(listdir(path.join(profileDirectory, "profiles"))))
+            self.assertTrue(any("_day_01_Part_2" == function[2]
+                                for function in Stats(path.join(profileDirectory, "profiles", "day_01_part_2.prof")).stats))
+
+if __name__ == "__main__":
+    main()
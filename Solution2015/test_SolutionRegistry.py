@@ -0,0 +1,40 @@
+from Year2015_Solution import Year2015_Solution
+from os import path
+from subprocess import CompletedProcess, run
+from sys import executable
+from unittest import TestCase, main
+
+ROOT_PATH: str = path.dirname(path.dirname(path.abspath(__file__)))    # Directory of the main.py of every year.
+
+class TestSolutionRegistry(TestCase):
+    """
+    Tests of the main.py of every year, run in a new interpreter as it changes the current directory.
+    """
+
+    def test_years_listed_without_import(self) -> None:
+        output: str = run([executable, "-c", "import sys, main; print(main.SolutionRegistry.getAvailableYears(), 'Year2015_Solution' in sys.modules)"],
+                          cwd=ROOT_PATH, capture_output=True, text=True, check=True).stdout
+
+        # The other years are written in other languages.
+        self.assertEqual("[2015] False\n", output)
+
+    def test_only_year_asked_imported(self) -> None:
+        output: str = run([executable, "-c", "import os, sys, main; main.SolutionRegistry.getSolutionClass(2015); "
+                                             "print(sorted(name for name in sys.modules if name.startswith('Year')), os.path.basename(os.getcwd()))"],
+                          cwd=ROOT_PATH, capture_output=True, text=True, check=True).stdout
+
+        self.assertEqual("['Year2015_Solution'] Solution2015\n", output)
+
+    def test_solution_displayed(self) -> None:
+        output: str = run([executable, "main.py", "-y", "2015", "-d", "1", "-p", "1"], cwd=ROOT_PATH, capture_output=True, text=True, check=True).stdout
+
+        self.assertEqual(f"Solution for year 2015, day 01 part 1 is: {Year2015_Solution.getSolution(1, True)}\n", output)
+
+    def test_unavailable_year(self) -> None:
+        process: CompletedProcess = run([executable, "main.py", "-y", "2016", "-d", "1"], cwd=ROOT_PATH, capture_output=True, text=True)
+
+        self.assertEqual(1, process.returncode)
+        self.assertIn("not available in Python", process.stderr)
+
+if __name__ == "__main__":
+    main()
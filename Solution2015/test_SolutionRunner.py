@@ -0,0 +1,49 @@
+from InputBundle import InputBundle
+from LimitExceeded import LimitExceeded
+from ReadFile import ReadFile
+from SolutionRunner import SolutionRunner
+from os import path
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+
+class TestSolutionRunner(TestCase):
+    """
+    Tests of the solutions run by SolutionRunner, on the inputs of a bundle.
+    """
+
+    def setUp(self) -> None:
+        self.directory: TemporaryDirectory = TemporaryDirectory()     # Directory of the bundle, removed after the test.
+
+        # The presents of day 2 need 58 + 43 square feet of paper, and 34 + 14 feet of ribbon.
+        # The wires "a" and "c" of day 7 wait for each other, so the circuit is never solved.
+        InputBundle.write(path.join(self.directory.name, "inputs.bin"), {1: b"(()))", 2: b"2x3x4\n1x1x10\n", 7: b"3 -> b\nc -> a\na -> c\n"})
+        ReadFile.useInputBundle(path.join(self.directory.name, "inputs.bin"))
+
+    def tearDown(self) -> None:
+        ReadFile.useInputBundle(None)
+        self.directory.cleanup()
+
+    def test_solutions_in_order(self) -> None:
+        results = SolutionRunner.runAll(1, [2, 1], isCacheUsed=False, parts=(2, 1), numberOfRepetitions=2)
+        self.assertEqual([(2, True, 101), (2, False, 48), (1, True, -1), (1, False, 5)], [result[:3] for result in results])
+        self.assertTrue(all(2 == len(result[3]) for result in results))
+
+    def test_pool_gives_same_solutions(self) -> None:
+        self.assertEqual([result[:3] for result in SolutionRunner.runAll(1, [1, 2], isCacheUsed=False)],
+                         [result[:3] for result in SolutionRunner.runAll(2, [1, 2], isCacheUsed=False)])
+
+    def test_endless_solution_stopped(self) -> None:
+        results = SolutionRunner.runAll(1, [7, 1], isCacheUsed=False, timeout=0.2, parts=(1,))
+
+        self.assertIsInstance(results[0][2], LimitExceeded)
+        self.assertEqual(("time", 0.2), (results[0][2].reason, results[0][2].limit))
+        self.assertTrue(str(results[0][2]).startswith("Solution for year 2015, day 7, part one was stopped: time limit of 0.2s exceeded"))
+        # The solutions after the stopped one are still computed.
+        self.assertEqual((1, True, -1), results[1][:3])
+
+    def test_arguments_after_days_are_keyword_only(self) -> None:
+        with self.assertRaises(TypeError):
+            SolutionRunner.runAll(1, [1], None, False)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+from LimitError import LimitError
+from LimitExceeded import LimitExceeded
+from SolutionWatchdog import SolutionWatchdog
+from Year2015_Solution import Year2015_Solution
+from unittest import TestCase, main, skipUnless
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+def allocate(numberOfMebibytes: int) -> int:
+    """
+    Function called in the child process, which allocates a known amount of memory.
+
+    Args:
+        numberOfMebibytes (int): Memory to allocate, in MiB.
+
+    Returns:
+        Number of bytes allocated.
+    """
+    return len(bytearray(numberOfMebibytes * 1024 * 1024))
+
+def getSizeOfAddressSpace() -> int:
+    """
+    Function used to get the size of the address space of the current process, inherited by the child processes.
+
+    Returns:
+        Size of the address space, in bytes.
+    """
+    with open("/proc/self/statm", 'r') as file:
+        return int(file.read().split()[0]) * resource.getpagesize()
+
+@skipUnless(resource is not None, "Memory limits need the resource module.")
+class TestSolutionWatchdog(TestCase):
+    """
+    Tests of the functions and solutions computed under limits by SolutionWatchdog.
+    """
+
+    def setUp(self) -> None:
+        try:
+            self.memoryLimit: int = getSizeOfAddressSpace() + 128 * 1024 * 1024     # Leaves 128 MiB to the child.
+        except OSError:
+            self.skipTest("The size of the address space is read from /proc.")
+
+    def test_allocation_under_memory_limit(self) -> None:
+        self.assertEqual(16 * 1024 * 1024, SolutionWatchdog.callWithLimits(allocate, (16,), 60, self.memoryLimit))
+
+    def test_allocation_above_memory_limit(self) -> None:
+        with self.assertRaises(LimitError) as context:
+            SolutionWatchdog.callWithLimits(allocate, (1024,), 60, self.memoryLimit)
+        self.assertEqual("memory", context.exception.reason)
+
+    def test_error_of_function(self) -> None:
+        with self.assertRaises(ChildProcessError):
+            SolutionWatchdog.callWithLimits(allocate, (-1,), 60)
+
+    def test_day_20_under_memory_limit(self) -> None:
+        # House 8 is the first to get 10 * (1 + 2 + 4 + 8) = 150 presents.
+        self.assertEqual(8, Year2015_Solution.getSolution(20, True, isCacheUsed=False, inputSource="150", timeout=60, memoryLimit=self.memoryLimit))
+
+    def test_day_20_above_memory_limit(self) -> None:
+        # One counter per house: 10^8 houses need about 800 MiB.
+        solution: int | str | LimitExceeded = Year2015_Solution.getSolution(20, True, isCacheUsed=False, inputSource="1000000000",
+                                                                            timeout=60, memoryLimit=self.memoryLimit)
+        self.assertIsInstance(solution, LimitExceeded)
+        self.assertEqual("memory", solution.reason)
+
+    def test_time_limit(self) -> None:
+        # Finding a hash starting with six zeros takes seconds.
+        solution: int | str | LimitExceeded = Year2015_Solution.getSolution(4, False, isCacheUsed=False, inputSource="abcdef", timeout=0.2)
+        self.assertIsInstance(solution, LimitExceeded)
+        self.assertEqual("time", solution.reason)
+
+if __name__ == "__main__":
+    main()
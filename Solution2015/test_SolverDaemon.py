@@ -0,0 +1,63 @@
+from InputBundle import InputBundle
+from ReadFile import ReadFile
+from SolverDaemon import SolverDaemon
+from os import path
+from tempfile import TemporaryDirectory
+from threading import Thread
+from unittest import TestCase, main
+
+class TestSolverDaemon(TestCase):
+    """
+    Tests of the requests answered by SolverDaemon, served in a thread on a socket of a temporary directory.
+    """
+
+    def setUp(self) -> None:
+        self.directory: TemporaryDirectory = TemporaryDirectory()                 # Directory of the bundle and of the socket, removed after the test.
+        self.pathOfBundle: str = path.join(self.directory.name, "inputs.bin")      # Bundle of the inputs read by the daemon.
+        self.socketPath: str = path.join(self.directory.name, "daemon.sock")       # Socket the daemon listens to.
+
+        InputBundle.write(self.pathOfBundle, {1: b"(()))"})
+        ReadFile.useInputBundle(self.pathOfBundle)
+
+        # The daemon is ready once its socket exists.
+        self.thread: Thread = Thread(target=SolverDaemon.serve, args=(self.socketPath, False))
+        self.thread.start()
+        while self.thread.is_alive() and not path.exists(self.socketPath):
+            self.thread.join(0.01)
+
+    def tearDown(self) -> None:
+        if self.thread.is_alive():
+            SolverDaemon.query({"command": "stop"}, self.socketPath)
+            self.thread.join()
+        SolverDaemon._solutions.clear()
+        SolverDaemon._signatures.clear()
+        ReadFile.useInputBundle(None)
+        self.directory.cleanup()
+
+    def test_solutions_answered(self) -> None:
+        # Santa ends on floor -1, and enters the basement on the fifth instruction.
+        self.assertEqual(-1, SolverDaemon.query({"year": 2015, "day": 1, "part": 1}, self.socketPath)["solution"])
+        self.assertEqual(5, SolverDaemon.query({"day": 1, "part": 2}, self.socketPath)["solution"])
+        self.assertEqual({(1, True): -1, (1, False): 5}, SolverDaemon._solutions)
+
+    def test_modified_input_solved_again(self) -> None:
+        self.assertEqual(-1, SolverDaemon.query({"day": 1, "part": 1}, self.socketPath)["solution"])
+
+        InputBundle.write(self.pathOfBundle, {1: b"((("})
+        self.assertEqual(3, SolverDaemon.query({"day": 1, "part": 1}, self.socketPath)["solution"])
+
+    def test_invalid_requests(self) -> None:
+        self.assertIn("error", SolverDaemon.query({"year": 2016, "day": 1, "part": 1}, self.socketPath))
+        self.assertIn("error", SolverDaemon.query({"day": 1, "part": 3}, self.socketPath))
+        self.assertIn("error", SolverDaemon.query(["day", 1], self.socketPath))
+
+    def test_stopped(self) -> None:
+        self.assertEqual({"stopped": True}, SolverDaemon.query({"command": "stop"}, self.socketPath))
+        self.thread.join()
+
+        self.assertFalse(path.exists(self.socketPath))
+        with self.assertRaises(OSError):
+            SolverDaemon.query({"day": 1, "part": 1}, self.socketPath)
+
+if __name__ == "__main__":
+    main()
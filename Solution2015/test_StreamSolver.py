@@ -0,0 +1,47 @@
+from StreamSolver import StreamSolver
+from Year2015_Solution import Year2015_Solution
+from io import BytesIO
+from unittest import TestCase, main
+
+INPUTS: dict[int, bytes] = {
+    1: b"(()))\n",
+    2: b"2x3x4\r\n1x1x10\n",
+    3: b"^>v<^^v",
+    5: "ugknbfddgicrmopn\r\naaa\njchzalrnumimnmhp\nqjhvhtzxzqqjkmpb\nxxyxx\nuurcxstgmygtbstg\n".encode(),
+    8: b'""\n"abc"\n"aaa\\"aaa"\n"\\x27"',
+}                                                               # Small inputs of the days solved from a stream.
+
+class TestStreamSolver(TestCase):
+    """
+    Tests of the solutions computed by StreamSolver from streams in memory.
+    """
+
+    def test_same_solutions_as_whole_input(self) -> None:
+        for day, content in INPUTS.items():
+            for isFirstPart in (True, False):
+                expectedSolution: int | str = Year2015_Solution.getSolution(day, isFirstPart, isCacheUsed=False, inputSource=content)
+                # Small chunks cut the lines, the "\r\n" and the escapes.
+                for chunkSize in (1, 2, 3, 64):
+                    with self.subTest(day=day, isFirstPart=isFirstPart, chunkSize=chunkSize):
+                        self.assertEqual(expectedSolution, StreamSolver.solve(day, isFirstPart, BytesIO(content), chunkSize))
+
+    def test_known_solutions(self) -> None:
+        self.assertEqual(-1, StreamSolver.solve(1, True, BytesIO(INPUTS[1]), 2))
+        self.assertEqual(48, StreamSolver.solve(2, False, BytesIO(INPUTS[2]), 2))
+        self.assertEqual(12, StreamSolver.solve(8, True, BytesIO(INPUTS[8]), 2))
+
+    def test_instructions_stop_at_end_of_line(self) -> None:
+        stream: BytesIO = BytesIO(b"^>v<\r\nnot read\n")
+        self.assertEqual("^>v<", "".join(StreamSolver.iterInstructions(stream, 2)))
+        self.assertLess(stream.tell(), len(stream.getvalue()))
+
+    def test_lines_of_stream(self) -> None:
+        self.assertEqual(["a\n", "b\n", "é\n", "c"], list(StreamSolver.iterLines(BytesIO("a\r\nb\ré\nc".encode()), 1)))
+
+    def test_unsupported_day(self) -> None:
+        self.assertFalse(StreamSolver.isSupported(4, True))
+        with self.assertRaises(KeyError):
+            StreamSolver.solve(4, True, BytesIO(b"abcdef"))
+
+if __name__ == "__main__":
+    main()
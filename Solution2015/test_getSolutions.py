@@ -0,0 +1,42 @@
+from Year2015_Solution import Year2015_Solution
+from unittest import TestCase, main
+
+HAPPINESS: str = "\n".join(f"{person} would {'gain' if 0 <= happiness else 'lose'} {abs(happiness)} happiness units by sitting next to {neighbour}."
+                           for person, neighbour, happiness in [("Alice", "Bob", 54), ("Alice", "Carol", -79), ("Alice", "David", -2),
+                                                                ("Bob", "Alice", 83), ("Bob", "Carol", -7), ("Bob", "David", -63),
+                                                                ("Carol", "Alice", -62), ("Carol", "Bob", 60), ("Carol", "David", 55),
+                                                                ("David", "Alice", 46), ("David", "Bob", -7), ("David", "Carol", 41)])
+
+INPUTS: dict[int, tuple[str, tuple[int | str, int | str] | None]] = {
+    7: ("3 -> b\nb LSHIFT 2 -> a\n", None),
+    9: ("London to Dublin = 464\nLondon to Belfast = 518\nDublin to Belfast = 141\n", (605, 982)),
+    11: ("abcdefgh", ("abcdffaa", "abcdffbb")),
+    13: (HAPPINESS, (330, 286)),
+    15: ("Butterscotch: capacity -1, durability -2, flavor 6, texture 3, calories 8\n"
+         "Cinnamon: capacity 2, durability 3, flavor -2, texture -1, calories 3\n", (62842880, 57600000)),
+    17: ("100\n50\n150\n50\n", (3, 1)),
+    18: (".#.#.#\n...##.\n#....#\n..#...\n#.#..#\n####..\n", None),
+    24: ("1\n2\n3\n4\n5\n7\n8\n9\n10\n11\n", (88, 33)),
+}                                                               # Small inputs of the days sharing their work between both parts, and their solutions when known.
+
+class TestGetSolutions(TestCase):
+    """
+    Tests of the solutions of both parts computed at once by getSolutions, on small inputs.
+    """
+
+    def test_same_solutions_as_each_part(self) -> None:
+        for day, (content, solutions) in INPUTS.items():
+            with self.subTest(day=day):
+                self.assertTrue(hasattr(Year2015_Solution, f"_day_{day:02d}_Parts"))
+                self.assertEqual((Year2015_Solution.getSolution(day, True, isCacheUsed=False, inputSource=content),
+                                  Year2015_Solution.getSolution(day, False, isCacheUsed=False, inputSource=content)),
+                                 Year2015_Solution.getSolutions(day, False, content))
+                if solutions is not None:
+                    self.assertEqual(solutions, Year2015_Solution.getSolutions(day, False, content))
+
+    def test_day_without_shared_work(self) -> None:
+        self.assertFalse(hasattr(Year2015_Solution, "_day_01_Parts"))
+        self.assertEqual((-1, 5), Year2015_Solution.getSolutions(1, False, "(()))"))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,26 @@
+from InputBundle import InputBundle
+from json import loads
+from os import path
+from subprocess import run
+from sys import executable
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+
+class TestMain(TestCase):
+    """
+    Tests of the command line of the 2015 solutions, on the inputs of a bundle.
+    """
+
+    def test_selected_and_repeated_solutions(self) -> None:
+        with TemporaryDirectory() as directory:
+            # Santa ends on floor -1, and enters the basement on the fifth instruction.
+            InputBundle.write(path.join(directory, "inputs.bin"), {1: b"(()))"})
+            output: str = run([executable, "main.py", "-d", "1", "-p", "2", "1", "-r", "2", "--bundle", path.join(directory, "inputs.bin"), "--json"],
+                              cwd=path.dirname(path.abspath(__file__)), capture_output=True, text=True, check=True).stdout
+
+        results: list[dict] = loads(output)
+        self.assertEqual([(1, 1, -1), (1, 2, 5)], [(result["day"], result["part"], result["solution"]) for result in results])
+        self.assertTrue(all(2 == len(result["times"]) for result in results))
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,100 @@
-from Solution_2015.Year2015_Solution import Year2015_Solution as Sol_2015
-from Solution_2016.Year2016_Solution import Year2016_Solution as Sol_2016
-from Solution_2017.Year2017_Solution import Year2017_Solution as Sol_2017
-from Solution_2018.Year2018_Solution import Year2018_Solution as Sol_2018
-from Solution_2019.Year2019_Solution import Year2019_Solution as Sol_2019
-from Solution_2020.Year2020_Solution import Year2020_Solution as Sol_2020
-from Solution_2021.Year2021_Solution import Year2021_Solution as Sol_2021
-from Solution_2022.Year2022_Solution import Year2022_Solution as Sol_2022
-from Solution_2023.Year2023_Solution import Year2023_Solution as Sol_2023
+import os
+import sys
+from argparse import ArgumentParser, Namespace
+from importlib import import_module
+from typing import Any
+
+class SolutionRegistry():
+    """
+    Class used to find the solutions of each year. The solution of year 20YY is the class Year20YY_Solution of the
+    module Solution20YY/Year20YY_Solution.py. Only the module of the year asked for is imported, so the time to get
+    a solution does not depend on the number of years solved.
+    """
+
+    ROOT_PATH: str = os.path.dirname(os.path.abspath(__file__))        # Directory containing the directories of each year.
+
+    @staticmethod
+    def getDirectoryOfYear(year: int) -> str:
+        """
+        Function used to get the directory of the solutions of a year.
+
+        Args:
+            year (int): Year of the Advent Of Code.
+
+        Returns:
+            String representing the path of the directory of the year.
+        """
+        return os.path.join(SolutionRegistry.ROOT_PATH, f"Solution{year}")
+
+    @staticmethod
+    def isAvailable(year: int) -> bool:
+        """
+        Function used to know if the solutions of a year are written in Python, and can be run from this file.
+
+        Args:
+            year (int): Year of the Advent Of Code.
+
+        Returns:
+            True if the file Solution20YY/Year20YY_Solution.py exists, False otherwise.
+        """
+        return os.path.isfile(os.path.join(SolutionRegistry.getDirectoryOfYear(year), f"Year{year}_Solution.py"))
+
+    @staticmethod
+    def getAvailableYears() -> list[int]:
+        """
+        Function used to list the years whose solutions can be run from this file. The directories are only listed,
+        none of the solutions is imported.
+
+        Returns:
+            The sorted list of the years available.
+        """
+        years: list[int] = []       # Years whose solutions are written in Python.
+
+        for entry in os.scandir(SolutionRegistry.ROOT_PATH):
+            if entry.is_dir() and entry.name.startswith("Solution") and entry.name[8:].isdigit() and SolutionRegistry.isAvailable(int(entry.name[8:])):
+                years.append(int(entry.name[8:]))
+
+        return sorted(years)
+
+    @staticmethod
+    def getSolutionClass(year: int) -> Any:
+        """
+        Function used to import the class containing the solutions of a year.
+        The solutions read their inputs relative to the current directory, and import their modules without package,
+        so the current directory is changed to the directory of the year, and this directory is added to the path.
+
+        Args:
+            year (int): Year of the Advent Of Code.
+
+        Returns:
+            The class Year20YY_Solution of the year.
+
+        Raises:
+            LookupError: If the solutions of the year are not written in Python.
+        """
+        directoryOfYear: str = SolutionRegistry.getDirectoryOfYear(year)      # Directory containing the solutions of the year.
+
+        if not SolutionRegistry.isAvailable(year):
+            raise LookupError(f"Solution for year {year} is not available in Python. Available years: {SolutionRegistry.getAvailableYears()}.")
+
+        os.chdir(directoryOfYear)
+        if directoryOfYear not in sys.path:
+            sys.path.insert(0, directoryOfYear)
+
+        return getattr(import_module(f"Year{year}_Solution"), f"Year{year}_Solution")
 
 if __name__ == "__main__":
-    print("Code not merged yet into master.")
-    print("See feature/XXX-Code_Year_20YY branches to see the solution that are being coded for each year.")
+    parser: ArgumentParser = ArgumentParser(description="Display the solutions of the Advent Of Code.")
+    parser.add_argument("-y", "--year", type=int, required=True, help="Year of the solutions.")
+    parser.add_argument("-d", "--day", type=int, nargs="+", default=list(range(1, 26)), help="Days of the solutions (all by default).")
+    parser.add_argument("-p", "--part", type=int, choices=[1, 2], nargs="+", default=[1, 2], help="Parts of the solutions (both by default).")
+    arguments: Namespace = parser.parse_args()
+
+    try:
+        solutionClass: Any = SolutionRegistry.getSolutionClass(arguments.year)
+    except LookupError as e:
+        sys.exit(str(e))
+
+    for day in arguments.day:
+        for part in arguments.part:
+            print(f"Solution for year {arguments.year}, day {day:02d} part {part} is: {solutionClass.getSolution(day, 1 == part)}")
@@ -35,7 +35,6 @@ while getopts "hy:" OPT; do
                     echo
                     cd Solution2015 || { echo "Error: Could not change directory to Solution2015"; exit 1; }
                     python3 main.py
-                    rm -rf __pycache__
                     cd ..
                     ;;
                 